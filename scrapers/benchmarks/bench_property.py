@@ -0,0 +1,91 @@
+"""
+Property Pipeline Benchmarks for The Winning Formula Newsletter
+
+Run from scrapers/ (files are named bench_* so the normal test run skips them):
+
+    pytest benchmarks/bench_property.py --benchmark-autosave --benchmark-storage=benchmarks/baselines
+    pytest benchmarks/bench_property.py --bench-sizes 10k,100k,1m
+
+Compare against the last saved run and fail on regressions:
+
+    pytest benchmarks/bench_property.py --benchmark-storage=benchmarks/baselines \\
+        --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Each case also records its tracemalloc peak as extra_info["peak_memory_mb"].
+"""
+
+from pathlib import Path
+
+import pytest
+
+from property24_scraper import Property24Scraper, save_listings
+from suburb_analyzer import SuburbAnalyzer
+from synthetic_listings import SUBURBS, generate_listings
+
+
+def _largest_suburb(data_dir: Path) -> str:
+    return max(SUBURBS, key=lambda s: sum(
+        (data_dir / f"{s}_{kind}.json").stat().st_size
+        for kind in ("rentals", "sales") if (data_dir / f"{s}_{kind}.json").exists()
+    ))
+
+
+def test_load_listings(benchmark, peak_memory, dataset):
+    analyzer = SuburbAnalyzer(dataset)
+    filename = f"{_largest_suburb(dataset)}_sales.json"
+    peak_memory(analyzer.load_listings, filename)
+    listings = benchmark(analyzer.load_listings, filename)
+    assert listings
+
+
+def test_load_all_suburbs(benchmark, peak_memory, dataset):
+    analyzer = SuburbAnalyzer(dataset)
+    peak_memory(analyzer.load_suburb_listings)
+    listings = benchmark.pedantic(analyzer.load_suburb_listings, rounds=3)
+    assert listings
+
+
+def test_analyze_suburb(benchmark, peak_memory, dataset):
+    analyzer = SuburbAnalyzer(dataset)
+    suburb = _largest_suburb(dataset)
+    peak_memory(analyzer.analyze_suburb, suburb)
+    metrics = benchmark.pedantic(analyzer.analyze_suburb, args=(suburb,), rounds=3)
+    assert metrics.gross_yield is not None
+
+
+def test_compare_suburbs(benchmark, peak_memory, dataset):
+    analyzer = SuburbAnalyzer(dataset)
+    suburbs = analyzer.available_suburbs()
+    peak_memory(analyzer.compare_suburbs, suburbs)
+    results = benchmark.pedantic(analyzer.compare_suburbs, args=(suburbs,), rounds=1)
+    assert len(results) == len(suburbs)
+
+
+@pytest.mark.parametrize("n", [10_000, 100_000])
+def test_save_listings(benchmark, peak_memory, tmp_path, n):
+    listings = generate_listings(n, "sale")
+    peak_memory(save_listings, listings, "bench_sales.json", tmp_path)
+    benchmark.pedantic(save_listings, args=(listings, "bench_sales.json", tmp_path), rounds=3)
+
+
+@pytest.fixture(scope="module")
+def listing_texts() -> list[tuple[str, str]]:
+    """(price_text, title + size) pairs as the scraper sees them."""
+    return [
+        (listing.price_text, f"{listing.title} {listing.size_sqm or ''} m²")
+        for listing in generate_listings(10_000, "rent") + generate_listings(10_000, "sale")
+    ]
+
+
+def test_text_parsers(benchmark, peak_memory, listing_texts):
+    scraper = Property24Scraper()
+
+    def parse_all():
+        for price_text, text in listing_texts:
+            scraper._parse_price(price_text)
+            scraper._parse_bedrooms(text)
+            scraper._parse_bathrooms(text)
+            scraper._parse_size(text)
+
+    peak_memory(parse_all)
+    benchmark(parse_all)
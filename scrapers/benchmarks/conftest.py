@@ -0,0 +1,62 @@
+"""
+Shared fixtures for the property pipeline benchmarks.
+"""
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+# The scrapers are flat modules imported by name, as cli.py does
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_listings import write_dataset  # noqa: E402
+
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-sizes",
+        default="10k,100k",
+        help=f"Comma-separated dataset sizes to benchmark ({', '.join(SIZES)}; default: 10k,100k)",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "dataset" in metafunc.fixturenames:
+        sizes = [s.strip() for s in metafunc.config.getoption("--bench-sizes").split(",") if s.strip()]
+        unknown = set(sizes) - set(SIZES)
+        if unknown:
+            raise pytest.UsageError(f"Unknown --bench-sizes: {', '.join(sorted(unknown))}")
+        metafunc.parametrize("dataset", sizes, indirect=True, scope="session")
+
+
+@pytest.fixture(scope="session")
+def dataset(request, tmp_path_factory) -> Path:
+    """Data directory holding a synthetic dataset of the requested size."""
+    data_dir = tmp_path_factory.mktemp(f"listings_{request.param}")
+    write_dataset(data_dir, SIZES[request.param])
+    return data_dir
+
+
+@pytest.fixture
+def peak_memory(benchmark):
+    """
+    Run a callable once under tracemalloc and record its peak allocation in
+    the benchmark's extra_info (kept in the saved JSON).
+    """
+    def measure(func, *args, **kwargs):
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory_mb"] = round(peak / 1024 / 1024, 2)
+        return peak
+
+    return measure
@@ -0,0 +1,132 @@
+"""
+Synthetic Listing Generator for The Winning Formula Newsletter
+Produces realistic PropertyListing data across every suburb in
+Property24Scraper.AREA_CODES so the property pipeline can be benchmarked at
+sizes we have not scraped yet.
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from property24_scraper import Property24Scraper, PropertyListing, save_listings
+
+
+SUBURBS = list(Property24Scraper.AREA_CODES)
+
+PROPERTY_TYPES = ["Apartment", "House", "Townhouse", "Cluster", "Studio"]
+PROPERTY_TYPE_WEIGHTS = [0.45, 0.30, 0.15, 0.05, 0.05]
+
+# Share of listings missing each field, roughly what fast-mode scrapes show
+MISSING_RATES = {
+    "price": 0.03,
+    "bedrooms": 0.08,
+    "bathrooms": 0.10,
+    "parking": 0.25,
+    "size_sqm": 0.15,
+}
+
+
+def _format_price(price: Optional[int], listing_type: str) -> str:
+    if price is None:
+        return "POA"
+    text = "R " + f"{price:,}".replace(",", " ")
+    return text + " per month" if listing_type == "rent" else text
+
+
+def _title(bedrooms: Optional[int], property_type: str, suburb: str, listing_type: str) -> str:
+    where = "to Rent" if listing_type == "rent" else "for Sale"
+    name = suburb.replace("-", " ").title()
+    if bedrooms is None or property_type == "Studio":
+        return f"{property_type} {where} in {name}"
+    return f"{bedrooms} Bedroom {property_type} {where} in {name}"
+
+
+def generate_listings(n: int, listing_type: str, seed: int = 0,
+                      suburbs: Optional[list[str]] = None) -> list[PropertyListing]:
+    """
+    Generate n listings spread unevenly across suburbs.
+
+    Each suburb gets its own rent level and gross yield, bedrooms drive size
+    and price, and fields go missing at MISSING_RATES.
+
+    Args:
+        n: Number of listings
+        listing_type: "rent" or "sale"
+        seed: Random seed (the same seed gives the same suburb price levels
+            for rentals and sales)
+        suburbs: Suburbs to spread listings over (default: all AREA_CODES)
+
+    Returns:
+        List of PropertyListing
+    """
+    suburbs = suburbs or SUBURBS
+    suburb_rng = np.random.default_rng(seed)
+    base_rent = suburb_rng.uniform(8_000, 35_000, len(suburbs))
+    base_yield = suburb_rng.uniform(0.06, 0.10, len(suburbs))
+    share = suburb_rng.dirichlet(np.full(len(suburbs), 2.0))
+
+    rng = np.random.default_rng([seed, 0 if listing_type == "rent" else 1])
+    suburb_idx = rng.choice(len(suburbs), size=n, p=share)
+    type_idx = rng.choice(len(PROPERTY_TYPES), size=n, p=PROPERTY_TYPE_WEIGHTS)
+    studio = type_idx == PROPERTY_TYPES.index("Studio")
+
+    bedrooms = np.where(studio, 0, rng.choice([1, 2, 3, 4, 5], size=n, p=[0.25, 0.35, 0.25, 0.10, 0.05]))
+    bathrooms = np.maximum(1, bedrooms - rng.integers(0, 2, size=n))
+    parking = rng.integers(0, 3, size=n)
+    size_sqm = np.round((28 + 32 * bedrooms) * rng.lognormal(0, 0.25, size=n))
+
+    rent = base_rent[suburb_idx] * (0.55 + 0.3 * bedrooms) * rng.lognormal(0, 0.2, size=n)
+    if listing_type == "rent":
+        price = np.round(rent, -2)
+    else:
+        price = np.round(rent * 12 / base_yield[suburb_idx] * rng.lognormal(0, 0.15, size=n), -4)
+
+    missing = {name: rng.random(n) < rate for name, rate in MISSING_RATES.items()}
+    start = datetime(2026, 1, 1)
+    seconds = np.sort(rng.integers(0, 90 * 86400, size=n))
+    base = "to-rent" if listing_type == "rent" else "for-sale"
+
+    listings = []
+    for i in range(n):
+        suburb = suburbs[suburb_idx[i]]
+        property_type = PROPERTY_TYPES[type_idx[i]]
+        beds = None if missing["bedrooms"][i] else int(bedrooms[i])
+        listing_price = None if missing["price"][i] else int(price[i])
+        listings.append(PropertyListing(
+            url=f"https://www.property24.com/{base}/{suburb}/cape-town/western-cape/"
+                f"{Property24Scraper.AREA_CODES.get(suburb, '0')}/{110_000_000 + i}",
+            price=listing_price,
+            price_text=_format_price(listing_price, listing_type),
+            suburb=suburb,
+            property_type=property_type,
+            bedrooms=beds,
+            bathrooms=None if missing["bathrooms"][i] else int(bathrooms[i]),
+            parking=None if missing["parking"][i] else int(parking[i]),
+            size_sqm=None if missing["size_sqm"][i] else float(size_sqm[i]),
+            title=_title(beds, property_type, suburb, listing_type),
+            listing_type=listing_type,
+            scraped_at=(start + timedelta(seconds=int(seconds[i]))).isoformat(),
+        ))
+    return listings
+
+
+def write_dataset(output_dir: Path, n: int, seed: int = 0) -> dict[str, int]:
+    """
+    Write n listings (half rentals, half sales) as <suburb>_rentals.json /
+    <suburb>_sales.json files, in the same format as the scraper.
+
+    Returns:
+        Listing count per suburb
+    """
+    counts = {}
+    for listing_type, filename in (("rent", "rentals"), ("sale", "sales")):
+        by_suburb: dict[str, list[PropertyListing]] = {}
+        for listing in generate_listings(n // 2, listing_type, seed):
+            by_suburb.setdefault(listing.suburb, []).append(listing)
+        for suburb, listings in by_suburb.items():
+            save_listings(listings, f"{suburb}_{filename}.json", output_dir)
+            counts[suburb] = counts.get(suburb, 0) + len(listings)
+    return counts
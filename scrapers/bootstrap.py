@@ -0,0 +1,78 @@
+"""
+Bootstrap Confidence Intervals for The Winning Formula Newsletter
+With only 10-20 listings per suburb, published medians are noisy. These
+helpers put an interval around them using NumPy resampling matrices.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+# Above this many values the (resamples x n) matrix gets too big to build
+MAX_MATRIX_VALUES = 1000
+
+
+def _bootstrap_medians(values: np.ndarray, resamples: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Medians of `resamples` resamples.
+
+    Small samples are resampled as one (resamples x n) index matrix. For
+    large samples the resample median is drawn directly: it is the empirical
+    quantile at the median of n uniforms, which is Beta(k, n + 1 - k)
+    distributed with k = (n + 1) // 2.
+    """
+    n = len(values)
+    if n <= MAX_MATRIX_VALUES:
+        idx = rng.integers(0, n, size=(resamples, n))
+        return np.median(values[idx], axis=1)
+
+    k = (n + 1) // 2
+    ranks = np.minimum((rng.beta(k, n + 1 - k, resamples) * n).astype(int), n - 1)
+    return np.sort(values)[ranks]
+
+
+def _interval(samples: np.ndarray, confidence: float) -> tuple[float, float]:
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(samples, [tail, 100 - tail])
+    return float(low), float(high)
+
+
+def bootstrap_median_ci(values, resamples: int = 2000, confidence: float = 0.90,
+                        seed: Optional[int] = 0) -> Optional[tuple[float, float]]:
+    """Percentile bootstrap interval for the median, or None with fewer than 2 values."""
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        return None
+    rng = np.random.default_rng(seed)
+    return _interval(_bootstrap_medians(values, resamples, rng), confidence)
+
+
+def bootstrap_yield_cis(rents, prices, resamples: int = 2000, confidence: float = 0.90,
+                        seed: Optional[int] = 0) -> dict:
+    """
+    Intervals for median rent, median price and gross yield.
+
+    Rents and prices are resampled independently; each pair of resampled
+    medians gives one gross yield draw.
+
+    Returns:
+        Dict with median_rent_ci, median_price_ci and gross_yield_ci
+        (each a (low, high) tuple or None)
+    """
+    rents = np.asarray(rents, dtype=float)
+    prices = np.asarray(prices, dtype=float)
+    rng = np.random.default_rng(seed)
+
+    rent_medians = _bootstrap_medians(rents, resamples, rng) if len(rents) >= 2 else None
+    price_medians = _bootstrap_medians(prices, resamples, rng) if len(prices) >= 2 else None
+
+    gross_yield_ci = None
+    if rent_medians is not None and price_medians is not None:
+        gross_yield_ci = _interval(rent_medians * 12 / price_medians * 100, confidence)
+
+    return {
+        "median_rent_ci": _interval(rent_medians, confidence) if rent_medians is not None else None,
+        "median_price_ci": _interval(price_medians, confidence) if price_medians is not None else None,
+        "gross_yield_ci": gross_yield_ci,
+    }
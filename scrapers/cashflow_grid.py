@@ -0,0 +1,173 @@
+"""
+Cash-Flow Grid Engine for The Winning Formula Newsletter
+Evaluates bond repayments, cash flow, break-even rent and cash-on-cash
+return across whole grids of purchase prices, interest rates and deposits
+in one broadcast NumPy computation.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from suburb_analyzer import SuburbAnalyzer, SuburbMetrics
+from yield_scenarios import monthly_bond_repayment
+
+
+DEFAULT_DEPOSITS = [0.10, 0.20, 0.30, 0.50]
+
+
+@dataclass
+class CashflowGrid:
+    """All arrays are indexed [deposit, price, rate]; money is monthly ZAR."""
+    suburb: str
+    monthly_rent: float
+    prices: np.ndarray
+    rates: np.ndarray
+    deposits: np.ndarray
+    repayment: np.ndarray
+    cash_flow: np.ndarray
+    break_even_rent: np.ndarray
+    cash_on_cash: np.ndarray  # annual cash flow / deposit, %
+
+
+def expense_factors(analyzer: SuburbAnalyzer) -> tuple[float, float]:
+    """(share of gross rent kept after vacancy and management, annual costs as share of price)."""
+    rent_kept = (1 - analyzer.VACANCY_RATE) * (1 - analyzer.MANAGEMENT_FEE)
+    property_costs = analyzer.MAINTENANCE_RATE + analyzer.INSURANCE_RATE + analyzer.RATES_ESTIMATE
+    return rent_kept, property_costs
+
+
+def cashflow_grid(
+    metrics: SuburbMetrics,
+    analyzer: Optional[SuburbAnalyzer] = None,
+    prices: Optional[np.ndarray] = None,
+    rates: Optional[np.ndarray] = None,
+    deposits: Optional[list[float]] = None,
+    years: int = 20,
+) -> Optional[CashflowGrid]:
+    """
+    Evaluate financing over a price x rate x deposit grid.
+
+    Args:
+        metrics: SuburbMetrics supplying median rent and price
+        analyzer: Source of the expense ratios (defaults to SuburbAnalyzer())
+        prices: Purchase prices (default: 41 steps from 70% to 130% of median)
+        rates: Annual interest rates (default: 8% to 14% in 0.1pp steps)
+        deposits: Deposit fractions (default: DEFAULT_DEPOSITS)
+        years: Bond term
+
+    Returns:
+        CashflowGrid, or None if the suburb lacks rent or price data
+
+    Raises:
+        ValueError: If a deposit fraction is outside (0, 1]
+    """
+    deposits = np.asarray(deposits or DEFAULT_DEPOSITS, dtype=float)
+    # Cash-on-cash divides by the deposit, so a zero deposit has no return to report
+    bad = deposits[(deposits <= 0) | (deposits > 1) | np.isnan(deposits)]
+    if len(bad):
+        raise ValueError(f"Deposit must be above 0% and at most 100%, got {', '.join(f'{d * 100:g}%' for d in bad)}")
+
+    if not metrics.median_rent or not metrics.median_price:
+        return None
+
+    analyzer = analyzer or SuburbAnalyzer()
+    prices = np.asarray(prices if prices is not None else metrics.median_price * np.linspace(0.7, 1.3, 41), dtype=float)
+    rates = np.asarray(rates if rates is not None else np.linspace(0.08, 0.14, 61), dtype=float)
+
+    d = deposits[:, None, None]
+    p = prices[None, :, None]
+    r = rates[None, None, :]
+
+    rent_kept, property_costs = expense_factors(analyzer)
+    repayment = monthly_bond_repayment(p * (1 - d), r, years)
+    net_income = (metrics.median_rent * 12 * rent_kept - p * property_costs) / 12
+    cash_flow = net_income - repayment
+    break_even_rent = (repayment + p * property_costs / 12) / rent_kept
+    cash_on_cash = cash_flow * 12 / (p * d) * 100
+
+    return CashflowGrid(
+        suburb=metrics.suburb,
+        monthly_rent=metrics.median_rent,
+        prices=prices,
+        rates=rates,
+        deposits=deposits,
+        repayment=repayment,
+        cash_flow=cash_flow,
+        break_even_rent=break_even_rent,
+        cash_on_cash=cash_on_cash,
+    )
+
+
+def rate_path_repayments(principal, rate_path, years: int = 20) -> np.ndarray:
+    """
+    Monthly repayments for a variable-rate bond following an interest rate path.
+
+    The instalment is recalculated on the outstanding balance whenever the
+    rate changes, as South African banks do. Loops over months but is
+    vectorized across every principal at once.
+
+    Args:
+        principal: Loan amounts (any shape)
+        rate_path: Annual rate for each month of the projection
+        years: Bond term
+
+    Returns:
+        Array of shape principal.shape + (len(rate_path),)
+    """
+    balance = np.array(principal, dtype=float)
+    rate_path = np.asarray(rate_path, dtype=float)
+    months = years * 12
+    out = np.empty(balance.shape + (len(rate_path),))
+
+    for month, annual_rate in enumerate(rate_path):
+        remaining = months - month
+        if remaining <= 0:
+            out[..., month:] = 0
+            break
+        payment = monthly_bond_repayment(balance, annual_rate, remaining / 12)
+        out[..., month] = payment
+        balance = balance * (1 + annual_rate / 12) - payment
+
+    return out
+
+
+def format_cashflow_tables(grid: CashflowGrid, deposit: float = 0.10) -> str:
+    """
+    Break-even rent and cash-on-cash tables for the CLI / newsletter.
+
+    The deposit must be on the grid's deposit axis (build the grid with it
+    included, as cmd_cashflow does) so the tables never show a neighbouring
+    deposit instead.
+    """
+    matches = np.flatnonzero(np.isclose(grid.deposits, deposit))
+    if not len(matches):
+        raise ValueError(f"{deposit * 100:g}% deposit is not on the grid's deposit axis")
+    d_idx = int(matches[0])
+    rate_idx = np.linspace(0, len(grid.rates) - 1, 7).round().astype(int)
+    price_idx = np.linspace(0, len(grid.prices) - 1, 5).round().astype(int)
+    median_idx = int(np.abs(grid.prices - np.median(grid.prices)).argmin())
+
+    rate_header = "".join(f"{grid.rates[i]*100:>10.2f}%" for i in rate_idx)
+    lines = [
+        f"CASH FLOW: {grid.suburb.title()} (rent R {grid.monthly_rent:,.0f} /month)",
+        "=" * 50,
+        "",
+        f"BREAK-EVEN RENT ({grid.deposits[d_idx]*100:g}% deposit) - price vs interest rate",
+        f"  {'Price':<14}" + rate_header,
+    ]
+    for pi in price_idx:
+        row = "".join(f"{'R ' + format(grid.break_even_rent[d_idx, pi, ri], ',.0f'):>11}" for ri in rate_idx)
+        lines.append(f"  {'R ' + format(grid.prices[pi], ',.0f'):<14}" + row)
+
+    lines.extend([
+        "",
+        f"CASH-ON-CASH RETURN % (price R {grid.prices[median_idx]:,.0f}) - deposit vs interest rate",
+        f"  {'Deposit':<14}" + rate_header,
+    ])
+    for di, dep in enumerate(grid.deposits):
+        row = "".join(f"{grid.cash_on_cash[di, median_idx, ri]:>11.1f}" for ri in rate_idx)
+        lines.append(f"  {f'{dep*100:g}%':<14}" + row)
+
+    return "\n".join(lines)
@@ -4,20 +4,50 @@ CLI for The Winning Formula property tools.
 
 Usage:
     python cli.py scrape kenilworth --city cape-town --province western-cape
+    python cli.py watch kenilworth claremont --hours 12
     python cli.py analyze kenilworth
+    python cli.py analyze kenilworth --from-store
+    python cli.py analyze kenilworth --scenarios
     python cli.py compare kenilworth claremont rondebosch
+    python cli.py trend kenilworth --months 12
+    python cli.py best-yields --top 20
+    python cli.py region cape-town
+    python cli.py cashflow kenilworth --deposit 20 --rate-path 11.0,10.5,10.25
+    python cli.py matrix kenilworth claremont --min-samples 3
+    python cli.py serve --port 8024
+    python cli.py export-bundle --gzip
 """
 
 import argparse
 import asyncio
 from pathlib import Path
 
+from listing_stats import ListingStatsStore
+from listing_validator import ListingValidator
+from metrics_history import MetricsHistory
+from metrics_service import serve
+from region_rollups import RegionRollups
+from watch import WatchScheduler, run_watch
 from property24_scraper import Property24Scraper, save_listings
 from suburb_analyzer import SuburbAnalyzer
+from data_bundle import DEFAULT_OUTPUT_DIR, export_bundle
+from cashflow_grid import DEFAULT_DEPOSITS, cashflow_grid, expense_factors, format_cashflow_tables, rate_path_repayments
+from yield_scenarios import format_scenarios, simulate_yields
+
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def report_skipped_rows(analyzer: SuburbAnalyzer):
+    """Print and clear the invalid rows the analyzer dropped while loading."""
+    for filename, count in analyzer.skipped_rows.items():
+        print(f"Skipped {count} invalid rows in {filename}")
+    analyzer.skipped_rows.clear()
 
 
 async def cmd_scrape(args):
     """Scrape property listings for a suburb."""
+    validator = ListingValidator(DATA_DIR)
     async with Property24Scraper(headless=not args.show_browser) as scraper:
         print(f"\nScraping {args.suburb}...")
         print(f"  City: {args.city}")
@@ -36,6 +66,7 @@ async def cmd_scrape(args):
                 listing_type="rent",
                 max_listings=args.max_listings
             )
+            rentals = validator.screen(rentals, f"{args.suburb}_rentals")
             if rentals:
                 save_listings(rentals, f"{args.suburb}_rentals.json")
 
@@ -47,6 +78,7 @@ async def cmd_scrape(args):
                 listing_type="sale",
                 max_listings=args.max_listings
             )
+            sales = validator.screen(sales, f"{args.suburb}_sales")
             if sales:
                 save_listings(sales, f"{args.suburb}_sales.json")
         else:
@@ -59,6 +91,7 @@ async def cmd_scrape(args):
                 listing_type="rent",
                 max_pages=args.pages
             )
+            rentals = validator.screen(rentals, f"{args.suburb}_rentals")
             if rentals:
                 save_listings(rentals, f"{args.suburb}_rentals.json")
 
@@ -70,11 +103,19 @@ async def cmd_scrape(args):
                 listing_type="sale",
                 max_pages=args.pages
             )
+            sales = validator.screen(sales, f"{args.suburb}_sales")
             if sales:
                 save_listings(sales, f"{args.suburb}_sales.json")
 
         print(f"\nDone! Found {len(rentals)} rentals and {len(sales)} sales listings.")
 
+        # Update the incremental stats store so analysis doesn't rescan history
+        store = ListingStatsStore(DATA_DIR)
+        added = store.ingest(rentals + sales)
+        store.save()
+        RegionRollups.build(store).save()
+        print(f"Stats store: {added} new listings ingested")
+
         # Show summary if we have price data
         if rentals:
             prices = [r.price for r in rentals if r.price]
@@ -91,10 +132,38 @@ async def cmd_scrape(args):
                 print(f"  Range: R {min(prices):,} - R {max(prices):,}")
 
 
+async def cmd_watch(args):
+    """Re-scrape suburbs on a churn-aware schedule with one browser."""
+    scheduler = WatchScheduler(DATA_DIR, base_interval_hours=args.hours)
+    for suburb in args.suburbs:
+        for listing_type in ("rent", "sale"):
+            scheduler.add(suburb, listing_type, args.city, args.province)
+    scheduler.save()
+
+    print(f"\nWatching {len(scheduler.jobs)} jobs (Ctrl+C to stop)")
+    try:
+        await run_watch(
+            scheduler,
+            headless=not args.show_browser,
+            max_pages=args.pages,
+            detailed=args.detailed,
+            max_listings=args.max_listings,
+            once=args.once,
+        )
+    finally:
+        scheduler.save()
+
+
 def cmd_analyze(args):
     """Analyze scraped data for a suburb."""
-    analyzer = SuburbAnalyzer(data_dir=Path(__file__).parent / "data")
-    metrics = analyzer.analyze_suburb(args.suburb)
+    analyzer = SuburbAnalyzer(data_dir=DATA_DIR)
+    if args.from_store:
+        metrics = analyzer.analyze_suburb_from_store(args.suburb)
+    else:
+        metrics = analyzer.analyze_suburb(args.suburb)
+        report_skipped_rows(analyzer)
+        # History only holds file-derived snapshots so trends compare like with like
+        MetricsHistory(DATA_DIR).record(metrics)
 
     print(analyzer.generate_report(metrics))
 
@@ -102,23 +171,188 @@ def cmd_analyze(args):
         print("\n")
         print(analyzer.yield_breakdown(metrics))
 
+    if args.scenarios:
+        result = simulate_yields(metrics, scenarios=args.scenarios, seed=args.seed)
+        print("\n")
+        print(format_scenarios(result) if result else "Insufficient data for scenario modelling.")
+
 
 def cmd_compare(args):
     """Compare multiple suburbs."""
-    analyzer = SuburbAnalyzer(data_dir=Path(__file__).parent / "data")
+    analyzer = SuburbAnalyzer(data_dir=DATA_DIR)
     all_metrics = analyzer.compare_suburbs(args.suburbs)
+    report_skipped_rows(analyzer)
+
+    history = MetricsHistory(DATA_DIR)
+    for m in all_metrics:
+        history.record(m)
 
     print("\n=== SUBURB COMPARISON ===\n")
-    print(f"{'Suburb':<15} {'Rentals':<8} {'Sales':<8} {'Med Rent':<12} {'Med Price':<15} {'Gross %':<10} {'Net %':<10}")
-    print("-" * 90)
+    ci_header = f"Gross {analyzer.CONFIDENCE*100:.0f}% CI"
+    print(f"{'Suburb':<15} {'Rentals':<8} {'Sales':<8} {'Med Rent':<12} {'Med Price':<15} {'Gross %':<10} {'Net %':<10} {ci_header:<16}")
+    print("-" * 106)
 
     for m in all_metrics:
         rent_str = f"R {m.median_rent:,.0f}" if m.median_rent else "N/A"
         price_str = f"R {m.median_price:,.0f}" if m.median_price else "N/A"
         gross_str = f"{m.gross_yield:.2f}%" if m.gross_yield else "N/A"
         net_str = f"{m.estimated_net_yield:.2f}%" if m.estimated_net_yield else "N/A"
+        ci_str = f"{m.gross_yield_ci[0]:.1f}-{m.gross_yield_ci[1]:.1f}%" if m.gross_yield_ci else "N/A"
+
+        print(f"{m.suburb:<15} {m.rental_count:<8} {m.sales_count:<8} {rent_str:<12} {price_str:<15} {gross_str:<10} {net_str:<10} {ci_str:<16}")
+
+
+def cmd_matrix(args):
+    """Show like-for-like yields per suburb x bedrooms x property type."""
+    analyzer = SuburbAnalyzer(data_dir=DATA_DIR)
+    cells = analyzer.segment_yield_matrix(args.suburbs or None, args.min_samples)
+    report_skipped_rows(analyzer)
+
+    value = "net_yield" if args.net else "gross_yield"
+    cells = cells[cells[value].notna()]
+    if cells.empty:
+        print("No segments with enough rentals and sales. Try a lower --min-samples.")
+        return
+
+    matrix = cells.pivot_table(index=["suburb", "bedrooms"], columns="property_type",
+                               values=value, observed=True)
+
+    print(f"\n=== {'Net' if args.net else 'Gross'} Yield Matrix (%) ===\n")
+    print(matrix.round(2).to_string(na_rep="-"))
+
+
+def cmd_best_yields(args):
+    """Rank individual rentals by yield estimated from comparable sales."""
+    analyzer = SuburbAnalyzer(data_dir=DATA_DIR)
+    ranked = analyzer.listing_yields(args.suburbs or None, k=args.k)
+    report_skipped_rows(analyzer)
+    ranked = ranked[ranked["gross_yield"].notna()].head(args.top)
+
+    if ranked.empty:
+        print("No rentals could be matched to comparable sales.")
+        return
+
+    print(f"\n=== Best-Yielding Listings (k={args.k} comparable sales) ===\n")
+    print(f"{'Suburb':<15} {'Type':<11} {'Beds':<5} {'Rent':<10} {'Est. Price':<14} {'Gross %':<9} {'Net %':<8} URL")
+    print("-" * 110)
+
+    for _, row in ranked.iterrows():
+        beds = f"{row['bedrooms']:.0f}" if row["bedrooms"] >= 0 else "-"
+        print(f"{row['suburb']:<15} {row['property_type']:<11} {beds:<5} "
+              f"{'R ' + format(row['price'], ',.0f'):<10} {'R ' + format(row['est_price'], ',.0f'):<14} "
+              f"{row['gross_yield']:<9.2f} {row['net_yield']:<8.2f} {row['url']}")
+
+
+def cmd_region(args):
+    """Show a city or province rollup and compare the regions inside it."""
+    analyzer = SuburbAnalyzer(data_dir=DATA_DIR)
+    rollups = RegionRollups.load(DATA_DIR)
+    level = args.level or rollups.find(args.name)
+
+    metrics = analyzer.analyze_region(args.name, level, rollups) if level else None
+    if metrics is None:
+        print(f"No rollup for {args.name}. Run 'scrape' to build region aggregates.")
+        return
+
+    print(analyzer.generate_report(metrics))
+
+    children = rollups.children(level, args.name)
+    if children:
+        print(f"\n=== {args.name.title()} by {children[0][0]} ===\n")
+        print(f"{'Region':<20} {'Rentals':<8} {'Sales':<8} {'Med Rent':<12} {'Med Price':<15} {'Gross %':<10} {'Net %':<10}")
+        print("-" * 90)
+        for child_level, child in children:
+            m = analyzer.analyze_region(child, child_level, rollups)
+            rent_str = f"R {m.median_rent:,.0f}" if m.median_rent else "N/A"
+            price_str = f"R {m.median_price:,.0f}" if m.median_price else "N/A"
+            gross_str = f"{m.gross_yield:.2f}%" if m.gross_yield else "N/A"
+            net_str = f"{m.estimated_net_yield:.2f}%" if m.estimated_net_yield else "N/A"
+            print(f"{child:<20} {m.rental_count:<8} {m.sales_count:<8} {rent_str:<12} {price_str:<15} {gross_str:<10} {net_str:<10}")
+
+
+def cmd_cashflow(args):
+    """Show break-even rent and cash-on-cash tables for a suburb."""
+    if not 0 < args.deposit <= 100:
+        print(f"Deposit must be above 0% and at most 100% (got {args.deposit:g}%).")
+        return
+
+    analyzer = SuburbAnalyzer(data_dir=DATA_DIR)
+    metrics = analyzer.analyze_suburb(args.suburb)
+    report_skipped_rows(analyzer)
+    deposit = args.deposit / 100
+    # The requested deposit goes on the grid so both tables use it exactly
+    deposits = sorted({*DEFAULT_DEPOSITS, deposit})
+    grid = cashflow_grid(metrics, analyzer, deposits=deposits, years=args.years)
+
+    if grid is None:
+        print("Insufficient data for cash flow analysis.")
+        return
+
+    print(format_cashflow_tables(grid, deposit))
+
+    if args.rate_path:
+        # One rate per year, held for 12 months each
+        yearly = [float(rate) / 100 for rate in args.rate_path.split(",")]
+        monthly = [rate for rate in yearly for _ in range(12)]
+        loan = metrics.median_price * (1 - deposit)
+        repayments = rate_path_repayments(loan, monthly, args.years)
+        rent_kept, costs = expense_factors(analyzer)
+        net_income = (metrics.median_rent * 12 * rent_kept - metrics.median_price * costs) / 12
+
+        print(f"\nRATE PATH (price R {metrics.median_price:,.0f}, {args.deposit:.0f}% deposit)")
+        print(f"  {'Year':<6} {'Rate':<8} {'Repayment':<14} {'Cash Flow':<14}")
+        for year, rate in enumerate(yearly):
+            payment = repayments[year * 12:(year + 1) * 12].mean()
+            print(f"  {year + 1:<6} {format(rate * 100, '.2f') + '%':<8} {'R ' + format(payment, ',.0f'):<14} "
+                  f"{'R ' + format(net_income - payment, ',.0f'):<14}")
+
+
+def cmd_trend(args):
+    """Show a suburb's rent/price/yield trajectory from recorded history."""
+    history = MetricsHistory(DATA_DIR)
+    points = history.trend(args.suburb, months=args.months)
+
+    if not points:
+        print(f"No history recorded for {args.suburb}. Run 'analyze' or 'compare' first.")
+        return
+
+    print(f"\n=== {args.suburb.title()} Trend ===\n")
+    print(f"{'Month':<9} {'Med Rent':<12} {'MoM':<8} {'Med Price':<15} {'MoM':<8} {'Gross %':<9} {'Net %':<9} {'Net MoM':<8}")
+    print("-" * 85)
+
+    def pct(value):
+        return f"{value:+.1f}%" if value is not None else "-"
 
-        print(f"{m.suburb:<15} {m.rental_count:<8} {m.sales_count:<8} {rent_str:<12} {price_str:<15} {gross_str:<10} {net_str:<10}")
+    for p in points:
+        rent_str = f"R {p['median_rent']:,.0f}" if p["median_rent"] else "N/A"
+        price_str = f"R {p['median_price']:,.0f}" if p["median_price"] else "N/A"
+        gross_str = f"{p['gross_yield']:.2f}%" if p["gross_yield"] else "N/A"
+        net_str = f"{p['net_yield']:.2f}%" if p["net_yield"] else "N/A"
+        net_mom = f"{p['net_yield_mom']:+.2f}pp" if p["net_yield_mom"] is not None else "-"
+
+        print(f"{p['month']:<9} {rent_str:<12} {pct(p['median_rent_mom']):<8} "
+              f"{price_str:<15} {pct(p['median_price_mom']):<8} {gross_str:<9} {net_str:<9} {net_mom:<8}")
+
+
+def cmd_serve(args):
+    """Serve suburb metrics over HTTP for the web tools."""
+    serve(DATA_DIR, host=args.host, port=args.port, check_interval=args.reload_interval)
+
+
+def cmd_export_bundle(args):
+    """Export the suburb data bundle for the web yield calculator."""
+    analyzer = SuburbAnalyzer(DATA_DIR)
+    suburbs = args.suburbs or analyzer.available_suburbs()
+    if not suburbs:
+        print("No suburb data found. Run 'scrape' first.")
+        return
+
+    print(f"\nExporting {len(suburbs)} suburbs...")
+    index_path = export_bundle(analyzer, args.output, suburbs, compress=args.gzip)
+    report_skipped_rows(analyzer)
+    shard_sizes = [p.stat().st_size for p in (index_path.parent / "suburbs").glob("*.json")]
+    print(f"Wrote {index_path} ({index_path.stat().st_size / 1024:.1f} KB)")
+    print(f"  {len(shard_sizes)} shards, {sum(shard_sizes) / 1024:.1f} KB total")
 
 
 def main():
@@ -138,10 +372,27 @@ def main():
     scrape_parser.add_argument("--show-browser", action="store_true", help="Show browser window")
     scrape_parser.set_defaults(func=lambda args: asyncio.run(cmd_scrape(args)))
 
+    # Watch command
+    watch_parser = subparsers.add_parser("watch", help="Continuously re-scrape suburbs on a schedule")
+    watch_parser.add_argument("suburbs", nargs="*", help="Suburbs to add to the schedule (existing jobs are kept)")
+    watch_parser.add_argument("--city", default="cape-town", help="City (default: cape-town)")
+    watch_parser.add_argument("--province", default="western-cape", help="Province (default: western-cape)")
+    watch_parser.add_argument("--hours", type=float, default=12, help="Starting interval between checks (default: 12)")
+    watch_parser.add_argument("--pages", type=int, default=3, help="Max pages per check in fast mode (default: 3)")
+    watch_parser.add_argument("--max-listings", type=int, default=20, help="Max listings in detailed mode (default: 20)")
+    watch_parser.add_argument("--detailed", "-d", action="store_true", help="Use detailed mode (slower but gets prices)")
+    watch_parser.add_argument("--once", action="store_true", help="Run every job once and exit")
+    watch_parser.add_argument("--show-browser", action="store_true", help="Show browser window")
+    watch_parser.set_defaults(func=lambda args: asyncio.run(cmd_watch(args)))
+
     # Analyze command
     analyze_parser = subparsers.add_parser("analyze", help="Analyze scraped suburb data")
     analyze_parser.add_argument("suburb", help="Suburb name")
     analyze_parser.add_argument("--detailed", "-d", action="store_true", help="Show detailed yield breakdown")
+    analyze_parser.add_argument("--from-store", action="store_true", help="Read metrics from the incremental stats store")
+    analyze_parser.add_argument("--scenarios", type=int, nargs="?", const=1_000_000,
+                                help="Run Monte Carlo yield scenarios (default: 1,000,000 draws)")
+    analyze_parser.add_argument("--seed", type=int, help="Random seed for --scenarios")
     analyze_parser.set_defaults(func=cmd_analyze)
 
     # Compare command
@@ -149,6 +400,56 @@ def main():
     compare_parser.add_argument("suburbs", nargs="+", help="Suburb names to compare")
     compare_parser.set_defaults(func=cmd_compare)
 
+    # Matrix command
+    matrix_parser = subparsers.add_parser("matrix", help="Yield matrix by bedrooms and property type")
+    matrix_parser.add_argument("suburbs", nargs="*", help="Suburb names (default: all scraped suburbs)")
+    matrix_parser.add_argument("--min-samples", type=int, help="Minimum rentals and sales per segment")
+    matrix_parser.add_argument("--net", action="store_true", help="Show net instead of gross yield")
+    matrix_parser.set_defaults(func=cmd_matrix)
+
+    # Best yields command
+    best_parser = subparsers.add_parser("best-yields", help="Rank rentals by comparable-sale yield")
+    best_parser.add_argument("suburbs", nargs="*", help="Suburb names (default: all scraped suburbs)")
+    best_parser.add_argument("--top", type=int, default=20, help="Number of listings to show (default: 20)")
+    best_parser.add_argument("-k", type=int, default=5, help="Comparable sales per rental (default: 5)")
+    best_parser.set_defaults(func=cmd_best_yields)
+
+    # Region command
+    region_parser = subparsers.add_parser("region", help="Show suburb/city/province rollups")
+    region_parser.add_argument("name", help="Region slug (e.g., cape-town, western-cape)")
+    region_parser.add_argument("--level", choices=["suburb", "city", "province"], help="Region level (default: detect)")
+    region_parser.set_defaults(func=cmd_region)
+
+    # Cashflow command
+    cashflow_parser = subparsers.add_parser("cashflow", help="Bond repayment and cash flow tables")
+    cashflow_parser.add_argument("suburb", help="Suburb name")
+    cashflow_parser.add_argument("--deposit", type=float, default=10, help="Deposit %% for the break-even table, above 0 and up to 100 (default: 10)")
+    cashflow_parser.add_argument("--years", type=int, default=20, help="Bond term in years (default: 20)")
+    cashflow_parser.add_argument("--rate-path", help="Comma-separated annual rates %% per year, e.g. 11.0,10.5,10.25")
+    cashflow_parser.set_defaults(func=cmd_cashflow)
+
+    # Trend command
+    trend_parser = subparsers.add_parser("trend", help="Show metric trends from recorded history")
+    trend_parser.add_argument("suburb", help="Suburb name")
+    trend_parser.add_argument("--months", type=int, help="Only show the most recent N months")
+    trend_parser.set_defaults(func=cmd_trend)
+
+    # Serve command
+    serve_parser = subparsers.add_parser("serve", help="Serve suburb metrics over HTTP")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=8024, help="Port (default: 8024)")
+    serve_parser.add_argument("--reload-interval", type=float, default=5.0,
+                              help="Seconds between checks for new data (default: 5)")
+    serve_parser.set_defaults(func=cmd_serve)
+
+    # Export bundle command
+    bundle_parser = subparsers.add_parser("export-bundle", help="Export suburb data for the web calculator")
+    bundle_parser.add_argument("suburbs", nargs="*", help="Suburbs to export (default: all scraped)")
+    bundle_parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_DIR,
+                               help="Output directory (default: property/tools/data)")
+    bundle_parser.add_argument("--gzip", action="store_true", help="Also write pre-compressed .gz files")
+    bundle_parser.set_defaults(func=cmd_export_bundle)
+
     args = parser.parse_args()
 
     if args.command:
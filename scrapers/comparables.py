@@ -0,0 +1,154 @@
+"""
+Comparable Sales Matching for The Winning Formula Newsletter
+Matches each rental to its most similar sales listings so yield can be
+estimated per listing rather than only at suburb-median level.
+"""
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from robust_stats import outlier_mask_grouped
+
+
+COMPARABLE_COLUMNS = [
+    "url", "suburb", "listing_type", "property_type", "bedrooms",
+    "bathrooms", "size_sqm", "price", "title",
+]
+
+# Buckets are tried from most to least specific until enough comps are found
+BUCKET_LEVELS = [
+    ["suburb", "property_type", "bedrooms"],
+    ["suburb", "bedrooms"],
+    ["suburb", "property_type"],
+    ["suburb"],
+]
+
+# Distance weights: log-size difference is the base unit
+BATHROOM_WEIGHT = 0.15
+BEDROOM_WEIGHT = 0.30
+MISSING_PENALTY = 0.25
+
+
+def comparables_frame(listings: Iterable[dict]) -> pd.DataFrame:
+    """Build a DataFrame with the columns matching needs."""
+    # Rows of just these columns, so a listing stream is never held as dicts
+    rows = (tuple(map(listing.get, COMPARABLE_COLUMNS)) for listing in listings)
+    df = pd.DataFrame.from_records(rows, columns=COMPARABLE_COLUMNS)
+    for col in ("bedrooms", "bathrooms", "size_sqm", "price"):
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df["property_type"] = df["property_type"].fillna("Unknown")
+    # Missing bedrooms get their own bucket rather than being dropped by groupby
+    df["bedrooms"] = df["bedrooms"].fillna(-1)
+    return df
+
+
+class ComparableSalesIndex:
+    """
+    Sorted-bucket nearest-neighbour index over sales listings.
+
+    Sales are bucketed by each level in BUCKET_LEVELS and sorted by size
+    within a bucket. A rental only looks at a fixed window of sales around
+    its own size (found with searchsorted), so matching is O(n * window)
+    and fully vectorized within each bucket.
+    """
+
+    def __init__(self, sales: pd.DataFrame, window: int = 32):
+        sales = sales[sales["price"] > 0]
+        outliers = outlier_mask_grouped(sales["price"], sales["suburb"])
+        sales = sales[~outliers]
+
+        # Unknown sizes sit at the bucket's median size so they stay matchable
+        sizes = sales["size_sqm"].where(sales["size_sqm"] > 0)
+        sales = sales.assign(
+            log_size=np.log(sizes.fillna(sizes.groupby(sales["suburb"]).transform("median")).fillna(100.0)),
+            size_known=sizes.notna(),
+        ).sort_values("log_size", kind="stable")
+
+        self.sales = sales.reset_index(drop=True)
+        self.window = window
+        self.buckets = [
+            {_as_tuple(key): positions for key, positions in self.sales.groupby(keys, sort=False).indices.items()}
+            for keys in BUCKET_LEVELS
+        ]
+
+    def _match_bucket(self, rentals: pd.DataFrame, positions: np.ndarray, k: int, level: int):
+        """Return (comp_price_median, comp_count) for rentals against one bucket."""
+        sales = self.sales.iloc[positions]
+        log_size = sales["log_size"].to_numpy()
+        m = len(sales)
+        width = min(2 * self.window, m)
+
+        # Window of candidates around each rental's size position
+        r_log_size = rentals["log_size"].to_numpy()
+        pos = np.searchsorted(log_size, r_log_size)
+        start = np.clip(pos - width // 2, 0, m - width)
+        idx = start[:, None] + np.arange(width)[None, :]
+
+        dist = np.abs(log_size[idx] - r_log_size[:, None])
+        dist += np.where(rentals["size_known"].to_numpy()[:, None] & sales["size_known"].to_numpy()[idx],
+                         0, MISSING_PENALTY)
+
+        bath_diff = np.abs(sales["bathrooms"].to_numpy()[idx] - rentals["bathrooms"].to_numpy()[:, None])
+        dist += BATHROOM_WEIGHT * np.nan_to_num(bath_diff, nan=MISSING_PENALTY / BATHROOM_WEIGHT)
+        if "bedrooms" not in BUCKET_LEVELS[level]:
+            bed_diff = np.abs(sales["bedrooms"].to_numpy()[idx] - rentals["bedrooms"].to_numpy()[:, None])
+            dist += BEDROOM_WEIGHT * bed_diff
+
+        take = min(k, width)
+        nearest = np.argpartition(dist, take - 1, axis=1)[:, :take] if width > take else np.tile(np.arange(width), (len(rentals), 1))
+        comp_idx = np.take_along_axis(idx, nearest, axis=1)
+        prices = sales["price"].to_numpy()[comp_idx]
+        return np.median(prices, axis=1), take
+
+    def match(self, rentals: pd.DataFrame, k: int = 5, min_comps: int = 3) -> pd.DataFrame:
+        """
+        Estimate a purchase price for every rental from its k nearest sales.
+
+        Args:
+            rentals: Frame from comparables_frame with listing_type "rent"
+            k: Number of comparable sales per rental
+            min_comps: Buckets with fewer sales fall through to the next level
+
+        Returns:
+            Copy of rentals with est_price, comps and match_level columns
+            (match_level indexes BUCKET_LEVELS, -1 if unmatched)
+        """
+        rentals = rentals[rentals["price"] > 0].copy()
+        sizes = rentals["size_sqm"].where(rentals["size_sqm"] > 0)
+        rentals["size_known"] = sizes.notna()
+        # Rentals without a size sit in the middle of whatever bucket they land in
+        rentals["log_size"] = np.log(sizes)
+
+        est_price = np.full(len(rentals), np.nan)
+        comps = np.zeros(len(rentals), dtype=int)
+        match_level = np.full(len(rentals), -1)
+        rentals = rentals.reset_index(drop=True)
+
+        for level, keys in enumerate(BUCKET_LEVELS):
+            pending = rentals[match_level == -1]
+            if pending.empty:
+                break
+            for key, group in pending.groupby(keys, sort=False):
+                positions = self.buckets[level].get(_as_tuple(key))
+                if positions is None or len(positions) < min_comps:
+                    continue
+                group = group.copy()
+                if group["log_size"].isna().any():
+                    bucket_sizes = self.sales["log_size"].to_numpy()[positions]
+                    group["log_size"] = group["log_size"].fillna(float(np.median(bucket_sizes)))
+                price, count = self._match_bucket(group, positions, k, level)
+                est_price[group.index] = price
+                comps[group.index] = count
+                match_level[group.index] = level
+
+        rentals["est_price"] = est_price
+        rentals["comps"] = comps
+        rentals["match_level"] = match_level
+        return rentals.drop(columns=["log_size", "size_known"])
+
+
+def _as_tuple(key) -> tuple:
+    """groupby keys are scalars for one column and tuples for several."""
+    return key if isinstance(key, tuple) else (key,)
@@ -0,0 +1,158 @@
+"""
+Data Bundle Export for The Winning Formula Newsletter
+Writes analyzer output for every suburb as a compact, versioned JSON bundle
+for the web rental-yield calculator: a small column-oriented index plus one
+lazily fetched shard per suburb.
+"""
+
+import gzip
+import hashlib
+import json
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from suburb_analyzer import SuburbAnalyzer, SuburbMetrics
+
+
+# Bump when the layout of index.json or the shards changes
+BUNDLE_VERSION = 1
+
+DEFAULT_OUTPUT_DIR = Path(__file__).parent / "property" / "tools" / "data"
+
+# Summary columns in index.json, in order
+INDEX_COLUMNS = ["rental_count", "sales_count", "median_rent", "median_price", "gross_yield", "estimated_net_yield"]
+
+SEGMENT_COLUMNS = ["bedrooms", "property_type", "rentals", "sales", "median_rent", "median_price",
+                   "gross_yield", "net_yield"]
+
+# Rounding per field: ZAR to whole rands, percentages and ratios to 2 decimals
+MONEY_FIELDS = {"avg_rent", "median_rent", "min_rent", "max_rent", "rent_std_dev", "median_rent_ci",
+                "avg_price", "median_price", "min_price", "max_price", "price_std_dev", "median_price_ci"}
+
+
+def _compact(name: str, value):
+    """Round a value for the bundle; tuples (confidence intervals) become lists."""
+    if value is None:
+        return None
+    if isinstance(value, (tuple, list)):
+        return [_compact(name, v) for v in value]
+    if isinstance(value, float):
+        return round(value) if name in MONEY_FIELDS else round(value, 2)
+    return value
+
+
+def _dumps(data) -> bytes:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def suburb_shard(metrics: SuburbMetrics) -> dict:
+    """One suburb's full metrics, with segment yields as column arrays."""
+    summary = {
+        name: _compact(name, value)
+        for name, value in asdict(metrics).items()
+        if name not in ("suburb", "property_types", "bedroom_distribution", "segment_yields")
+    }
+    segments = {
+        column: [_compact(column, row[column]) for row in metrics.segment_yields]
+        for column in SEGMENT_COLUMNS
+    }
+    return {
+        "version": BUNDLE_VERSION,
+        "suburb": metrics.suburb,
+        "summary": summary,
+        "property_types": metrics.property_types,
+        "bedroom_distribution": metrics.bedroom_distribution,
+        "segments": segments,
+    }
+
+
+def _write(path: Path, body: bytes, compress: bool):
+    path.write_bytes(body)
+    gz_path = path.with_name(path.name + ".gz")
+    if compress:
+        gz_path.write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+    else:
+        # A .gz left by an earlier compressed export would be served stale
+        gz_path.unlink(missing_ok=True)
+
+
+def _previous_rows(index_path: Path) -> dict[str, dict]:
+    """Index rows by suburb from an earlier export of the same BUNDLE_VERSION."""
+    if not index_path.exists():
+        return {}
+    index = json.loads(index_path.read_text())
+    if index.get("version") != BUNDLE_VERSION:
+        return {}
+    columns = index["columns"]
+    return {
+        suburb: {name: values[i] for name, values in columns.items()}
+        for i, suburb in enumerate(columns["suburb"])
+    }
+
+
+def export_bundle(
+    analyzer: SuburbAnalyzer,
+    output_dir: Optional[Path] = None,
+    suburbs: Optional[list[str]] = None,
+    compress: bool = False,
+) -> Path:
+    """
+    Export the calculator bundle.
+
+    Shards are named by a hash of their contents, so they can be cached
+    indefinitely; index.json is the only file that changes between exports.
+    Exporting some suburbs keeps the other suburbs' index rows and shards;
+    only superseded shards of the exported suburbs are removed.
+
+    Args:
+        analyzer: Analyzer to run over each suburb
+        output_dir: Bundle directory (default: property/tools/data)
+        suburbs: Suburbs to export (default: all with scraped data)
+        compress: Also write pre-compressed .gz copies for static hosting
+
+    Returns:
+        Path to index.json
+    """
+    output_dir = Path(output_dir) if output_dir else DEFAULT_OUTPUT_DIR
+    shard_dir = output_dir / "suburbs"
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    index_path = output_dir / "index.json"
+    rows = _previous_rows(index_path)
+
+    for suburb in suburbs or analyzer.available_suburbs():
+        metrics = analyzer.analyze_suburb(suburb)
+        body = _dumps(suburb_shard(metrics))
+        shard_name = f"{suburb}.{hashlib.sha1(body).hexdigest()[:10]}.json"
+        _write(shard_dir / shard_name, body, compress)
+
+        for stale in shard_dir.glob(f"{suburb}.*.json*"):
+            if stale.name not in (shard_name, shard_name + ".gz"):
+                stale.unlink()
+
+        rows[suburb] = {
+            "suburb": suburb,
+            "shard": f"suburbs/{shard_name}",
+            **{name: _compact(name, getattr(metrics, name)) for name in INDEX_COLUMNS},
+        }
+
+    names = ["suburb", "shard", *INDEX_COLUMNS]
+    columns = {name: [rows[suburb].get(name) for suburb in sorted(rows)] for name in names}
+
+    index = {
+        "version": BUNDLE_VERSION,
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "assumptions": {
+            "vacancy_rate": analyzer.VACANCY_RATE,
+            "management_fee": analyzer.MANAGEMENT_FEE,
+            "maintenance_rate": analyzer.MAINTENANCE_RATE,
+            "insurance_rate": analyzer.INSURANCE_RATE,
+            "rates_estimate": analyzer.RATES_ESTIMATE,
+            "confidence": analyzer.CONFIDENCE,
+        },
+        "columns": columns,
+    }
+    _write(index_path, _dumps(index), compress)
+    return index_path
@@ -9,17 +9,35 @@ Usage:
     python cli.py consistency 1             # Analyze driver consistency
     python cli.py teammates 1               # Compare teammates
     python cli.py summary 1                 # Full race summary
+    python cli.py standings                 # Season standings so far
+    python cli.py telemetry 1 VER LEC       # Fastest-lap speed trace comparison
+    python cli.py upgrades McLaren --round 6 # Pace before/after an upgrade
+    python cli.py ingest --years 2022 2023  # Load seasons into the lap warehouse
+    python cli.py poles --years 2022 2023   # Pole conversion, from the warehouse
+    python cli.py trajectory McLaren        # Team results across seasons
 """
 
 import argparse
 import sys
 from pathlib import Path
 
+import pandas as pd
+
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from f1_extractor import F1Extractor, format_laptime
+from f1_extractor import SESSION_CACHE, F1Extractor, format_laptime
 from f1_analyzer import F1Analyzer
+from lap_warehouse import LapWarehouse
+from points_ledger import PointsLedger
+from telemetry_store import mini_sector_summary
+
+
+def report_skipped_rounds(extractor: F1Extractor):
+    """Print and clear the rounds a season load had to leave out."""
+    for round_number, reason in extractor.skipped_rounds:
+        print(f"Skipped round {round_number}: {reason}")
+    extractor.skipped_rounds.clear()
 
 
 def cmd_races(args):
@@ -171,7 +189,7 @@ def cmd_strategy(args):
         print("-" * 60)
 
         for stint in strategy['stints']:
-            deg_str = f"{stint['deg_per_lap']:.3f}s" if stint['deg_per_lap'] else "N/A"
+            deg_str = f"{stint['deg_per_lap']:.3f}s" if pd.notna(stint['deg_per_lap']) else "N/A"
             print(f"{stint['stint']:<6} "
                   f"{stint['compound']:<10} "
                   f"{stint['laps']:<6} "
@@ -183,11 +201,184 @@ def cmd_strategy(args):
         print(f"Error: {e}")
 
 
+def cmd_standings(args):
+    """Show driver and constructor standings."""
+    extractor = F1Extractor(args.year)
+    if args.rebuild:
+        PointsLedger(args.year).clear()
+
+    print(f"\n=== {args.year} Standings ===\n")
+
+    try:
+        drivers, constructors = extractor.get_season_standings()
+        report_skipped_rounds(extractor)
+        if drivers.empty:
+            print("No completed races yet.")
+            return
+
+        print(f"{'Pos':<5} {'Driver':<8} {'Team':<28} {'Points':>7}")
+        print("-" * 50)
+        for pos, row in enumerate(drivers.itertuples(), start=1):
+            print(f"{pos:<5} {row.Driver:<8} {row.Team:<28} {row.Points:>7g}")
+
+        print(f"\n{'Pos':<5} {'Constructor':<37} {'Points':>7}")
+        print("-" * 50)
+        for pos, row in enumerate(constructors.itertuples(), start=1):
+            print(f"{pos:<5} {row.Team:<37} {row.Points:>7g}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def cmd_telemetry(args):
+    """Compare drivers' fastest-lap telemetry."""
+    extractor = F1Extractor(args.year)
+
+    print(f"\n=== Telemetry: {', '.join(args.drivers)} in Round {args.race} ===\n")
+
+    try:
+        comparison = extractor.compare_telemetry(args.race, args.drivers, lap=args.lap, session_type=args.session)
+
+        print(f"{'Driver':<8} {'Lap':<5} {'Lap Time':<12} {'Top Speed':<11} {'Avg Speed':<11} {'Full Throttle':<14} {'Braking':<8}")
+        print("-" * 75)
+        for i, driver in enumerate(comparison.drivers):
+            lap_time = comparison.lap_times[i]
+            if lap_time is None:
+                print(f"{driver:<8} (no lap {args.lap + 1})")
+                continue
+            print(f"{driver:<8} "
+                  f"{comparison.lap_numbers[i]:<5} "
+                  f"{format_laptime(lap_time):<12} "
+                  f"{comparison.speed[i].max():<11.0f} "
+                  f"{comparison.speed[i].mean():<11.1f} "
+                  f"{format((comparison.throttle[i] >= 98).mean() * 100, '.1f') + '%':<14} "
+                  f"{(comparison.brake[i] > 0).mean() * 100:.1f}%")
+
+        print(f"\nMini-sectors (time through each, fastest marked):\n")
+        sectors = mini_sector_summary(comparison, args.sectors)
+        print(f"{'From':>7} {'To':>7}  " + "".join(f"{d:<10}" for d in comparison.drivers))
+        for _, row in sectors.iterrows():
+            times = "".join(f"{row[d]:<8.3f}{'*' if row['fastest'] == d else ' ':<2}" for d in comparison.drivers)
+            print(f"{row['start_m']:>6.0f}m {row['end_m']:>6.0f}m  {times}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def cmd_upgrades(args):
+    """Show team form before and after upgrade rounds."""
+    analyzer = F1Analyzer(args.year)
+
+    try:
+        if args.team and args.round:
+            print(f"\n=== {args.team} Upgrade at Round {args.round} ({args.window}-race windows) ===\n")
+            impact = analyzer.analyze_upgrade_window(args.team, args.round, args.window)
+            report_skipped_rounds(analyzer.extractor)
+            if 'error' in impact:
+                print(impact['error'])
+                return
+
+            print(f"{'':<14} {'Before':>8} {'After':>8} {'Gain':>8}")
+            print("-" * 42)
+            for prefix, label in [('race_gap', 'Race gap %'), ('quali_gap', 'Quali gap %'), ('points', 'Points/race')]:
+                print(f"{label:<14} {impact[f'{prefix}_before']:>8.2f} "
+                      f"{impact[f'{prefix}_after']:>8.2f} {impact[f'{prefix}_gain']:>+8.2f}")
+            print(f"\n{impact['interpretation']}")
+            return
+
+        print(f"\n=== Biggest Pace Swings ({args.window}-race windows) ===\n")
+        sweep = analyzer.sweep_upgrade_impact(args.window, teams=[args.team] if args.team else None)
+        report_skipped_rounds(analyzer.extractor)
+        if sweep.empty:
+            print("Not enough completed races for these windows.")
+            return
+
+        print(f"{'Team':<28} {'Round':<6} {'Race Gap':>15} {'Quali Gap':>15} {'Pts/Race':>13}")
+        print("-" * 82)
+        for row in sweep.head(args.top).itertuples():
+            print(f"{row.team:<28} {row.upgrade_round:<6} "
+                  f"{row.race_gap_before:>6.2f}->{row.race_gap_after:<6.2f}  "
+                  f"{row.quali_gap_before:>6.2f}->{row.quali_gap_after:<6.2f}  "
+                  f"{row.points_before:>5.1f}->{row.points_after:<5.1f}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def cmd_ingest(args):
+    """Load seasons into the lap warehouse."""
+    years = args.years or [args.year]
+
+    try:
+        warehouse = LapWarehouse()
+        for year in years:
+            print(f"Ingesting {year}...")
+            extractor = F1Extractor(year)
+            rounds = warehouse.ingest_season(extractor, include_laps=not args.no_laps, force=args.force)
+            report_skipped_rounds(extractor)
+            if rounds:
+                print(f"  {len(rounds)} rounds: {', '.join(str(r) for r in rounds)}")
+            else:
+                print("  No new complete rounds")
+        warehouse.close()
+        print(f"\nWarehouse: {warehouse.path}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def cmd_poles(args):
+    """Show how often pole was converted to a win."""
+    analyzer = F1Analyzer(args.year)
+    years = args.years or [args.year]
+
+    print("\n=== Pole Conversion ===\n")
+
+    try:
+        poles = analyzer.pole_conversion(years)
+        if poles.empty:
+            print("No races in the warehouse for these seasons (run `cli.py ingest` first).")
+            return
+
+        print(f"{'Season':<8} {'Races':<7} {'Converted':<11} {'Rate':<6}")
+        print("-" * 35)
+        for row in poles.itertuples():
+            print(f"{row.year:<8} {row.races:<7} {row.poles_converted:<11} {row.conversion_rate:.1f}%")
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def cmd_trajectory(args):
+    """Show a team's results race by race across seasons."""
+    analyzer = F1Analyzer(args.year)
+    years = args.years or [args.year]
+
+    print(f"\n=== {args.team} Trajectory ===\n")
+
+    try:
+        trajectory = analyzer.team_trajectory(args.team, years)
+        if trajectory.empty:
+            print(f"No results for {args.team} in the warehouse (run `cli.py ingest` first).")
+            return
+
+        print(f"{'Season':<8} {'Rd':<4} {'Race':<30} {'Pts':>5} {'Avg Pos':>8} {'Season Pts':>11} {'Pace Gap':>9}")
+        print("-" * 80)
+        for row in trajectory.itertuples():
+            gap = f"{row.pace_gap_pct:.2f}%" if pd.notna(row.pace_gap_pct) else "-"
+            print(f"{row.year:<8} {row.round:<4} {row.event_name:<30} {row.points:>5g} "
+                  f"{row.avg_position:>8.1f} {row.season_points:>11g} {gap:>9}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="F1 Data Analysis Tools for The Winning Formula"
     )
     parser.add_argument("--year", type=int, default=2024, help="F1 season year (default: 2024)")
+    parser.add_argument("--cache-stats", action="store_true", help="Print session cache hits/misses when done")
 
     subparsers = parser.add_subparsers(dest="command", help="Commands")
 
@@ -238,10 +429,55 @@ def main():
     strategy_parser.add_argument("driver", help="Driver abbreviation (e.g., VER)")
     strategy_parser.set_defaults(func=cmd_strategy)
 
+    # Standings command
+    standings_parser = subparsers.add_parser("standings", help="Show season standings")
+    standings_parser.add_argument("--rebuild", action="store_true",
+                                  help="Reload every round instead of using the points ledger")
+    standings_parser.set_defaults(func=cmd_standings)
+
+    # Telemetry command
+    telemetry_parser = subparsers.add_parser("telemetry", help="Compare drivers' fastest-lap telemetry")
+    telemetry_parser.add_argument("race", type=int, help="Race round number")
+    telemetry_parser.add_argument("drivers", nargs="+", help="Driver abbreviations (first is the reference)")
+    telemetry_parser.add_argument("--session", default="R", help="Session: R, Q, S, FP1... (default: R)")
+    telemetry_parser.add_argument("--lap", type=int, default=0, help="0 = fastest lap, 1 = second fastest, ...")
+    telemetry_parser.add_argument("--sectors", type=int, default=10, help="Number of mini-sectors (default: 10)")
+    telemetry_parser.set_defaults(func=cmd_telemetry)
+
+    # Upgrades command
+    upgrades_parser = subparsers.add_parser("upgrades", help="Team form before/after upgrade rounds")
+    upgrades_parser.add_argument("team", nargs="?", help="Team name (default: every team)")
+    upgrades_parser.add_argument("--round", type=int, help="Upgrade round (omit to sweep every round)")
+    upgrades_parser.add_argument("--window", type=int, default=3, help="Races on each side (default: 3)")
+    upgrades_parser.add_argument("--top", type=int, default=10, help="Rows to show when sweeping")
+    upgrades_parser.set_defaults(func=cmd_upgrades)
+
+    # Ingest command
+    ingest_parser = subparsers.add_parser("ingest", help="Load seasons into the lap warehouse")
+    ingest_parser.add_argument("--years", type=int, nargs="+", help="Seasons to load (default: --year)")
+    ingest_parser.add_argument("--no-laps", action="store_true", help="Skip lap times (results and qualifying only)")
+    ingest_parser.add_argument("--force", action="store_true", help="Re-ingest rounds already in the warehouse")
+    ingest_parser.set_defaults(func=cmd_ingest)
+
+    # Poles command
+    poles_parser = subparsers.add_parser("poles", help="Pole conversion rate from the warehouse")
+    poles_parser.add_argument("--years", type=int, nargs="+", help="Seasons to include (default: --year)")
+    poles_parser.set_defaults(func=cmd_poles)
+
+    # Trajectory command
+    trajectory_parser = subparsers.add_parser("trajectory", help="Team results across seasons from the warehouse")
+    trajectory_parser.add_argument("team", help="Team name as in results (e.g., McLaren)")
+    trajectory_parser.add_argument("--years", type=int, nargs="+", help="Seasons to include (default: --year)")
+    trajectory_parser.set_defaults(func=cmd_trajectory)
+
     args = parser.parse_args()
 
     if args.command:
         args.func(args)
+        if args.cache_stats:
+            stats = SESSION_CACHE.stats()
+            print(f"\nSession cache: {stats['misses']} loads, {stats['hits']} hits, "
+                  f"{stats['evictions']} evictions, {stats['memory_mb']} MB held")
     else:
         parser.print_help()
 
@@ -3,11 +3,21 @@ F1 Analysis Module for The Winning Formula Newsletter
 Generates newsletter-ready insights from F1 data.
 """
 
+import numpy as np
 import pandas as pd
 from typing import Optional
 from dataclasses import dataclass
 
-from f1_extractor import F1Extractor, format_laptime
+from f1_extractor import F1Extractor, format_laptime, needs
+from lap_warehouse import LapWarehouse
+
+
+# Upgrade-window metrics: (summary column, output prefix, True if lower is better)
+UPGRADE_METRICS = [
+    ('RaceGapPct', 'race_gap', True),
+    ('QualiGapPct', 'quali_gap', True),
+    ('Points', 'points', False),
+]
 
 
 @dataclass
@@ -25,7 +35,17 @@ class F1Analyzer:
     def __init__(self, year: int = 2024):
         self.extractor = F1Extractor(year)
         self.year = year
+        self._warehouse = None
+        self._team_summary = None
 
+    @property
+    def warehouse(self) -> LapWarehouse:
+        """Read-only lap warehouse, opened on first use (fill it with `cli.py ingest`)."""
+        if self._warehouse is None:
+            self._warehouse = LapWarehouse(read_only=True)
+        return self._warehouse
+
+    @needs('results')
     def analyze_qualifying_vs_race(self, race: str | int) -> RaceInsight:
         """
         Analyze how qualifying position affected race results.
@@ -63,50 +83,25 @@ class F1Analyzer:
             ]
         )
 
+    @needs('laps')
     def analyze_tire_strategy(self, race: str | int, driver: str) -> dict:
         """
         Analyze a driver's tire strategy and its impact.
         Great for: "Why this strategy won the race"
         """
-        laps = self.extractor.get_lap_times(race, driver)
-        laps = laps[laps['LapTime'].notna()].copy()
-        laps['LapTimeSeconds'] = laps['LapTime'].dt.total_seconds()
-
-        # Find stint boundaries (compound changes)
-        laps['StintChange'] = laps['Compound'] != laps['Compound'].shift()
-        laps['Stint'] = laps['StintChange'].cumsum()
-
-        stint_analysis = []
-        for stint_num in laps['Stint'].unique():
-            stint_laps = laps[laps['Stint'] == stint_num]
-            compound = stint_laps['Compound'].iloc[0]
-            stint_length = len(stint_laps)
-
-            # Calculate tire degradation (pace loss per lap)
-            if stint_length > 3:
-                # Simple linear regression for deg
-                first_5_avg = stint_laps.head(5)['LapTimeSeconds'].mean()
-                last_5_avg = stint_laps.tail(5)['LapTimeSeconds'].mean()
-                deg_per_lap = (last_5_avg - first_5_avg) / max(stint_length - 5, 1)
-            else:
-                deg_per_lap = 0
-
-            stint_analysis.append({
-                'stint': stint_num,
-                'compound': compound,
-                'laps': stint_length,
-                'avg_pace': stint_laps['LapTimeSeconds'].mean(),
-                'best_lap': stint_laps['LapTimeSeconds'].min(),
-                'deg_per_lap': deg_per_lap
-            })
+        stints = self.extractor.get_stint_analysis(race)
+        stints = stints[stints['driver'] == driver]
+
+        stint_analysis = stints[['stint', 'compound', 'laps', 'avg_pace', 'best_lap', 'deg_per_lap']].to_dict('records')
 
         return {
             'driver': driver,
             'total_stints': len(stint_analysis),
             'stints': stint_analysis,
-            'compounds_used': laps['Compound'].unique().tolist()
+            'compounds_used': stints['compound'].unique().tolist()
         }
 
+    @needs('results', 'laps')
     def analyze_driver_consistency(self, race: str | int, top_n: int = 10) -> pd.DataFrame:
         """
         Rank drivers by consistency (low lap time variance = consistent).
@@ -115,29 +110,28 @@ class F1Analyzer:
         results = self.extractor.get_race_results(race)
         top_drivers = results.head(top_n)['Abbreviation'].tolist()
 
-        consistency_data = []
-        for driver in top_drivers:
-            analysis = self.extractor.get_driver_lap_analysis(race, driver)
-            if 'error' not in analysis:
-                consistency_data.append({
-                    'Driver': driver,
-                    'AvgLap': analysis['average_lap'],
-                    'FastestLap': analysis['fastest_lap'],
-                    'StdDev': analysis['std_dev'],
-                    'ConsistencyScore': analysis['consistency_score'],
-                    'ValidLaps': analysis['valid_laps']
-                })
-
-        df = pd.DataFrame(consistency_data)
+        field = self.extractor.get_field_lap_analysis(race)
+        field = field[field.index.isin(top_drivers) & (field['valid_laps'] > 0)]
+
+        df = pd.DataFrame({
+            'Driver': field.index,
+            'AvgLap': field['average_lap'].to_numpy(),
+            'FastestLap': field['fastest_lap'].to_numpy(),
+            'StdDev': field['std_dev'].to_numpy(),
+            'ConsistencyScore': field['consistency_score'].to_numpy(),
+            'ValidLaps': field['valid_laps'].to_numpy(),
+        })
         df = df.sort_values('ConsistencyScore', ascending=False)
         return df
 
+    @needs('results', 'laps')
     def compare_teammates(self, race: str | int) -> list[dict]:
         """
         Compare teammate performance.
         Great for: "Who's beating their teammate?"
         """
         results = self.extractor.get_race_results(race)
+        field = self.extractor.get_field_lap_analysis(race)
 
         teams = results.groupby('TeamName')
         comparisons = []
@@ -148,8 +142,8 @@ class F1Analyzer:
 
                 # Get lap data for both
                 try:
-                    d1_analysis = self.extractor.get_driver_lap_analysis(race, d1['Abbreviation'])
-                    d2_analysis = self.extractor.get_driver_lap_analysis(race, d2['Abbreviation'])
+                    d1_analysis = self.extractor.get_driver_lap_analysis(race, d1['Abbreviation'], field)
+                    d2_analysis = self.extractor.get_driver_lap_analysis(race, d2['Abbreviation'], field)
 
                     if 'error' in d1_analysis or 'error' in d2_analysis:
                         continue
@@ -172,6 +166,7 @@ class F1Analyzer:
 
         return sorted(comparisons, key=lambda x: x['gap_seconds'], reverse=True)
 
+    @needs('results')
     def generate_race_summary(self, race: str | int) -> str:
         """Generate a newsletter-ready race summary."""
         results = self.extractor.get_race_results(race)
@@ -205,6 +200,7 @@ class F1Analyzer:
 
         return summary
 
+    @needs('results')
     def find_upgrade_impact(self, race1: str | int, race2: str | int, team: str) -> dict:
         """
         Compare team performance between two races to spot upgrade impact.
@@ -247,6 +243,151 @@ class F1Analyzer:
         except Exception as e:
             return {'error': str(e)}
 
+    @needs('results', 'laps')
+    def season_team_summary(self) -> pd.DataFrame:
+        """Per-round team pace and points for the season (loaded once per analyzer)."""
+        if self._team_summary is None:
+            self._team_summary = self.extractor.get_season_team_summary()
+        return self._team_summary
+
+    def sweep_upgrade_impact(self, window: int = 3, teams: Optional[list[str]] = None) -> pd.DataFrame:
+        """
+        Before/after averages around every round for every team.
+        Great for: "Which upgrade actually moved a team up the order?"
+
+        The before window is the `window` races ahead of the upgrade round;
+        the after window starts at the upgrade round. Only rounds with full
+        windows on both sides are returned.
+
+        Returns:
+            DataFrame with team, upgrade_round and, for race_gap, quali_gap
+            and points, the _before and _after averages and a _gain (positive
+            means the team got better), sorted by race_gap_gain
+        """
+        summary = self.season_team_summary()
+        if summary.empty:
+            return pd.DataFrame()
+        if teams:
+            summary = summary[summary['Team'].isin(teams)]
+
+        # One (round, team) matrix per metric; rolling means cover every candidate at once
+        matrices = {column: summary.pivot(index='Round', columns='Team', values=column).sort_index()
+                    for column, _, _ in UPGRADE_METRICS}
+        rounds = matrices['Points'].index
+        team_names = matrices['Points'].columns
+
+        sweep = pd.DataFrame({
+            'team': np.tile(team_names, len(rounds)),
+            'upgrade_round': np.repeat(rounds, len(team_names)),
+        })
+        for column, prefix, lower_is_better in UPGRADE_METRICS:
+            rolling = matrices[column].reindex(columns=team_names).rolling(window, min_periods=window).mean()
+            before = rolling.shift(1).to_numpy().ravel()
+            after = rolling.shift(-(window - 1)).to_numpy().ravel()
+            sweep[f'{prefix}_before'] = before
+            sweep[f'{prefix}_after'] = after
+            sweep[f'{prefix}_gain'] = before - after if lower_is_better else after - before
+
+        sweep = sweep.dropna(subset=['points_before', 'points_after'])
+        return sweep.sort_values('race_gap_gain', ascending=False).reset_index(drop=True)
+
+    def analyze_upgrade_window(self, team: str, upgrade_round: int, window: int = 3) -> dict:
+        """
+        Windowed version of find_upgrade_impact: average pace and points over
+        the `window` races before an upgrade against the `window` races from it.
+        """
+        sweep = self.sweep_upgrade_impact(window, teams=[team])
+        row = sweep[sweep['upgrade_round'] == upgrade_round]
+        if row.empty:
+            return {'error': f'Team {team} needs {window} races either side of round {upgrade_round}'}
+
+        impact = {'team': team, 'upgrade_round': upgrade_round, 'window': window,
+                  **row.iloc[0].drop(['team', 'upgrade_round']).to_dict()}
+        gain = impact['race_gap_gain']
+        impact['interpretation'] = (
+            f"{team} found {gain:.2f}% of race pace relative to the fastest car "
+            f"and {impact['points_gain']:+.1f} points per race over {window} races."
+            if gain > 0 else
+            f"{team} lost {abs(gain):.2f}% of race pace relative to the fastest car "
+            f"over {window} races."
+        )
+        return impact
+
+    def pole_conversion(self, years: list[int]) -> pd.DataFrame:
+        """
+        How often the driver starting from pole won, per season, from the warehouse.
+        Great for: "Does pole position actually matter?" across eras
+
+        Returns:
+            DataFrame with year, races, poles_converted and conversion_rate (%)
+        """
+        return self.warehouse.query("""
+            SELECT year,
+                   count(*) AS races,
+                   count(*) FILTER (WHERE position = 1) AS poles_converted,
+                   round(100.0 * count(*) FILTER (WHERE position = 1) / count(*), 1) AS conversion_rate
+            FROM results
+            WHERE grid = 1 AND list_contains(?, year)
+            GROUP BY year
+            ORDER BY year
+        """, [years])
+
+    def team_pace_gaps(self, years: list[int]) -> pd.DataFrame:
+        """
+        Each team's race pace per round as a gap to the fastest team, from the warehouse.
+
+        Pace is the median of the team's clean laps (laps within 20% of the
+        driver's median, as in get_field_lap_analysis).
+
+        Returns:
+            DataFrame with year, round, team, pace (seconds) and gap_pct
+        """
+        return self.warehouse.query("""
+            WITH driver_laps AS (
+                SELECT l.year, l.round, r.team, l.lap_time,
+                       median(l.lap_time) OVER (PARTITION BY l.year, l.round, l.driver) AS driver_median
+                FROM laps l
+                JOIN results r USING (year, round, driver)
+                WHERE l.lap_time IS NOT NULL AND list_contains(?, l.year)
+            ),
+            team_pace AS (
+                SELECT year, round, team, median(lap_time) AS pace
+                FROM driver_laps
+                WHERE lap_time < driver_median * 1.2
+                GROUP BY year, round, team
+            )
+            SELECT year, round, team, pace,
+                   100.0 * (pace / min(pace) OVER (PARTITION BY year, round) - 1) AS gap_pct
+            FROM team_pace
+            ORDER BY year, round, gap_pct
+        """, [years])
+
+    def team_trajectory(self, team: str, years: list[int]) -> pd.DataFrame:
+        """
+        A team's results race by race across seasons, from the warehouse.
+        Great for: "How far has this team come since the regulation change?"
+
+        Returns:
+            DataFrame with year, round, event_name, points, avg_position,
+            season_points (cumulative within each season) and pace_gap_pct
+            (NaN for rounds ingested without laps)
+        """
+        trajectory = self.warehouse.query("""
+            SELECT r.year, r.round, races.event_name,
+                   sum(r.points) AS points,
+                   avg(r.position) AS avg_position,
+                   sum(sum(r.points)) OVER (PARTITION BY r.year ORDER BY r.round) AS season_points
+            FROM results r
+            JOIN races USING (year, round)
+            WHERE r.team = ? AND list_contains(?, r.year)
+            GROUP BY r.year, r.round, races.event_name
+            ORDER BY r.year, r.round
+        """, [team, years])
+
+        gaps = self.team_pace_gaps(years)
+        gaps = gaps[gaps['team'] == team][['year', 'round', 'gap_pct']]
+        return trajectory.merge(gaps, on=['year', 'round'], how='left').rename(columns={'gap_pct': 'pace_gap_pct'})
+
 
 def main():
     """Example analysis."""
@@ -9,6 +9,11 @@ import pandas as pd
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import functools
+import threading
 import json
 
 
@@ -17,6 +22,144 @@ CACHE_DIR = Path(__file__).parent / "cache"
 CACHE_DIR.mkdir(exist_ok=True)
 fastf1.Cache.enable_cache(str(CACHE_DIR))
 
+from frame_cache import cached_frame  # noqa: E402  (after CACHE_DIR exists)
+from points_ledger import PointsLedger  # noqa: E402
+from telemetry_store import TelemetryComparison, TelemetryStore, validate_lap  # noqa: E402
+
+
+# Timing data is usually published a few hours after the race starts
+RACE_DATA_DELAY = pd.Timedelta(hours=4)
+
+# Stints need at least this many clean laps for a degradation slope
+MIN_DEG_LAPS = 4
+
+# Concurrent session loads when building season-wide data
+SEASON_WORKERS = 4
+
+# Parts of a session that can be loaded independently. Results (and session
+# info) always come with any load; telemetry needs laps.
+DATA_CATEGORIES = frozenset({'results', 'laps', 'telemetry', 'weather', 'messages'})
+
+# Categories declared by the @needs methods currently on the call stack
+_REQUIRED_CATEGORIES = contextvars.ContextVar('required_categories', default=frozenset())
+
+
+def needs(*categories: str):
+    """
+    Declare which session data categories a method uses.
+
+    get_session loads the union of the categories declared by every @needs
+    method on the call stack, so an outer method can ask for everything its
+    helpers will need in a single load. Helpers that load a different
+    session than their callers (e.g. qualifying inside a race analysis) pass
+    their categories to get_session explicitly instead.
+    """
+    unknown = set(categories) - DATA_CATEGORIES
+    if unknown:
+        raise ValueError(f"Unknown data categories: {', '.join(sorted(unknown))}")
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            token = _REQUIRED_CATEGORIES.set(_REQUIRED_CATEGORIES.get() | frozenset(categories))
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _REQUIRED_CATEGORIES.reset(token)
+
+        wrapper.data_categories = frozenset(categories)
+        return wrapper
+
+    return decorator
+
+
+def session_memory_bytes(session) -> int:
+    """Approximate in-memory size of a loaded session's data frames."""
+    total = 0
+    for name in ('results', 'laps', 'weather_data', 'race_control_messages', 'car_data', 'pos_data'):
+        try:
+            data = getattr(session, name)
+        except Exception:
+            continue  # Not loaded
+        frames = data.values() if isinstance(data, dict) else [data]
+        for frame in frames:
+            if isinstance(frame, pd.DataFrame):
+                total += int(frame.memory_usage(deep=True).sum())
+    return total
+
+
+class SessionCache:
+    """
+    Process-wide LRU of loaded FastF1 sessions keyed by (year, round, session_type).
+
+    Evicts least recently used sessions once there are more than max_sessions
+    or their combined size passes max_bytes. The most recent session is always
+    kept, even if it alone is over budget.
+    """
+
+    def __init__(self, max_sessions: int = 8, max_bytes: int = 2 * 1024 ** 3):
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sessions = OrderedDict()  # key -> (session, loaded categories, size in bytes)
+        self._lock = threading.RLock()
+
+    def get(self, key: tuple, categories: frozenset = DATA_CATEGORIES) -> Optional[tuple]:
+        """
+        Look up a session.
+
+        Returns:
+            (session, loaded categories), or None if it isn't cached. Only
+            counts as a hit if every requested category is already loaded.
+        """
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None or not categories <= entry[1]:
+                self.misses += 1
+            else:
+                self.hits += 1
+            if entry is None:
+                return None
+            self._sessions.move_to_end(key)
+            return entry[0], entry[1]
+
+    def put(self, key: tuple, session, categories: frozenset = DATA_CATEGORIES):
+        with self._lock:
+            self._sessions[key] = (session, frozenset(categories), session_memory_bytes(session))
+            self._sessions.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        while len(self._sessions) > 1 and (
+            len(self._sessions) > self.max_sessions or self.total_bytes > self.max_bytes
+        ):
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(size for _, _, size in self._sessions.values())
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'sessions': len(self._sessions),
+                'memory_mb': round(self.total_bytes / 1024 ** 2, 1),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+# Shared by every F1Extractor in the process
+SESSION_CACHE = SessionCache()
+
 
 @dataclass
 class RaceAnalysis:
@@ -37,6 +180,9 @@ class F1Extractor:
     def __init__(self, year: int = 2024):
         self.year = year
         self._schedule = None
+        # (round, reason) for rounds the season loaders had to leave out;
+        # the CLI reports and clears these
+        self.skipped_rounds: list[tuple[int, str]] = []
 
     @property
     def schedule(self) -> pd.DataFrame:
@@ -59,21 +205,53 @@ class F1Extractor:
                 })
         return races
 
-    def get_session(self, race: str | int, session_type: str = 'R'):
+    def round_number(self, race: str | int) -> int:
+        """Resolve a race name (e.g. 'Bahrain') or round number to a round number."""
+        if isinstance(race, str) and not race.isdigit():
+            return int(self.schedule.get_event_by_name(race)['RoundNumber'])
+        return int(race)
+
+    def get_session(self, race: str | int, session_type: str = 'R',
+                    categories: Optional[set[str]] = None):
         """
-        Load a session.
+        Load a session, reusing it from SESSION_CACHE when already loaded.
+
+        Only the requested data categories are loaded. A cached session that
+        lacks some of them is reloaded with the union of old and new.
 
         Args:
             race: Race name or round number
             session_type: 'R' (Race), 'Q' (Qualifying), 'FP1', 'FP2', 'FP3', 'S' (Sprint)
+            categories: Data to load (default: whatever the calling @needs
+                methods declared, or everything if none did)
 
         Returns:
             FastF1 Session object
         """
-        session = fastf1.get_session(self.year, race, session_type)
-        session.load()
+        if categories is None:
+            categories = _REQUIRED_CATEGORIES.get() or DATA_CATEGORIES
+        categories = frozenset(categories) | {'results'}
+
+        key = (self.year, self.round_number(race), session_type)
+        cached = SESSION_CACHE.get(key, categories)
+        if cached and categories <= cached[1]:
+            return cached[0]
+
+        session, loaded = cached or (fastf1.get_session(self.year, key[1], session_type), frozenset())
+        loaded |= categories
+        if 'telemetry' in loaded:
+            loaded |= {'laps'}
+        session.load(
+            laps='laps' in loaded,
+            telemetry='telemetry' in loaded,
+            weather='weather' in loaded,
+            messages='messages' in loaded,
+        )
+        SESSION_CACHE.put(key, session, loaded)
         return session
 
+    @needs('results')
+    @cached_frame('race_results', 'R')
     def get_race_results(self, race: str | int) -> pd.DataFrame:
         """Get final race results."""
         session = self.get_session(race, 'R')
@@ -82,12 +260,16 @@ class F1Extractor:
         results['PositionChange'] = results['GridPosition'] - results['Position']
         return results
 
+    @needs('results')
+    @cached_frame('qualifying_results', 'Q')
     def get_qualifying_results(self, race: str | int) -> pd.DataFrame:
         """Get qualifying results."""
-        session = self.get_session(race, 'Q')
+        # Only results are read: don't inherit laps/telemetry declared by callers for the race
+        session = self.get_session(race, 'Q', categories={'results'})
         return session.results[['Position', 'Abbreviation', 'TeamName',
                                 'Q1', 'Q2', 'Q3']].copy()
 
+    @needs('laps')
     def get_lap_times(self, race: str | int, driver: Optional[str] = None) -> pd.DataFrame:
         """
         Get lap times for a race.
@@ -99,60 +281,160 @@ class F1Extractor:
         Returns:
             DataFrame with lap times
         """
-        session = self.get_session(race, 'R')
-        laps = session.laps
-
+        laps = self._field_lap_times(race)
         if driver:
-            laps = laps.pick_drivers(driver)
-
+            laps = laps[laps['Driver'] == driver].copy()
+        return laps
+
+    @needs('laps')
+    @cached_frame('lap_times', 'R')
+    def _field_lap_times(self, race: str | int) -> pd.DataFrame:
+        """Lap times for every driver (cached as one frame per race)."""
+        laps = self.get_session(race, 'R').laps
         return laps[['Driver', 'LapNumber', 'LapTime', 'Sector1Time',
-                     'Sector2Time', 'Sector3Time', 'Compound', 'TyreLife',
+                     'Sector2Time', 'Sector3Time', 'Stint', 'Compound', 'TyreLife',
                      'IsPersonalBest']].copy()
 
-    def get_driver_lap_analysis(self, race: str | int, driver: str) -> dict:
+    @needs('laps')
+    def get_field_lap_analysis(self, race: str | int) -> pd.DataFrame:
         """
-        Detailed lap analysis for a driver.
+        Lap analysis for every driver in one pass over the race's laps.
 
-        Returns stats like average pace, consistency, tire deg, etc.
-        """
-        laps = self.get_lap_times(race, driver)
+        Laps without a time are dropped, then laps more than 20% slower than
+        the driver's median (pit laps, safety car laps) are excluded.
 
-        # Filter out pit laps and safety car laps (very slow laps)
-        valid_laps = laps[laps['LapTime'].notna()].copy()
-        valid_laps['LapTimeSeconds'] = valid_laps['LapTime'].dt.total_seconds()
+        Returns:
+            DataFrame indexed by driver with total_laps, valid_laps,
+            average_lap, fastest_lap, slowest_lap, std_dev,
+            consistency_score and tire_compounds_used. Drivers without any
+            clean laps have valid_laps 0 and NaN stats.
+        """
+        laps = self._field_lap_times(race)
+        laps = laps.assign(LapTimeSeconds=laps['LapTime'].dt.total_seconds())
+        total_laps = laps.groupby('Driver').size()
 
-        # Remove outliers (pit laps, SC laps) - laps more than 20% slower than median
-        median_time = valid_laps['LapTimeSeconds'].median()
+        valid_laps = laps[laps['LapTimeSeconds'].notna()]
+        median_time = valid_laps.groupby('Driver')['LapTimeSeconds'].transform('median')
         clean_laps = valid_laps[valid_laps['LapTimeSeconds'] < median_time * 1.2]
 
-        if len(clean_laps) == 0:
-            return {'driver': driver, 'error': 'No valid laps found'}
+        by_driver = clean_laps.groupby('Driver')
+        stats = by_driver['LapTimeSeconds'].agg(['count', 'mean', 'min', 'max', 'std'])
+        analysis = pd.DataFrame({
+            'total_laps': total_laps,
+            'valid_laps': stats['count'].reindex(total_laps.index, fill_value=0).astype(int),
+            'average_lap': stats['mean'],
+            'fastest_lap': stats['min'],
+            'slowest_lap': stats['max'],
+            'std_dev': stats['std'],  # Consistency measure
+            'consistency_score': 100 - (stats['std'] / stats['mean'] * 100),  # Higher = more consistent
+            'tire_compounds_used': by_driver['Compound'].unique().map(list),
+        })
+        analysis.index.name = 'driver'
+        return analysis
+
+    def get_driver_lap_analysis(self, race: str | int, driver: str,
+                                field: Optional[pd.DataFrame] = None) -> dict:
+        """
+        Detailed lap analysis for a driver.
+
+        Returns stats like average pace, consistency, tire deg, etc.
 
-        # Calculate stats
-        lap_times = clean_laps['LapTimeSeconds']
-
-        return {
-            'driver': driver,
-            'total_laps': len(laps),
-            'valid_laps': len(clean_laps),
-            'average_lap': lap_times.mean(),
-            'fastest_lap': lap_times.min(),
-            'slowest_lap': lap_times.max(),
-            'std_dev': lap_times.std(),  # Consistency measure
-            'consistency_score': 100 - (lap_times.std() / lap_times.mean() * 100),  # Higher = more consistent
-            'tire_compounds_used': clean_laps['Compound'].unique().tolist(),
-        }
+        Args:
+            race: Race name or round number
+            driver: Driver abbreviation
+            field: Result of get_field_lap_analysis, to avoid recomputing it
+        """
+        if field is None:
+            field = self.get_field_lap_analysis(race)
+        if driver not in field.index or field.at[driver, 'valid_laps'] == 0:
+            return {'driver': driver, 'error': 'No valid laps found'}
+        return {'driver': driver, **field.loc[driver].to_dict()}
 
+    @needs('laps')
     def compare_drivers(self, race: str | int, drivers: list[str]) -> pd.DataFrame:
         """Compare multiple drivers' performance in a race."""
-        comparisons = []
-        for driver in drivers:
-            analysis = self.get_driver_lap_analysis(race, driver)
-            if 'error' not in analysis:
-                comparisons.append(analysis)
+        field = self.get_field_lap_analysis(race)
+        drivers = [d for d in drivers if d in field.index and field.at[d, 'valid_laps'] > 0]
+        return field.loc[drivers].reset_index()
+
+    @needs('laps')
+    def get_stint_analysis(self, race: str | int) -> pd.DataFrame:
+        """
+        Stint and tyre degradation table for every driver in one pass.
+
+        Stints come from FastF1's Stint column, falling back to compound
+        changes where it is missing. Degradation is the least-squares slope
+        of lap time against lap number over the stint's clean laps (within
+        120% of the driver's median), solved for all stints at once from
+        grouped sums.
 
-        return pd.DataFrame(comparisons)
+        Returns:
+            DataFrame with driver, stint, compound, start_lap, end_lap, laps,
+            avg_pace, best_lap and deg_per_lap (seconds lost per lap; NaN,
+            i.e. unknown rather than flat, for stints with fewer than
+            MIN_DEG_LAPS clean laps), ordered by driver and stint
+        """
+        laps = self._field_lap_times(race)
+        laps = laps[laps['LapTime'].notna()].sort_values(['Driver', 'LapNumber'])
+        seconds = laps['LapTime'].dt.total_seconds()
+
+        by_driver = laps.groupby('Driver', sort=False)
+        compound_change = laps['Compound'].ne(by_driver['Compound'].shift())
+        fallback_stint = compound_change.groupby(laps['Driver'], sort=False).cumsum()
+        stint = laps['Stint'].fillna(fallback_stint).astype(int)
+
+        laps = laps.assign(stint=stint, LapTimeSeconds=seconds)
+        stints = laps.groupby(['Driver', 'stint'], sort=True)
+        table = stints.agg(
+            compound=('Compound', 'first'),
+            start_lap=('LapNumber', 'min'),
+            end_lap=('LapNumber', 'max'),
+            laps=('LapNumber', 'size'),
+            avg_pace=('LapTimeSeconds', 'mean'),
+            best_lap=('LapTimeSeconds', 'min'),
+        )
+
+        # Batched least squares: slope = (n*Sxy - Sx*Sy) / (n*Sxx - Sx^2)
+        median_time = seconds.groupby(laps['Driver']).transform('median')
+        clean = laps[seconds < median_time * 1.2]
+        x = clean['LapNumber'].to_numpy(dtype=float)
+        y = clean['LapTimeSeconds'].to_numpy()
+        sums = pd.DataFrame({'n': 1.0, 'sx': x, 'sy': y, 'sxx': x * x, 'sxy': x * y}, index=clean.index)
+        sums = sums.groupby([clean['Driver'], clean['stint']]).sum().reindex(table.index, fill_value=0)
+
+        denominator = sums['n'] * sums['sxx'] - sums['sx'] ** 2
+        slope = (sums['n'] * sums['sxy'] - sums['sx'] * sums['sy']) / denominator.where(denominator > 0)
+        table['deg_per_lap'] = slope.where(sums['n'] >= MIN_DEG_LAPS)
+
+        table = table.reset_index().rename(columns={'Driver': 'driver'})
+        table[['start_lap', 'end_lap']] = table[['start_lap', 'end_lap']].astype(int)
+        return table
+
+    @needs('laps', 'telemetry')
+    def compare_telemetry(self, race: str | int, drivers: list[str], lap: int = 0,
+                          session_type: str = 'R') -> TelemetryComparison:
+        """
+        Distance-aligned speed, throttle, brake and gear traces for drivers.
 
+        The first call for a session extracts every driver's fastest laps into
+        the telemetry store; later calls read the memory-mapped arrays only.
+
+        Args:
+            race: Race name or round number
+            drivers: Driver abbreviations; the first is the time-delta reference
+            lap: 0 for each driver's fastest lap, 1 for the second fastest, ...
+            session_type: Session to compare ('R', 'Q', ...)
+        """
+        # Check before a first call spends a session load building the store
+        validate_lap(lap)
+        store = TelemetryStore()
+        round_number = self.round_number(race)
+        if not store.exists(self.year, round_number, session_type):
+            session = self.get_session(round_number, session_type)
+            store.build(session, self.year, round_number, session_type)
+        return store.compare(self.year, round_number, session_type, drivers, lap)
+
+    @needs('results')
     def get_position_changes(self, race: str | int) -> pd.DataFrame:
         """Analyze position changes from grid to finish."""
         results = self.get_race_results(race)
@@ -160,6 +442,7 @@ class F1Extractor:
         return results[['Abbreviation', 'TeamName', 'GridPosition',
                         'Position', 'PositionChange', 'Points']]
 
+    @needs('results')
     def get_team_performance(self, race: str | int) -> pd.DataFrame:
         """Analyze team performance (combined driver results)."""
         results = self.get_race_results(race)
@@ -171,42 +454,129 @@ class F1Extractor:
         team_stats.columns = ['TotalPoints', 'AvgPosition', 'AvgPositionChange']
         return team_stats.sort_values('TotalPoints', ascending=False)
 
-    def get_season_standings(self) -> tuple[pd.DataFrame, pd.DataFrame]:
-        """Get current driver and constructor standings."""
-        # FastF1 doesn't directly provide standings, we need to calculate
-        # For now, return the latest available
-        driver_standings = []
-        constructor_standings = {}
+    @needs('results', 'laps')
+    @cached_frame('team_summary', 'R')
+    def get_team_round_summary(self, race: str | int) -> pd.DataFrame:
+        """
+        Per-team pace and points for one round, the input to upgrade analysis.
 
-        # Get results from each race
-        for event in self.schedule.iterrows():
-            event = event[1]
-            if event['EventFormat'] == 'testing':
-                continue
+        Race pace is the faster of the team's two drivers on average clean
+        lap; qualifying pace is the team's best lap from any part of
+        qualifying. Both gaps are percentages behind the fastest team.
 
+        Returns:
+            DataFrame with Team, RacePace, RaceGapPct, QualiGapPct and Points
+        """
+        results = self.get_race_results(race)
+        teams = results.set_index('Abbreviation')['TeamName']
+
+        field = self.get_field_lap_analysis(race)
+        race_pace = field['average_lap'].groupby(teams.reindex(field.index)).min()
+
+        qualifying = self.get_qualifying_results(race)
+        best_lap = qualifying[['Q1', 'Q2', 'Q3']].min(axis=1).dt.total_seconds()
+        quali_pace = best_lap.groupby(qualifying['TeamName']).min()
+
+        summary = pd.DataFrame({
+            'RacePace': race_pace,
+            'RaceGapPct': (race_pace / race_pace.min() - 1) * 100,
+            'QualiGapPct': (quali_pace / quali_pace.min() - 1) * 100,
+            'Points': results.groupby('TeamName')['Points'].sum(),
+        })
+        return summary.rename_axis('Team').reset_index()
+
+    def race_start(self, round_number: int) -> pd.Timestamp:
+        """UTC start of a round's race (NaT if the schedule has no date)."""
+        event = self.schedule[self.schedule['RoundNumber'] == round_number]
+        if event.empty:
+            return pd.NaT
+        return pd.to_datetime(event['Session5DateUtc'].iloc[0])
+
+    def completed_rounds(self) -> list[int]:
+        """Rounds whose race finished long enough ago for timing data to be published."""
+        races = self.schedule[self.schedule['EventFormat'] != 'testing']
+        race_start = pd.to_datetime(races['Session5DateUtc'])
+        now = pd.Timestamp.now(tz='UTC').tz_localize(None)
+        return races.loc[race_start + RACE_DATA_DELAY < now, 'RoundNumber'].astype(int).tolist()
+
+    def _load_rounds(self, load, rounds: Optional[list[int]], max_workers: int) -> pd.DataFrame:
+        """
+        Run a per-round frame loader over many rounds concurrently.
+
+        Rounds still in the future are skipped using schedule dates rather
+        than by attempting a load. Loading is mostly network and disk I/O, so
+        a small thread pool overlaps it while sharing SESSION_CACHE. Rounds
+        that fail to load are left out and added to skipped_rounds.
+        """
+        if rounds is None:
+            rounds = self.completed_rounds()
+
+        def load_round(round_number: int) -> tuple[Optional[pd.DataFrame], Optional[str]]:
             try:
-                results = self.get_race_results(event['RoundNumber'])
-                for _, row in results.iterrows():
-                    driver_standings.append({
-                        'Driver': row['Abbreviation'],
-                        'Team': row['TeamName'],
-                        'Points': row['Points']
-                    })
-            except Exception:
-                continue  # Race hasn't happened yet
-
-        # Aggregate
-        if driver_standings:
-            df = pd.DataFrame(driver_standings)
-            drivers = df.groupby(['Driver', 'Team'])['Points'].sum().reset_index()
-            drivers = drivers.sort_values('Points', ascending=False)
-
-            constructors = df.groupby('Team')['Points'].sum().reset_index()
-            constructors = constructors.sort_values('Points', ascending=False)
-
-            return drivers, constructors
-
-        return pd.DataFrame(), pd.DataFrame()
+                return load(round_number).assign(Round=round_number), None
+            except Exception as e:
+                return None, str(e)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            loaded = list(pool.map(load_round, rounds))
+
+        frames = [frame for frame, _ in loaded if frame is not None]
+        self.skipped_rounds.extend((r, error) for r, (_, error) in zip(rounds, loaded) if error is not None)
+
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    @needs('results')
+    def get_season_results(self, rounds: Optional[list[int]] = None,
+                           max_workers: int = SEASON_WORKERS) -> pd.DataFrame:
+        """
+        Race results for every completed round, loaded concurrently.
+
+        Args:
+            rounds: Rounds to load (default: completed_rounds())
+            max_workers: Concurrent session loads
+
+        Returns:
+            Concatenated get_race_results frames with a Round column
+        """
+        return self._load_rounds(self.get_race_results, rounds, max_workers)
+
+    @needs('results')
+    def get_season_qualifying(self, rounds: Optional[list[int]] = None,
+                              max_workers: int = SEASON_WORKERS) -> pd.DataFrame:
+        """get_qualifying_results for every completed round, with a Round column."""
+        return self._load_rounds(self.get_qualifying_results, rounds, max_workers)
+
+    @needs('laps')
+    def get_season_laps(self, rounds: Optional[list[int]] = None,
+                        max_workers: int = SEASON_WORKERS) -> pd.DataFrame:
+        """Full-field lap times for every completed round, with a Round column."""
+        return self._load_rounds(self._field_lap_times, rounds, max_workers)
+
+    @needs('laps')
+    def get_season_stints(self, rounds: Optional[list[int]] = None,
+                          max_workers: int = SEASON_WORKERS) -> pd.DataFrame:
+        """get_stint_analysis for every completed round, with a Round column."""
+        return self._load_rounds(self.get_stint_analysis, rounds, max_workers)
+
+    @needs('results', 'laps')
+    def get_season_team_summary(self, rounds: Optional[list[int]] = None,
+                                max_workers: int = SEASON_WORKERS) -> pd.DataFrame:
+        """get_team_round_summary for every completed round, with a Round column."""
+        return self._load_rounds(self.get_team_round_summary, rounds, max_workers)
+
+    def get_season_standings(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Get current driver and constructor standings."""
+        # FastF1 doesn't provide standings, so sum race points per driver and
+        # team from the ledger, loading only rounds it doesn't have yet
+        ledger = PointsLedger(self.year)
+        recorded = ledger.rounds()
+        missing = [r for r in self.completed_rounds() if r not in recorded]
+        if missing:
+            incomplete = ledger.append(self.get_season_results(missing))
+            self.skipped_rounds.extend((r, "points not published yet") for r in incomplete)
+        return ledger.standings()
 
 
 def format_laptime(seconds: float) -> str:
@@ -0,0 +1,121 @@
+"""
+Frame Cache for The Winning Formula Newsletter
+Second-level cache that stores the DataFrames F1Extractor derives from a
+session (results, qualifying, laps) as Parquet, so warm runs skip FastF1's
+session deserialization entirely.
+"""
+
+import functools
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import fastf1
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (Parquet engine)
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+# Bump when the columns or dtypes of a cached frame change
+FRAME_CACHE_VERSION = 3
+
+FRAME_CACHE_DIR = Path(__file__).parent / "cache" / "frames"
+
+# Results can still change (penalties, late timing corrections) for a while
+# after the race; frames for newer rounds are provisional and expire
+FRAME_SETTLE_TIME = pd.Timedelta(days=7)
+PROVISIONAL_TTL_SECONDS = 60 * 60
+
+
+class FrameCache:
+    """
+    Parquet files keyed by (year, round, session type, frame name), written
+    under a directory per FastF1 version and FRAME_CACHE_VERSION so upgrades
+    never read stale frames.
+
+    Frames for rounds that have not settled are written as provisional and
+    only served for PROVISIONAL_TTL_SECONDS. Empty frames are never written.
+    Without pyarrow every lookup is a miss and nothing is written.
+    """
+
+    def __init__(self, cache_dir: Path = FRAME_CACHE_DIR):
+        self.root = Path(cache_dir) / f"v{FRAME_CACHE_VERSION}-fastf1-{fastf1.__version__}"
+        self.enabled = PARQUET_AVAILABLE
+
+    def path(self, year: int, round_number: int, session_type: str, name: str,
+             provisional: bool = False) -> Path:
+        suffix = ".provisional.parquet" if provisional else ".parquet"
+        return self.root / str(year) / f"{round_number:02d}_{session_type}" / f"{name}{suffix}"
+
+    def get(self, year: int, round_number: int, session_type: str, name: str,
+            settled: bool = True) -> Optional[pd.DataFrame]:
+        if not self.enabled:
+            return None
+        path = self.path(year, round_number, session_type, name)
+        if path.exists():
+            return pd.read_parquet(path)
+        if settled:
+            # A provisional frame from before the round settled is never final
+            return None
+        path = self.path(year, round_number, session_type, name, provisional=True)
+        if not path.exists() or time.time() - path.stat().st_mtime > PROVISIONAL_TTL_SECONDS:
+            return None
+        return pd.read_parquet(path)
+
+    def put(self, year: int, round_number: int, session_type: str, name: str, frame: pd.DataFrame,
+            settled: bool = True):
+        if not self.enabled or len(frame) == 0:
+            return
+        path = self.path(year, round_number, session_type, name, provisional=not settled)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a crash never leaves a half-written frame behind;
+        # the thread id keeps concurrent round loaders apart
+        tmp = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        pd.DataFrame(frame).to_parquet(tmp)
+        tmp.replace(path)
+        if settled:
+            self.path(year, round_number, session_type, name, provisional=True).unlink(missing_ok=True)
+
+    def clear(self):
+        """Remove every cached frame for the current versions."""
+        if self.root.exists():
+            for path in sorted(self.root.rglob("*"), reverse=True):
+                path.unlink() if path.is_file() else path.rmdir()
+
+
+# Shared by every F1Extractor in the process
+FRAME_CACHE = FrameCache()
+
+
+def cached_frame(name: str, session_type: str) -> Callable:
+    """
+    Cache what a F1Extractor method returns for a race as a Parquet frame.
+
+    The decorated method must take the race as its first argument; a
+    cached copy is returned on later calls, for any spelling of the race.
+    Until FRAME_SETTLE_TIME after the race the copy is provisional.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, race, *args, **kwargs):
+            round_number = self.round_number(race)
+            key = (self.year, round_number, session_type, name)
+            race_start = self.race_start(round_number)
+            now = pd.Timestamp.now(tz='UTC').tz_localize(None)
+            settled = pd.notna(race_start) and race_start + FRAME_SETTLE_TIME < now
+
+            frame = FRAME_CACHE.get(*key, settled=settled)
+            if frame is None:
+                frame = func(self, race, *args, **kwargs)
+                FRAME_CACHE.put(*key, frame, settled=settled)
+            return frame
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,221 @@
+"""
+Lap Warehouse for The Winning Formula Newsletter
+Embedded DuckDB store of race results, qualifying and laps across seasons,
+so cross-race questions are one SQL query instead of a session load per
+round.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+
+WAREHOUSE_PATH = Path(__file__).parent / "cache" / "warehouse.duckdb"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS races (
+    year INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    event_name VARCHAR,
+    country VARCHAR,
+    event_date DATE,
+    PRIMARY KEY (year, round)
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    year INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    driver VARCHAR NOT NULL,
+    team VARCHAR,
+    position INTEGER,
+    grid INTEGER,
+    status VARCHAR,
+    points DOUBLE,
+    PRIMARY KEY (year, round, driver)
+);
+
+CREATE TABLE IF NOT EXISTS qualifying (
+    year INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    driver VARCHAR NOT NULL,
+    team VARCHAR,
+    position INTEGER,
+    q1 DOUBLE,  -- seconds
+    q2 DOUBLE,
+    q3 DOUBLE,
+    PRIMARY KEY (year, round, driver)
+);
+
+CREATE TABLE IF NOT EXISTS laps (
+    year INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    driver VARCHAR NOT NULL,
+    lap_number INTEGER NOT NULL,
+    lap_time DOUBLE,  -- seconds
+    sector1 DOUBLE,
+    sector2 DOUBLE,
+    sector3 DOUBLE,
+    stint INTEGER,
+    compound VARCHAR,
+    tyre_life DOUBLE,
+    is_personal_best BOOLEAN,
+    PRIMARY KEY (year, round, driver, lap_number)
+);
+
+CREATE INDEX IF NOT EXISTS results_team ON results (team, year, round);
+CREATE INDEX IF NOT EXISTS laps_round ON laps (year, round);
+"""
+
+
+def _seconds(values: pd.Series) -> pd.Series:
+    return pd.to_timedelta(values).dt.total_seconds()
+
+
+def _as_int(values: pd.Series) -> pd.Series:
+    return pd.to_numeric(values, errors='coerce').astype('Int64')
+
+
+class LapWarehouse:
+    """
+    DuckDB database at cache/warehouse.duckdb with races, results,
+    qualifying and laps tables keyed by (year, round, driver[, lap]).
+
+    Each table holds a round's rows in full or not at all: re-ingesting a
+    round replaces its rows. A round counts as ingested once every
+    requested table has it.
+    """
+
+    def __init__(self, path: Path = WAREHOUSE_PATH, read_only: bool = False):
+        if duckdb is None:
+            raise ImportError("The lap warehouse needs duckdb: pip install duckdb")
+        self.path = Path(path)
+        if read_only and not self.path.exists():
+            raise FileNotFoundError(f"No warehouse at {self.path} (run `cli.py ingest` first)")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.con = duckdb.connect(str(self.path), read_only=read_only)
+        if not read_only:
+            self.con.execute(SCHEMA)
+
+    def close(self):
+        self.con.close()
+
+    def query(self, sql: str, params: Optional[list] = None) -> pd.DataFrame:
+        return self.con.execute(sql, params or []).df()
+
+    def ingested_rounds(self, year: int, tables: tuple = ('results', 'qualifying', 'laps')) -> set[int]:
+        """Rounds of a season present in every one of `tables`."""
+        rounds = None
+        for table in tables:
+            rows = self.con.execute(f"SELECT DISTINCT round FROM {table} WHERE year = ?", [year]).fetchall()
+            rounds = {r for (r,) in rows} if rounds is None else rounds & {r for (r,) in rows}
+        return rounds or set()
+
+    def _replace(self, table: str, year: int, frame: pd.DataFrame):
+        """Replace the rows of every round in `frame` (rounds not in it are left alone)."""
+        if frame.empty:
+            return
+        rounds = sorted(int(r) for r in frame['round'].unique())
+        self.con.execute(f"DELETE FROM {table} WHERE year = ? AND list_contains(?, round)", [year, rounds])
+        self.con.register('incoming', frame)
+        columns = ", ".join(frame.columns)
+        self.con.execute(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM incoming")
+        self.con.unregister('incoming')
+
+    def ingest_season(self, extractor, rounds: Optional[list[int]] = None,
+                      include_laps: bool = True, force: bool = False) -> list[int]:
+        """
+        Load a season's results, qualifying and laps through an F1Extractor.
+
+        Each table is written for the rounds whose frame loaded, so a round
+        missing qualifying or laps (a failed or unpublished load) is retried
+        on the next ingest.
+
+        Args:
+            extractor: F1Extractor for the season
+            rounds: Rounds to ingest (default: every completed round)
+            include_laps: Also ingest lap times (needs a laps load per race)
+            force: Re-ingest rounds that are already in the warehouse
+
+        Returns:
+            Rounds now fully ingested (every requested table loaded)
+        """
+        year = extractor.year
+        tables = ('results', 'qualifying', 'laps') if include_laps else ('results', 'qualifying')
+        if rounds is None:
+            rounds = extractor.completed_rounds()
+        if not force:
+            done = self.ingested_rounds(year, tables)
+            rounds = [r for r in rounds if r not in done]
+        if not rounds:
+            return []
+
+        results = extractor.get_season_results(rounds)
+        qualifying = extractor.get_season_qualifying(rounds)
+        laps = extractor.get_season_laps(rounds) if include_laps else pd.DataFrame()
+
+        frames = {}
+        if not results.empty:
+            frames['results'] = pd.DataFrame({
+                'year': year,
+                'round': results['Round'],
+                'driver': results['Abbreviation'],
+                'team': results['TeamName'],
+                'position': _as_int(results['Position']),
+                'grid': _as_int(results['GridPosition']),
+                'status': results['Status'],
+                'points': results['Points'].astype(float),
+            }).dropna(subset=['driver'])
+
+            loaded = sorted(int(r) for r in frames['results']['round'].unique())
+            schedule = extractor.schedule.set_index('RoundNumber')
+            frames['races'] = pd.DataFrame({
+                'year': year,
+                'round': loaded,
+                'event_name': [schedule.at[r, 'EventName'] for r in loaded],
+                'country': [schedule.at[r, 'Country'] for r in loaded],
+                'event_date': [pd.Timestamp(schedule.at[r, 'EventDate']).date() for r in loaded],
+            })
+        if not qualifying.empty:
+            frames['qualifying'] = pd.DataFrame({
+                'year': year,
+                'round': qualifying['Round'],
+                'driver': qualifying['Abbreviation'],
+                'team': qualifying['TeamName'],
+                'position': _as_int(qualifying['Position']),
+                'q1': _seconds(qualifying['Q1']),
+                'q2': _seconds(qualifying['Q2']),
+                'q3': _seconds(qualifying['Q3']),
+            }).dropna(subset=['driver'])
+        if not laps.empty:
+            # Laps without a driver or lap number can't be keyed (NOT NULL primary key)
+            frames['laps'] = pd.DataFrame({
+                'year': year,
+                'round': laps['Round'],
+                'driver': laps['Driver'],
+                'lap_number': _as_int(laps['LapNumber']),
+                'lap_time': _seconds(laps['LapTime']),
+                'sector1': _seconds(laps['Sector1Time']),
+                'sector2': _seconds(laps['Sector2Time']),
+                'sector3': _seconds(laps['Sector3Time']),
+                'stint': _as_int(laps['Stint']),
+                'compound': laps['Compound'],
+                'tyre_life': laps['TyreLife'].astype(float),
+                'is_personal_best': laps['IsPersonalBest'].astype('boolean'),
+            }).dropna(subset=['driver', 'lap_number'])
+
+        self.con.execute("BEGIN TRANSACTION")
+        try:
+            for table in ('races', 'results', 'qualifying', 'laps'):
+                if table in frames:
+                    self._replace(table, year, frames[table])
+            self.con.execute("COMMIT")
+        except Exception:
+            self.con.execute("ROLLBACK")
+            raise
+        return sorted(set(rounds) & self.ingested_rounds(year, tables))
@@ -0,0 +1,77 @@
+"""
+Points Ledger for The Winning Formula Newsletter
+Persisted per-season record of race points, one row per (round, driver,
+team), so standings only ever load races that aren't in the ledger yet.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+
+LEDGER_COLUMNS = ['Round', 'Driver', 'Team', 'Points']
+
+LEDGER_DIR = Path(__file__).parent / "cache" / "standings"
+
+
+class PointsLedger:
+    """
+    One CSV per season under ``cache/standings``.
+
+    Rounds are appended whole, after their results load successfully, so a
+    round is either fully in the ledger or not at all.
+    """
+
+    def __init__(self, year: int, ledger_dir: Path = LEDGER_DIR):
+        self.year = year
+        self.path = Path(ledger_dir) / f"{year}_points.csv"
+
+    def load(self) -> pd.DataFrame:
+        if not self.path.exists():
+            return pd.DataFrame(columns=LEDGER_COLUMNS)
+        return pd.read_csv(self.path)
+
+    def rounds(self) -> set[int]:
+        """Rounds already recorded."""
+        return set(self.load()['Round'].astype(int))
+
+    def append(self, results: pd.DataFrame) -> list[int]:
+        """
+        Add rounds from get_season_results output.
+
+        A round with any missing points (results not fully published yet) is
+        left out entirely, so it is loaded again next time.
+
+        Args:
+            results: Frame with Round, Abbreviation, TeamName and Points columns
+
+        Returns:
+            Rounds left out because their points are incomplete
+        """
+        if results.empty:
+            return []
+        rows = results.rename(columns={'Abbreviation': 'Driver', 'TeamName': 'Team'})[LEDGER_COLUMNS]
+        incomplete = sorted(int(r) for r in rows.loc[rows['Points'].isna(), 'Round'].unique())
+        rows = rows[~rows['Round'].isin(incomplete)]
+        if not rows.empty:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            rows.to_csv(self.path, mode='a', header=not self.path.exists(), index=False)
+        return incomplete
+
+    def clear(self):
+        """Forget every recorded round (standings will reload the season)."""
+        self.path.unlink(missing_ok=True)
+
+    def standings(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Driver and constructor standings from the recorded rounds."""
+        ledger = self.load()
+        if ledger.empty:
+            return pd.DataFrame(), pd.DataFrame()
+
+        drivers = (ledger.groupby(['Driver', 'Team'])['Points'].sum()
+                   .reset_index()
+                   .sort_values('Points', ascending=False))
+        constructors = (ledger.groupby('Team')['Points'].sum()
+                        .reset_index()
+                        .sort_values('Points', ascending=False))
+        return drivers, constructors
@@ -0,0 +1,207 @@
+"""
+Telemetry Store for The Winning Formula Newsletter
+Resamples car telemetry for each driver's fastest laps onto a fixed
+distance grid and keeps it as memory-mapped NumPy arrays, so speed-trace
+comparisons never reload FastF1's telemetry frames.
+"""
+
+import json
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import fastf1
+import numpy as np
+import pandas as pd
+
+
+# Bump when the array layout or resampling changes
+TELEMETRY_STORE_VERSION = 1
+
+TELEMETRY_DIR = Path(__file__).parent / "cache" / "telemetry"
+
+CHANNELS = ['Speed', 'Throttle', 'Brake', 'nGear']
+
+DISTANCE_STEP = 5.0  # metres between grid points
+FASTEST_LAPS = 3  # laps kept per driver
+
+
+def validate_lap(lap: int, laps_per_driver: int = FASTEST_LAPS):
+    """Raise ValueError unless `lap` indexes one of the stored fastest laps."""
+    if not 0 <= lap < laps_per_driver:
+        raise ValueError(f"lap must be 0-{laps_per_driver - 1}: the store keeps each driver's "
+                         f"{laps_per_driver} fastest laps (0 = fastest)")
+
+
+@dataclass
+class TelemetryComparison:
+    """Channels are (driver, distance) arrays aligned on ``distance``."""
+    race: str
+    distance: np.ndarray
+    drivers: list[str]
+    lap_numbers: list[int]
+    lap_times: list[float]
+    speed: np.ndarray
+    throttle: np.ndarray
+    brake: np.ndarray
+    gear: np.ndarray
+    elapsed: np.ndarray  # seconds since the start of the lap, integrated from speed
+
+    @property
+    def time_delta(self) -> np.ndarray:
+        """Seconds each driver is behind the first driver at each point."""
+        return self.elapsed - self.elapsed[0]
+
+
+class TelemetryStore:
+    """
+    One directory per (year, round, session) under ``cache/telemetry``:
+
+        telemetry.npy   float32 (driver, lap, channel, distance), NaN-padded
+        distance.npy    float32 distance grid in metres
+        meta.json       drivers, lap numbers/times, channels, versions
+
+    Arrays are opened with mmap_mode='r', so a comparison only pages in the
+    drivers it reads.
+    """
+
+    def __init__(self, store_dir: Path = TELEMETRY_DIR):
+        self.root = Path(store_dir)
+
+    def path(self, year: int, round_number: int, session_type: str) -> Path:
+        return self.root / str(year) / f"{round_number:02d}_{session_type}"
+
+    def exists(self, year: int, round_number: int, session_type: str) -> bool:
+        meta_path = self.path(year, round_number, session_type) / "meta.json"
+        if not meta_path.exists():
+            return False
+        meta = json.loads(meta_path.read_text())
+        return (meta.get('version') == TELEMETRY_STORE_VERSION
+                and meta.get('fastf1_version') == fastf1.__version__)
+
+    def build(self, session, year: int, round_number: int, session_type: str,
+              laps_per_driver: int = FASTEST_LAPS) -> Path:
+        """
+        Extract and store the fastest laps of every driver in a loaded session.
+
+        Args:
+            session: FastF1 session loaded with laps and telemetry
+            year, round_number, session_type: Store key
+            laps_per_driver: Fastest laps kept per driver
+
+        Returns:
+            Directory the arrays were written to
+        """
+        traces = {}
+        for driver in session.laps['Driver'].dropna().unique():
+            fastest = session.laps.pick_drivers(driver).dropna(subset=['LapTime']).nsmallest(laps_per_driver, 'LapTime')
+            driver_traces = []
+            for _, lap in fastest.iterlaps():
+                car = lap.get_car_data().add_distance()
+                driver_traces.append((int(lap['LapNumber']), lap['LapTime'].total_seconds(), car))
+            if driver_traces:
+                traces[driver] = driver_traces
+
+        if not traces:
+            raise ValueError("No lap telemetry available for this session")
+
+        # One grid for every driver, up to a typical lap length
+        lap_length = float(np.median([car['Distance'].iloc[-1] for laps in traces.values() for _, _, car in laps]))
+        distance = np.arange(0.0, lap_length, DISTANCE_STEP)
+
+        drivers = sorted(traces)
+        data = np.full((len(drivers), laps_per_driver, len(CHANNELS), len(distance)), np.nan, dtype=np.float32)
+        lap_numbers = []
+        lap_times = []
+        for i, driver in enumerate(drivers):
+            lap_numbers.append([n for n, _, _ in traces[driver]])
+            lap_times.append([t for _, t, _ in traces[driver]])
+            for j, (_, _, car) in enumerate(traces[driver]):
+                x = car['Distance'].to_numpy(dtype=float)
+                for c, channel in enumerate(CHANNELS):
+                    y = car[channel].to_numpy(dtype=float)
+                    # Laps a few metres short of the grid hold their last value
+                    data[i, j, c] = np.interp(distance, x, y)
+
+        # Write to a scratch directory and swap it in whole
+        target = self.path(year, round_number, session_type)
+        scratch = target.with_name(target.name + ".tmp")
+        shutil.rmtree(scratch, ignore_errors=True)
+        scratch.mkdir(parents=True)
+        np.save(scratch / "telemetry.npy", data)
+        np.save(scratch / "distance.npy", distance.astype(np.float32))
+        (scratch / "meta.json").write_text(json.dumps({
+            'version': TELEMETRY_STORE_VERSION,
+            'fastf1_version': fastf1.__version__,
+            'drivers': drivers,
+            'channels': CHANNELS,
+            'lap_numbers': lap_numbers,
+            'lap_times': lap_times,
+        }))
+        shutil.rmtree(target, ignore_errors=True)
+        scratch.rename(target)
+        return target
+
+    def load(self, year: int, round_number: int, session_type: str) -> tuple[np.ndarray, np.ndarray, dict]:
+        """(memory-mapped telemetry, distance grid, metadata)."""
+        path = self.path(year, round_number, session_type)
+        meta = json.loads((path / "meta.json").read_text())
+        data = np.load(path / "telemetry.npy", mmap_mode='r')
+        distance = np.load(path / "distance.npy")
+        return data, distance, meta
+
+    def compare(self, year: int, round_number: int, session_type: str,
+                drivers: list[str], lap: int = 0) -> TelemetryComparison:
+        """
+        Align drivers' laps from the store.
+
+        Args:
+            drivers: Driver abbreviations; the first is the time-delta reference
+            lap: 0 for each driver's fastest lap, 1 for the second fastest, ...
+                (below FASTEST_LAPS)
+        """
+        validate_lap(lap)
+        data, distance, meta = self.load(year, round_number, session_type)
+        validate_lap(lap, data.shape[1])
+        unknown = [d for d in drivers if d not in meta['drivers']]
+        if unknown:
+            raise ValueError(f"No telemetry for {', '.join(unknown)}")
+
+        rows = [meta['drivers'].index(d) for d in drivers]
+        laps = np.asarray(data[rows, lap])  # (driver, channel, distance), reads only these rows
+        speed = laps[:, CHANNELS.index('Speed')]
+
+        # Elapsed time along the lap from speed (km/h -> m/s); NaN if a driver has no such lap
+        metres_per_second = np.maximum(speed, 1.0) / 3.6
+        elapsed = np.cumsum(DISTANCE_STEP / metres_per_second, axis=1)
+
+        return TelemetryComparison(
+            race=f"{year} round {round_number}",
+            distance=distance,
+            drivers=list(drivers),
+            lap_numbers=[meta['lap_numbers'][r][lap] if lap < len(meta['lap_numbers'][r]) else None for r in rows],
+            lap_times=[meta['lap_times'][r][lap] if lap < len(meta['lap_times'][r]) else None for r in rows],
+            speed=speed,
+            throttle=laps[:, CHANNELS.index('Throttle')],
+            brake=laps[:, CHANNELS.index('Brake')],
+            gear=laps[:, CHANNELS.index('nGear')],
+            elapsed=elapsed,
+        )
+
+
+def mini_sector_summary(comparison: TelemetryComparison, sectors: int = 10) -> pd.DataFrame:
+    """
+    Fastest driver per mini-sector, from the integrated time along the lap.
+
+    Returns:
+        DataFrame with start_m, end_m, fastest driver and each driver's
+        time through the mini-sector
+    """
+    edges = np.linspace(0, len(comparison.distance) - 1, sectors + 1).round().astype(int)
+    sector_times = comparison.elapsed[:, edges[1:]] - comparison.elapsed[:, edges[:-1]]
+    summary = pd.DataFrame(sector_times.T, columns=comparison.drivers)
+    summary.insert(0, 'end_m', comparison.distance[edges[1:]].round())
+    summary.insert(0, 'start_m', comparison.distance[edges[:-1]].round())
+    fastest = np.where(np.isnan(sector_times), np.inf, sector_times).argmin(axis=0)
+    summary['fastest'] = [comparison.drivers[i] for i in fastest]
+    return summary
@@ -0,0 +1,209 @@
+"""
+Streaming Listing Loader for The Winning Formula Newsletter
+Reads listing JSON files one chunk at a time, keeps only the fields
+downstream code uses and drops malformed rows, so memory stays bounded by
+the chunk size whatever the file size.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Iterator, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Fields the analyzer, comparables and yield matrix read, and the types each
+# may hold (None is always allowed). price_text is not projected.
+ANALYZER_FIELDS = {
+    "url": (str,),
+    "title": (str,),
+    "price": (int, float),
+    "suburb": (str,),
+    "property_type": (str,),
+    "bedrooms": (int,),
+    "bathrooms": (int,),
+    "parking": (int,),
+    "size_sqm": (int, float),
+    "listing_type": (str,),
+    "scraped_at": (str,),
+}
+
+_FIELD_TYPES = tuple((name, frozenset(types)) for name, types in ANALYZER_FIELDS.items())
+
+CHUNK_SIZE = 1 << 20
+
+# orjson parses a batch of elements about 1.5x faster than json's C scanner
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Failed batch parses before falling back to decoding a single element
+_BATCH_RETRIES = 4
+
+# An element that fails to decode this far before the end of the buffer is
+# malformed rather than cut off by the chunk boundary
+_LOOKAHEAD = 64
+
+# Whitespace and commas between array elements
+_SEPARATORS = re.compile(rb"[\s,]*")
+_WHITESPACE = re.compile(rb"\s*")
+
+# What may follow the closing brace of an element
+_ELEMENT_END = re.compile(rb"\s*[,\]]")
+
+
+def _decode_error(msg: str, doc: str, pos: int, offset: int) -> json.JSONDecodeError:
+    """JSONDecodeError whose pos is the byte offset in the file, not in the read buffer."""
+    error = json.JSONDecodeError(msg, doc, min(pos, len(doc)))
+    error.pos = offset + pos
+    error.args = (f"{msg}: byte {error.pos} of the file",)
+    return error
+
+
+def _last_element_end(buf: bytes, lo: int, hi: int) -> int:
+    """Index just past the last '}' in buf[lo:hi] that is followed by ',' or ']', or -1."""
+    i = buf.rfind(b"}", lo, hi)
+    while i >= 0 and not _ELEMENT_END.match(buf, i + 1):
+        i = buf.rfind(b"}", lo, i)
+    return i + 1 if i >= 0 else -1
+
+
+def _parse_batch(buf: bytes, pos: int) -> tuple[list, int]:
+    """
+    Parse the complete elements at the start of buf[pos:] in one call.
+
+    Candidate cuts are found by scanning back for '},'. A cut that lands
+    inside a string or a nested object can never parse as an array, so a
+    successful parse always ends on an element boundary.
+
+    Returns:
+        (elements, end) with end the index after the last one, or ([], pos)
+    """
+    hi = len(buf)
+    for _ in range(_BATCH_RETRIES):
+        end = _last_element_end(buf, pos, hi)
+        if end < 0:
+            break
+        try:
+            return _loads(b"[" + buf[pos:end] + b"]"), end
+        except json.JSONDecodeError as e:
+            # Everything from the error onwards is suspect; the error position
+            # counts characters, which never exceeds the byte count
+            hi = min(end - 1, pos + max(e.pos - 1, 0))
+    return [], pos
+
+
+def iter_json_array(f, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """
+    Yield the elements of a top-level JSON array without loading the file.
+
+    The complete elements in each chunk are parsed in a single call (orjson
+    if installed, json otherwise); an element that spans a chunk boundary,
+    or a batch that will not parse, is decoded on its own with json's
+    raw_decode. The buffer only ever holds one chunk plus a partial element.
+
+    Args:
+        f: File opened in binary mode
+
+    Raises:
+        json.JSONDecodeError: At the file offset of a malformed element
+        ValueError: If the file is not a JSON array
+    """
+    decoder = json.JSONDecoder()
+    buf = f.read(chunk_size)
+    eof = not buf
+    offset = 0  # bytes of the file before buf[0]
+    pos = _WHITESPACE.match(buf, 0).end()
+
+    if buf[pos:pos + 1] != b"[":
+        raise ValueError("Expected a JSON array of listings")
+    pos += 1
+
+    while True:
+        pos = _SEPARATORS.match(buf, pos).end()
+        if buf[pos:pos + 1] == b"]":
+            return
+
+        items, end = _parse_batch(buf, pos)
+        if items:
+            yield from items
+            pos = end
+            continue
+
+        # Only trust a decode that ended before the buffer did (or at EOF),
+        # otherwise the element may have been cut off by the chunk boundary
+        text = buf[pos:].decode("utf-8", "surrogateescape")
+        try:
+            item, end = decoder.raw_decode(text)
+            complete = end < len(text) or eof
+        except json.JSONDecodeError as e:
+            # Unterminated strings are reported where they start, so only
+            # more input (or EOF) can tell them apart from a cut-off element
+            truncated = e.msg.startswith("Unterminated string") or e.pos + _LOOKAHEAD >= len(text)
+            if eof or not truncated:
+                byte_pos = len(text[:e.pos].encode("utf-8", "surrogateescape"))
+                raise _decode_error(e.msg, text, byte_pos, offset + pos) from None
+            complete = False
+
+        if complete:
+            yield item
+            pos += len(text[:end].encode("utf-8", "surrogateescape"))
+            continue
+
+        if eof:
+            raise _decode_error("Truncated JSON array", text, len(buf) - pos, offset + pos)
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        offset += pos
+        buf = buf[pos:] + chunk
+        pos = 0
+
+
+def project_listing(record) -> Optional[dict]:
+    """
+    Keep ANALYZER_FIELDS and check their types.
+
+    Returns:
+        Projected dict, or None if the record is not a valid listing
+    """
+    if type(record) is not dict:
+        return None
+
+    get = record.get
+    listing = {}
+    for name, types in _FIELD_TYPES:
+        value = get(name)
+        # Exact type check: also rejects bool, which is an int subclass
+        if value is not None and type(value) not in types:
+            if type(value) is float and int in types and value.is_integer():
+                value = int(value)
+            else:
+                return None
+        listing[name] = value
+    return listing
+
+
+class ListingStream:
+    """
+    Validated, projected listings streamed from a JSON file.
+
+    Iterating reads the file afresh; once a pass finishes, skipped holds the
+    number of rows it dropped as invalid.
+    """
+
+    def __init__(self, filepath: Path, chunk_size: int = CHUNK_SIZE):
+        self.filepath = Path(filepath)
+        self.chunk_size = chunk_size
+        self.skipped = 0
+
+    def __iter__(self) -> Iterator[dict]:
+        self.skipped = 0
+        with open(self.filepath, "rb") as f:
+            for record in iter_json_array(f, self.chunk_size):
+                listing = project_listing(record)
+                if listing is None:
+                    self.skipped += 1
+                    continue
+                yield listing
@@ -0,0 +1,392 @@
+"""
+Incremental Listing Statistics for The Winning Formula Newsletter
+Keeps per-(suburb, listing type, bedroom bucket) accumulators that are updated
+as listings are ingested, so current metrics can be read without rescanning
+every listing ever scraped.
+"""
+
+import json
+import math
+import random
+import re
+from dataclasses import asdict, dataclass, field, is_dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+BEDROOM_BUCKETS = ["studio", "1", "2", "3", "4+", "unknown"]
+
+
+def bedroom_bucket(bedrooms: Optional[int]) -> str:
+    """Map a bedroom count onto one of BEDROOM_BUCKETS."""
+    if bedrooms is None:
+        return "unknown"
+    if bedrooms <= 0:
+        return "studio"
+    if bedrooms >= 4:
+        return "4+"
+    return str(bedrooms)
+
+
+def parse_region(url: str) -> Optional[tuple[str, str]]:
+    """(city, province) slugs from a Property24 listing URL."""
+    match = re.search(r'/(?:to-rent|for-sale)/[^/]+/([^/]+)/([^/]+)/', url or "")
+    return (match.group(1), match.group(2)) if match else None
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL quantile sketch.
+
+    Level h holds items that each stand for 2**h observations. When the
+    sketch is full, the lowest full level is sorted and every other item is
+    promoted to the next level, so memory stays around 3k items regardless of
+    how many values have been seen. Until the first compaction the sketch is
+    exact.
+    """
+
+    def __init__(self, k: int = 200, c: float = 2 / 3):
+        self.k = k
+        self.c = c
+        self.levels: list[list[float]] = [[]]
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return int(math.ceil(self.k * self.c ** depth)) + 1
+
+    def _size(self) -> int:
+        return sum(len(items) for items in self.levels)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(h) for h in range(len(self.levels)))
+
+    def _compress(self):
+        while self._size() >= self._max_size():
+            for h, items in enumerate(self.levels):
+                if len(items) >= self._capacity(h):
+                    if h + 1 == len(self.levels):
+                        self.levels.append([])
+                    items.sort()
+                    # Keep an odd leftover at this level so weights stay exact
+                    keep = items[-1:] if len(items) % 2 else []
+                    pairs = items[:len(items) - len(keep)]
+                    self.levels[h + 1].extend(pairs[random.randint(0, 1)::2])
+                    self.levels[h] = keep
+                    break
+
+    def update(self, value: float):
+        """Add a single observation."""
+        self.levels[0].append(value)
+        if len(self.levels[0]) >= self._capacity(0):
+            self._compress()
+
+    def merge(self, other: "QuantileSketch"):
+        """Fold another sketch into this one."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for h, items in enumerate(other.levels):
+            self.levels[h].extend(items)
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-th quantile (0 <= q <= 1)."""
+        if len(self.levels) == 1:
+            # Still exact - interpolate like statistics.median does
+            values = sorted(self.levels[0])
+            if not values:
+                return None
+            pos = q * (len(values) - 1)
+            lower = int(math.floor(pos))
+            upper = min(lower + 1, len(values) - 1)
+            return values[lower] + (values[upper] - values[lower]) * (pos - lower)
+
+        weighted = sorted(
+            (value, 2 ** h) for h, items in enumerate(self.levels) for value in items
+        )
+        target = q * sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+    def to_dict(self) -> dict:
+        return {"k": self.k, "c": self.c, "levels": self.levels}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "QuantileSketch":
+        sketch = cls(k=data["k"], c=data["c"])
+        sketch.levels = [list(items) for items in data["levels"]] or [[]]
+        return sketch
+
+
+@dataclass
+class RunningStats:
+    """Welford mean/variance plus min, max and a quantile sketch."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def update(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.sketch.update(value)
+
+    def merge(self, other: "RunningStats"):
+        """Combine with another accumulator (Chan et al. parallel update)."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def std(self) -> Optional[float]:
+        """Sample standard deviation (matches statistics.stdev)."""
+        if self.count == 0:
+            return None
+        if self.count == 1:
+            return 0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.sketch.quantile(q) if self.count else None
+
+    @property
+    def median(self) -> Optional[float]:
+        return self.quantile(0.5)
+
+    def as_stats(self) -> dict:
+        """Same shape as SuburbAnalyzer._calculate_stats."""
+        if self.count == 0:
+            return {"avg": None, "median": None, "min": None, "max": None, "std": None}
+        return {
+            "avg": self.mean,
+            "median": self.median,
+            "min": self.min,
+            "max": self.max,
+            "std": self.std,
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min,
+            "max": self.max,
+            "sketch": self.sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunningStats":
+        return cls(
+            count=data["count"],
+            mean=data["mean"],
+            m2=data["m2"],
+            min=data["min"],
+            max=data["max"],
+            sketch=QuantileSketch.from_dict(data["sketch"]),
+        )
+
+
+@dataclass
+class SegmentAccumulator:
+    """Everything we track for one (suburb, listing_type, bedroom bucket)."""
+    listings: int = 0
+    prices: RunningStats = field(default_factory=RunningStats)
+    property_types: dict = field(default_factory=dict)
+
+    def update(self, listing: dict):
+        self.listings += 1
+        ptype = listing.get("property_type", "Unknown")
+        self.property_types[ptype] = self.property_types.get(ptype, 0) + 1
+        if listing.get("price"):
+            self.prices.update(listing["price"])
+
+    def merge(self, other: "SegmentAccumulator"):
+        self.listings += other.listings
+        self.prices.merge(other.prices)
+        for ptype, count in other.property_types.items():
+            self.property_types[ptype] = self.property_types.get(ptype, 0) + count
+
+    def to_dict(self) -> dict:
+        return {
+            "listings": self.listings,
+            "prices": self.prices.to_dict(),
+            "property_types": self.property_types,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SegmentAccumulator":
+        return cls(
+            listings=data["listings"],
+            prices=RunningStats.from_dict(data["prices"]),
+            property_types=dict(data["property_types"]),
+        )
+
+
+def bedroom_distribution(segments: Iterable[tuple[str, Optional[SegmentAccumulator]]]) -> dict:
+    """Turn (bucket, accumulator) pairs into SuburbMetrics.bedroom_distribution counts."""
+    counts = {}
+    for bucket, acc in segments:
+        if acc and bucket != "unknown":
+            key = "studio" if bucket == "studio" else f"{bucket} bed"
+            counts[key] = counts.get(key, 0) + acc.listings
+    return counts
+
+
+class ListingStatsStore:
+    """
+    Persisted collection of SegmentAccumulators.
+
+    Listings are deduplicated by URL so re-ingesting the same scrape does not
+    double count. The URLs live in their own file that is only read when
+    listings are ingested or merged, so reading a suburb loads the
+    accumulators alone and merges at most len(BEDROOM_BUCKETS) of them; the
+    cost does not grow with history. The city and province of each suburb
+    are remembered for region rollups.
+
+    The store only accumulates: listings are never forgotten once they go
+    off the market, and prices are not outlier-filtered (the filters need
+    the raw values). Its metrics therefore drift from
+    SuburbAnalyzer.analyze_suburb, which reads the latest scrape files and
+    drops price outliers.
+    """
+
+    FILENAME = "listing_stats.json"
+    URLS_FILENAME = "listing_stats_urls.txt"
+
+    def __init__(self, data_dir: str = "data"):
+        self.data_dir = Path(data_dir)
+        self.path = self.data_dir / self.FILENAME
+        self.urls_path = self.data_dir / self.URLS_FILENAME
+        self.segments: dict[tuple[str, str, str], SegmentAccumulator] = {}
+        self.regions: dict[str, tuple[str, str]] = {}
+        self._seen_urls: Optional[set[str]] = None
+        self._load()
+
+    @property
+    def seen_urls(self) -> set[str]:
+        """Every URL ingested so far (read from disk on first use)."""
+        if self._seen_urls is None:
+            self._seen_urls = set()
+            if self.urls_path.exists():
+                with open(self.urls_path) as f:
+                    self._seen_urls = {line.rstrip("\n") for line in f if line.strip()}
+        return self._seen_urls
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            data = json.load(f)
+        for row in data.get("segments", []):
+            key = (row["suburb"], row["listing_type"], row["bedrooms"])
+            self.segments[key] = SegmentAccumulator.from_dict(row["stats"])
+        self.regions = {suburb: tuple(region) for suburb, region in data.get("regions", {}).items()}
+        if "seen_urls" in data:
+            # Stores saved before the URLs moved to their own file
+            self.seen_urls.update(data["seen_urls"])
+
+    def save(self):
+        """Write the store back to disk."""
+        self.data_dir.mkdir(exist_ok=True)
+        data = {
+            "segments": [
+                {
+                    "suburb": suburb,
+                    "listing_type": listing_type,
+                    "bedrooms": bucket,
+                    "stats": acc.to_dict(),
+                }
+                for (suburb, listing_type, bucket), acc in sorted(self.segments.items())
+            ],
+            "regions": self.regions,
+        }
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+        # URLs were only loaded if something was ingested or merged
+        if self._seen_urls is not None:
+            with open(self.urls_path, "w") as f:
+                f.writelines(f"{url}\n" for url in sorted(self._seen_urls))
+        return self.path
+
+    def ingest(self, listings: Iterable) -> int:
+        """
+        Update accumulators with new listings.
+
+        Args:
+            listings: PropertyListing objects or listing dicts
+
+        Returns:
+            Number of listings that were new to the store
+        """
+        added = 0
+        for listing in listings:
+            if is_dataclass(listing):
+                listing = asdict(listing)
+            url = listing.get("url")
+            if url in self.seen_urls:
+                continue
+            if url:
+                self.seen_urls.add(url)
+                region = parse_region(url)
+                if region:
+                    self.regions[listing["suburb"]] = region
+
+            key = (
+                listing["suburb"],
+                listing["listing_type"],
+                bedroom_bucket(listing.get("bedrooms")),
+            )
+            if key not in self.segments:
+                self.segments[key] = SegmentAccumulator()
+            self.segments[key].update(listing)
+            added += 1
+        return added
+
+    def merge(self, other: "ListingStatsStore"):
+        """Fold in a store built by another run."""
+        for key, acc in other.segments.items():
+            if key not in self.segments:
+                self.segments[key] = SegmentAccumulator()
+            self.segments[key].merge(acc)
+        self.seen_urls |= other.seen_urls
+        self.regions.update(other.regions)
+
+    def suburbs(self) -> list[str]:
+        return sorted({suburb for suburb, _, _ in self.segments})
+
+    def segment(self, suburb: str, listing_type: str, bucket: str) -> Optional[SegmentAccumulator]:
+        return self.segments.get((suburb, listing_type, bucket))
+
+    def combined(self, suburb: str, listing_type: str) -> SegmentAccumulator:
+        """All bedroom buckets for a suburb and listing type merged together."""
+        total = SegmentAccumulator()
+        for bucket in BEDROOM_BUCKETS:
+            acc = self.segments.get((suburb, listing_type, bucket))
+            if acc:
+                total.merge(acc)
+        return total
+
+    def bedroom_distribution(self, suburb: str) -> dict:
+        """Listing counts per bedroom bucket, rentals and sales combined."""
+        return bedroom_distribution(
+            (bucket, self.segments.get((suburb, listing_type, bucket)))
+            for listing_type in ("rent", "sale")
+            for bucket in BEDROOM_BUCKETS
+        )
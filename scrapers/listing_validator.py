@@ -0,0 +1,136 @@
+"""
+Listing Validator for The Winning Formula Newsletter
+Checks scraped listings in whole batches before they are saved or ingested,
+and quarantines rows that fail with reason codes so bad scrapes are caught
+before they skew a report.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from property24_scraper import PropertyListing
+
+
+# Reason codes, in the order they are reported
+REASONS = [
+    "price_out_of_band",
+    "unknown_property_type",
+    "size_out_of_range",
+    "size_per_bedroom",
+    "too_many_bedrooms",
+    "duplicate_url",
+]
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating one batch of listings."""
+    valid: list
+    quarantined: list  # (listing, [reason codes]) pairs
+    reason_counts: dict = field(default_factory=dict)
+
+
+class ListingValidator:
+    """Vectorized plausibility rules for a batch of scraped listings."""
+
+    # Price bands in ZAR (rent is per month)
+    RENT_PRICE_BAND = (1_000, 250_000)
+    SALE_PRICE_BAND = (100_000, 200_000_000)
+
+    # Sizes outside this range are usually erf sizes or stray numbers from the page
+    SIZE_RANGE_SQM = (10, 2_000)
+    MIN_SQM_PER_BEDROOM = 9
+    MAX_SQM_PER_BEDROOM = 500
+    MAX_BEDROOMS = 20
+
+    QUARANTINE_DIR = "quarantine"
+
+    def __init__(self, data_dir: str = "data"):
+        self.data_dir = Path(data_dir)
+
+    def check(self, listings: list[Union[PropertyListing, dict]]) -> np.ndarray:
+        """
+        Run every rule over the batch at once.
+
+        Returns:
+            Boolean array of shape (len(listings), len(REASONS)), True where a
+            listing fails a rule
+        """
+        df = pd.DataFrame.from_records(
+            [listing if isinstance(listing, dict) else vars(listing) for listing in listings],
+            columns=["url", "price", "property_type", "bedrooms", "size_sqm", "listing_type"],
+        )
+        price = pd.to_numeric(df["price"], errors="coerce").to_numpy(dtype=float)
+        bedrooms = pd.to_numeric(df["bedrooms"], errors="coerce").to_numpy(dtype=float)
+        size = pd.to_numeric(df["size_sqm"], errors="coerce").to_numpy(dtype=float)
+        is_rent = (df["listing_type"] == "rent").to_numpy()
+
+        low = np.where(is_rent, self.RENT_PRICE_BAND[0], self.SALE_PRICE_BAND[0])
+        high = np.where(is_rent, self.RENT_PRICE_BAND[1], self.SALE_PRICE_BAND[1])
+        sqm_per_bedroom = size / np.maximum(bedrooms, 1)
+
+        # NaN comparisons are False, so missing values never fail a rule
+        with np.errstate(invalid="ignore"):
+            failures = np.column_stack([
+                (price < low) | (price > high),
+                df["property_type"].fillna("Unknown").eq("Unknown").to_numpy(),
+                (size < self.SIZE_RANGE_SQM[0]) | (size > self.SIZE_RANGE_SQM[1]),
+                (sqm_per_bedroom < self.MIN_SQM_PER_BEDROOM) | (sqm_per_bedroom > self.MAX_SQM_PER_BEDROOM),
+                bedrooms > self.MAX_BEDROOMS,
+                df["url"].duplicated(keep="first").to_numpy(),
+            ])
+        return failures
+
+    def validate(self, listings: list[Union[PropertyListing, dict]]) -> ValidationResult:
+        """Split a batch into valid and quarantined listings."""
+        if not listings:
+            return ValidationResult([], [])
+
+        failures = self.check(listings)
+        failed = failures.any(axis=1)
+        counts = failures.sum(axis=0)
+
+        valid = [listing for listing, bad in zip(listings, failed) if not bad]
+        quarantined = [
+            (listings[i], [REASONS[j] for j in np.flatnonzero(failures[i])])
+            for i in np.flatnonzero(failed)
+        ]
+        reason_counts = {reason: int(n) for reason, n in zip(REASONS, counts) if n}
+        return ValidationResult(valid, quarantined, reason_counts)
+
+    def quarantine(self, result: ValidationResult, source: str) -> Path:
+        """Append quarantined rows to data/quarantine/<source>.jsonl."""
+        quarantine_dir = self.data_dir / self.QUARANTINE_DIR
+        quarantine_dir.mkdir(parents=True, exist_ok=True)
+        path = quarantine_dir / f"{source}.jsonl"
+
+        quarantined_at = datetime.now().isoformat()
+        with open(path, "a") as f:
+            for listing, reasons in result.quarantined:
+                row = listing if isinstance(listing, dict) else vars(listing)
+                f.write(json.dumps({"reasons": reasons, "quarantined_at": quarantined_at, **row}) + "\n")
+        return path
+
+    def screen(self, listings: list[PropertyListing], source: str) -> list[PropertyListing]:
+        """
+        Validate a scraped batch, quarantine failures and report them.
+
+        Args:
+            listings: Listings straight from the scraper
+            source: Name for the quarantine file, e.g. "kenilworth_rentals"
+
+        Returns:
+            The listings that passed every rule
+        """
+        result = self.validate(listings)
+        if result.quarantined:
+            path = self.quarantine(result, source)
+            reasons = ", ".join(f"{reason} {n}" for reason, n in result.reason_counts.items())
+            print(f"Quarantined {len(result.quarantined)} of {len(listings)} listings ({reasons}) -> {path}")
+        return result.valid
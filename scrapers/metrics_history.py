@@ -0,0 +1,163 @@
+"""
+Metrics History for The Winning Formula Newsletter
+Append-only record of SuburbMetrics snapshots with trend queries, so trend
+pieces don't need re-scraping or hand-kept spreadsheets.
+"""
+
+import csv
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from suburb_analyzer import SuburbMetrics
+
+
+HISTORY_FIELDS = [
+    "recorded_at",
+    "rental_count",
+    "sales_count",
+    "median_rent",
+    "median_price",
+    "avg_rent",
+    "avg_price",
+    "gross_yield",
+    "net_yield",
+    "price_to_rent",
+]
+
+NUMERIC_FIELDS = HISTORY_FIELDS[1:]
+
+
+class MetricsHistory:
+    """
+    One CSV per suburb under ``data/history``.
+
+    Each analysis run appends a single compact row, so a trend query only
+    reads that suburb's history and never touches raw listings. Only
+    metrics computed from the scrape files are recorded; store-derived
+    metrics (analyze --from-store) differ by construction and are kept out.
+    """
+
+    def __init__(self, data_dir: str = "data"):
+        self.history_dir = Path(data_dir) / "history"
+
+    def _path(self, suburb: str) -> Path:
+        return self.history_dir / f"{suburb}.csv"
+
+    def record(self, metrics: SuburbMetrics, recorded_at: Optional[datetime] = None) -> Path:
+        """Append a snapshot row for one suburb."""
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(metrics.suburb)
+        is_new = not path.exists()
+
+        row = {
+            "recorded_at": (recorded_at or datetime.now()).isoformat(timespec="seconds"),
+            "rental_count": metrics.rental_count,
+            "sales_count": metrics.sales_count,
+            "median_rent": metrics.median_rent,
+            "median_price": metrics.median_price,
+            "avg_rent": metrics.avg_rent,
+            "avg_price": metrics.avg_price,
+            "gross_yield": metrics.gross_yield,
+            "net_yield": metrics.estimated_net_yield,
+            "price_to_rent": metrics.price_to_rent_ratio,
+        }
+
+        with open(path, "a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=HISTORY_FIELDS)
+            if is_new:
+                writer.writeheader()
+            writer.writerow(row)
+        return path
+
+    def suburbs(self) -> list[str]:
+        """Suburbs that have at least one recorded snapshot."""
+        if not self.history_dir.exists():
+            return []
+        return sorted(path.stem for path in self.history_dir.glob("*.csv"))
+
+    def rows(self, suburb: str, since: Optional[datetime] = None,
+             until: Optional[datetime] = None) -> list[dict]:
+        """
+        Snapshots for a suburb in chronological order.
+
+        Args:
+            suburb: Suburb name
+            since: Only rows recorded at or after this time
+            until: Only rows recorded at or before this time
+
+        Returns:
+            List of dicts with recorded_at as datetime and numeric fields as float/None
+        """
+        path = self._path(suburb)
+        if not path.exists():
+            return []
+
+        rows = []
+        with open(path, newline="") as f:
+            for raw in csv.DictReader(f):
+                recorded_at = datetime.fromisoformat(raw["recorded_at"])
+                if since and recorded_at < since:
+                    continue
+                if until and recorded_at > until:
+                    continue
+                row = {"recorded_at": recorded_at}
+                for key in NUMERIC_FIELDS:
+                    row[key] = float(raw[key]) if raw.get(key) else None
+                rows.append(row)
+        return rows
+
+    def trend(self, suburb: str, months: Optional[int] = None,
+              since: Optional[datetime] = None, until: Optional[datetime] = None) -> list[dict]:
+        """
+        Monthly rent/price/yield trajectory with month-on-month change.
+
+        The latest snapshot in each calendar month represents that month.
+
+        Args:
+            suburb: Suburb name
+            months: Keep only the most recent N months
+            since: Only rows recorded at or after this time
+            until: Only rows recorded at or before this time
+
+        Returns:
+            List of dicts with month, median_rent, median_price, gross_yield,
+            net_yield and *_mom changes (% for rent/price, points for yields)
+        """
+        monthly = {}
+        for row in self.rows(suburb, since, until):
+            monthly[row["recorded_at"].strftime("%Y-%m")] = row
+
+        points = [
+            {
+                "month": month,
+                "median_rent": row["median_rent"],
+                "median_price": row["median_price"],
+                "gross_yield": row["gross_yield"],
+                "net_yield": row["net_yield"],
+            }
+            for month, row in sorted(monthly.items())
+        ]
+        previous = None
+        for point in points:
+            for key in ("median_rent", "median_price"):
+                point[f"{key}_mom"] = _pct_change(previous and previous[key], point[key])
+            for key in ("gross_yield", "net_yield"):
+                point[f"{key}_mom"] = (
+                    point[key] - previous[key]
+                    if previous and previous[key] is not None and point[key] is not None
+                    else None
+                )
+            previous = point
+
+        # Slice after the MoM pass so the first month shown still has its change
+        if months:
+            points = points[-months:]
+        return points
+
+
+def _pct_change(old: Optional[float], new: Optional[float]) -> Optional[float]:
+    """Percentage change, or None if either side is missing."""
+    if not old or new is None:
+        return None
+    return (new - old) / old * 100
@@ -0,0 +1,206 @@
+"""
+Metrics Service for The Winning Formula Newsletter
+Small local HTTP service that answers suburb metric queries for the web
+calculator and premium tools. Metrics for every suburb are computed once and
+held in memory with sorted indexes, and rebuilt when the data files change.
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+from suburb_analyzer import SuburbAnalyzer, SuburbMetrics
+
+
+# Numeric SuburbMetrics fields that support top-k and range queries
+INDEXED_FIELDS = [
+    "gross_yield",
+    "estimated_net_yield",
+    "median_rent",
+    "median_price",
+    "price_to_rent_ratio",
+    "rental_count",
+    "sales_count",
+]
+
+
+class MetricsIndex:
+    """
+    Immutable snapshot of metrics for every suburb.
+
+    Each indexed field keeps a list of (value, suburb) pairs sorted by value,
+    so top-k is a slice and range queries are two bisects. Responses for
+    single suburbs are serialized up front.
+    """
+
+    def __init__(self, metrics: list[SuburbMetrics], signature: tuple = ()):
+        self.signature = signature
+        self.built_at = time.time()
+        self.metrics = {m.suburb: asdict(m) for m in metrics}
+        self.payloads = {suburb: json.dumps(row).encode() for suburb, row in self.metrics.items()}
+        self.sorted = {}
+        for name in INDEXED_FIELDS:
+            pairs = sorted((row[name], suburb) for suburb, row in self.metrics.items() if row[name] is not None)
+            self.sorted[name] = ([value for value, _ in pairs], [suburb for _, suburb in pairs])
+
+    @classmethod
+    def build(cls, analyzer: SuburbAnalyzer) -> "MetricsIndex":
+        signature = data_signature(analyzer.data_dir)
+        return cls([analyzer.analyze_suburb(suburb) for suburb in analyzer.available_suburbs()], signature)
+
+    def top(self, field: str, k: int = 10, ascending: bool = False) -> list[dict]:
+        values, suburbs = self.sorted[field]
+        picked = suburbs[:k] if ascending else suburbs[::-1][:k]
+        return [self.metrics[suburb] for suburb in picked]
+
+    def range(self, field: str, low: Optional[float] = None, high: Optional[float] = None) -> list[dict]:
+        values, suburbs = self.sorted[field]
+        start = bisect_left(values, low) if low is not None else 0
+        end = bisect_right(values, high) if high is not None else len(values)
+        return [self.metrics[suburb] for suburb in suburbs[start:end]]
+
+
+def data_signature(data_dir: Path) -> tuple:
+    """(name, mtime, size) of every listing file, to detect changes cheaply."""
+    files = sorted(Path(data_dir).glob("*_rentals.json")) + sorted(Path(data_dir).glob("*_sales.json"))
+    return tuple((f.name, f.stat().st_mtime_ns, f.stat().st_size) for f in files)
+
+
+class MetricsService:
+    """
+    Holds the current MetricsIndex and swaps in a rebuilt one when the
+    listing files change. Rebuilds run on a background thread; queries keep
+    using the previous snapshot until the new one is ready.
+    """
+
+    def __init__(self, analyzer: SuburbAnalyzer, check_interval: float = 5.0):
+        self.analyzer = analyzer
+        self.check_interval = check_interval
+        self.index = MetricsIndex.build(analyzer)
+        self._last_check = time.monotonic()
+        self._rebuilding = threading.Lock()
+
+    def current(self) -> MetricsIndex:
+        """Return the live index, kicking off a rebuild if the data changed."""
+        now = time.monotonic()
+        if now - self._last_check >= self.check_interval:
+            self._last_check = now
+            if data_signature(self.analyzer.data_dir) != self.index.signature and self._rebuilding.acquire(blocking=False):
+                threading.Thread(target=self._rebuild, daemon=True).start()
+        return self.index
+
+    def _rebuild(self):
+        try:
+            self.index = MetricsIndex.build(self.analyzer)
+            print(f"Reloaded metrics for {len(self.index.metrics)} suburbs")
+        except Exception as e:
+            print(f"Error reloading metrics: {e}")
+        finally:
+            self._rebuilding.release()
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """
+    Routes:
+        GET /suburbs                     names of all suburbs
+        GET /suburbs/<name>              metrics for one suburb
+        GET /top?field=gross_yield&k=10&order=desc
+        GET /range?field=median_price&min=1000000&max=2500000
+        GET /health                      suburb count and index age
+    """
+
+    service: MetricsService  # set by serve()
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self._cors_headers()
+        self.end_headers()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [unquote(p) for p in url.path.strip("/").split("/") if p]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        index = self.service.current()
+
+        try:
+            if parts == ["suburbs"]:
+                self._send_json(sorted(index.metrics))
+            elif len(parts) == 2 and parts[0] == "suburbs":
+                payload = index.payloads.get(parts[1].lower())
+                if payload is None:
+                    self._send_error(404, f"Unknown suburb: {parts[1]}")
+                else:
+                    self._send_bytes(payload)
+            elif parts == ["top"]:
+                field = self._field(query)
+                k = int(query.get("k", 10))
+                self._send_json(index.top(field, k, ascending=query.get("order") == "asc"))
+            elif parts == ["range"]:
+                field = self._field(query)
+                low = float(query["min"]) if "min" in query else None
+                high = float(query["max"]) if "max" in query else None
+                self._send_json(index.range(field, low, high))
+            elif parts == ["health"]:
+                self._send_json({"suburbs": len(index.metrics), "age_seconds": round(time.time() - index.built_at, 1)})
+            else:
+                self._send_error(404, "Not found")
+        except ValueError as e:
+            self._send_error(400, str(e))
+
+    def _field(self, query: dict) -> str:
+        field = query.get("field", "gross_yield")
+        if field not in INDEXED_FIELDS:
+            raise ValueError(f"field must be one of {', '.join(INDEXED_FIELDS)}")
+        return field
+
+    def _cors_headers(self):
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+
+    def _send_bytes(self, body: bytes, status: int = 200):
+        self.send_response(status)
+        self._cors_headers()
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, data, status: int = 200):
+        self._send_bytes(json.dumps(data).encode(), status)
+
+    def _send_error(self, status: int, message: str):
+        self._send_json({"error": message}, status)
+
+    def log_message(self, format, *args):
+        # Keep the console quiet; interactive tools poll often
+        pass
+
+
+def serve(data_dir: str = "data", host: str = "127.0.0.1", port: int = 8024, check_interval: float = 5.0):
+    """
+    Serve suburb metrics over HTTP until interrupted.
+
+    Args:
+        data_dir: Directory holding the scraped listing files
+        host: Interface to bind
+        port: Port to listen on
+        check_interval: Seconds between checks for changed data files
+    """
+    print("Building metrics index...")
+    service = MetricsService(SuburbAnalyzer(data_dir), check_interval)
+    handler = type("Handler", (MetricsRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"Serving {len(service.index.metrics)} suburbs on http://{host}:{port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -423,9 +423,9 @@ class Property24Scraper:
         return all_listings
 
 
-def save_listings(listings: list[PropertyListing], filename: str):
-    """Save listings to JSON file."""
-    output_dir = Path(__file__).parent / "data"
+def save_listings(listings: list[PropertyListing], filename: str, output_dir: Optional[Path] = None):
+    """Save listings to JSON file (in scrapers/data unless output_dir is given)."""
+    output_dir = Path(output_dir) if output_dir else Path(__file__).parent / "data"
     output_dir.mkdir(exist_ok=True)
 
     filepath = output_dir / filename
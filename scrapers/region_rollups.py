@@ -0,0 +1,111 @@
+"""
+Region Rollups for The Winning Formula Newsletter
+Precomputed suburb -> city -> province aggregates, built once per ingest by
+merging the per-suburb accumulators from ListingStatsStore.
+"""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+from listing_stats import BEDROOM_BUCKETS, ListingStatsStore, SegmentAccumulator, bedroom_distribution
+
+
+LEVELS = ["suburb", "city", "province"]
+ALL_BEDROOMS = "all"
+
+
+class RegionRollups:
+    """
+    Aggregate cube over (level, region, listing_type, bedroom bucket).
+
+    Every cell is a SegmentAccumulator, and an extra "all" bedroom bucket is
+    stored per region and listing type, so any lookup is a single dict read.
+    """
+
+    FILENAME = "region_rollups.json"
+
+    def __init__(self, data_dir: str = "data"):
+        self.path = Path(data_dir) / self.FILENAME
+        self.cells: dict[tuple[str, str, str, str], SegmentAccumulator] = {}
+        self.parents: dict[tuple[str, str], tuple[str, str]] = {}
+
+    @classmethod
+    def build(cls, store: ListingStatsStore) -> "RegionRollups":
+        """Merge every suburb segment into its suburb, city and province cells."""
+        rollups = cls(store.data_dir)
+
+        for (suburb, listing_type, bucket), acc in store.segments.items():
+            city, province = store.regions.get(suburb, ("unknown", "unknown"))
+            rollups.parents[("suburb", suburb)] = ("city", city)
+            rollups.parents[("city", city)] = ("province", province)
+
+            for level, name in zip(LEVELS, (suburb, city, province)):
+                for cell_bucket in (bucket, ALL_BEDROOMS):
+                    key = (level, name, listing_type, cell_bucket)
+                    if key not in rollups.cells:
+                        rollups.cells[key] = SegmentAccumulator()
+                    rollups.cells[key].merge(acc)
+
+        return rollups
+
+    @classmethod
+    def load(cls, data_dir: str = "data") -> "RegionRollups":
+        rollups = cls(data_dir)
+        if not rollups.path.exists():
+            return rollups
+        with open(rollups.path) as f:
+            data = json.load(f)
+        for row in data["cells"]:
+            key = (row["level"], row["name"], row["listing_type"], row["bedrooms"])
+            rollups.cells[key] = SegmentAccumulator.from_dict(row["stats"])
+        for row in data["parents"]:
+            rollups.parents[(row["level"], row["name"])] = (row["parent_level"], row["parent"])
+        return rollups
+
+    def save(self) -> Path:
+        data = {
+            "cells": [
+                {
+                    "level": level,
+                    "name": name,
+                    "listing_type": listing_type,
+                    "bedrooms": bucket,
+                    "stats": acc.to_dict(),
+                }
+                for (level, name, listing_type, bucket), acc in sorted(self.cells.items())
+            ],
+            "parents": [
+                {"level": level, "name": name, "parent_level": parent_level, "parent": parent}
+                for (level, name), (parent_level, parent) in sorted(self.parents.items())
+            ],
+        }
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+        return self.path
+
+    def get(self, level: str, name: str, listing_type: str,
+            bedrooms: str = ALL_BEDROOMS) -> Optional[SegmentAccumulator]:
+        return self.cells.get((level, name, listing_type, bedrooms))
+
+    def regions(self, level: str) -> list[str]:
+        return sorted({name for lvl, name, _, _ in self.cells if lvl == level})
+
+    def children(self, level: str, name: str) -> list[tuple[str, str]]:
+        """(level, name) of the regions directly below this one."""
+        return sorted(child for child, parent in self.parents.items() if parent == (level, name))
+
+    def find(self, name: str) -> Optional[str]:
+        """Level a region name belongs to, checking suburb, then city, then province."""
+        for level in LEVELS:
+            if (level, name, "rent", ALL_BEDROOMS) in self.cells or (level, name, "sale", ALL_BEDROOMS) in self.cells:
+                return level
+        return None
+
+    def bedroom_distribution(self, level: str, name: str) -> dict:
+        """Listing counts per bedroom bucket, rentals and sales combined."""
+        return bedroom_distribution(
+            (bucket, self.get(level, name, listing_type, bucket))
+            for listing_type in ("rent", "sale")
+            for bucket in BEDROOM_BUCKETS
+        )
@@ -0,0 +1,139 @@
+"""
+Robust Statistics for The Winning Formula Newsletter
+Linear-time medians and outlier filtering for scraped prices, which regularly
+contain junk such as a listing ID glued onto the price text.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Modified z-score cut-off (Iglewicz & Hoaglin) and Tukey fence multiplier
+MAD_THRESHOLD = 3.5
+IQR_MULTIPLIER = 1.5
+
+# 0.6745 scales MAD to the standard deviation of a normal distribution
+MAD_SCALE = 0.6745
+
+
+def select_quantile(values: np.ndarray, q: float) -> Optional[float]:
+    """
+    q-th quantile using np.partition (introselect, O(n)) instead of a full sort.
+    Uses the same linear interpolation as np.percentile / statistics.median.
+    """
+    n = len(values)
+    if n == 0:
+        return None
+    pos = q * (n - 1)
+    lower = int(np.floor(pos))
+    upper = min(lower + 1, n - 1)
+    part = np.partition(values, [lower, upper])
+    return float(part[lower] + (part[upper] - part[lower]) * (pos - lower))
+
+
+def fast_median(values: np.ndarray) -> Optional[float]:
+    return select_quantile(values, 0.5)
+
+
+def median_abs_deviation(values: np.ndarray, median: Optional[float] = None) -> Optional[float]:
+    """Median absolute deviation from the median, both found by selection."""
+    if len(values) == 0:
+        return None
+    if median is None:
+        median = fast_median(values)
+    return fast_median(np.abs(values - median))
+
+
+def outlier_mask(values, method: str = "mad", log: bool = True) -> np.ndarray:
+    """
+    Flag outliers in one group of values.
+
+    Args:
+        values: Prices (any array-like)
+        method: "mad" (modified z-score > MAD_THRESHOLD) or "iqr" (Tukey fences)
+        log: Test on log prices - property prices are right-skewed, so this
+            keeps genuine expensive homes while catching order-of-magnitude junk
+
+    Returns:
+        Boolean array, True where the value is an outlier
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) < 3:
+        return np.zeros(len(values), dtype=bool)
+    x = np.log(values) if log else values
+
+    if method == "mad":
+        median = fast_median(x)
+        mad = median_abs_deviation(x, median)
+        if not mad:
+            return np.zeros(len(values), dtype=bool)
+        return MAD_SCALE * np.abs(x - median) / mad > MAD_THRESHOLD
+
+    if method == "iqr":
+        q1, q3 = select_quantile(x, 0.25), select_quantile(x, 0.75)
+        spread = (q3 - q1) * IQR_MULTIPLIER
+        return (x < q1 - spread) | (x > q3 + spread)
+
+    raise ValueError(f"Unknown outlier method: {method}")
+
+
+def outlier_mask_grouped(values: pd.Series, groups, method: str = "mad", log: bool = True) -> pd.Series:
+    """
+    Vectorized outlier_mask applied separately within each group
+    (e.g. listing_type or [suburb, listing_type]) across millions of rows.
+    """
+    x = np.log(values) if log else values.astype(float)
+    grouped = x.groupby(groups, observed=True)
+
+    if method == "mad":
+        median = grouped.transform("median")
+        deviation = (x - median).abs()
+        mad = deviation.groupby(groups, observed=True).transform("median")
+        score = MAD_SCALE * deviation / mad.where(mad > 0)
+        mask = score > MAD_THRESHOLD
+    elif method == "iqr":
+        q1 = grouped.transform("quantile", 0.25)
+        q3 = grouped.transform("quantile", 0.75)
+        spread = (q3 - q1) * IQR_MULTIPLIER
+        mask = (x < q1 - spread) | (x > q3 + spread)
+    else:
+        raise ValueError(f"Unknown outlier method: {method}")
+
+    # Match outlier_mask: groups too small to judge are left alone
+    sizes = grouped.transform("size")
+    return mask & (sizes >= 3)
+
+
+def robust_stats(values, method: str = "mad") -> dict:
+    """
+    Summary statistics after dropping outliers.
+
+    Returns:
+        Dict with avg, median, min, max, std (sample) and outliers (count removed)
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[values > 0]
+    outliers = outlier_mask(values, method)
+    kept = values[~outliers]
+
+    if len(kept) == 0:
+        return {"avg": None, "median": None, "min": None, "max": None, "std": None,
+                "outliers": int(outliers.sum())}
+
+    return {
+        "avg": float(kept.mean()),
+        "median": fast_median(kept),
+        "min": float(kept.min()),
+        "max": float(kept.max()),
+        "std": float(kept.std(ddof=1)) if len(kept) > 1 else 0,
+        "outliers": int(outliers.sum()),
+    }
+
+
+def drop_outliers(values, method: str = "mad") -> np.ndarray:
+    """Positive values with outliers removed (the sample robust_stats summarises)."""
+    values = np.asarray(values, dtype=float)
+    values = values[values > 0]
+    return values[~outlier_mask(values, method)]
@@ -3,11 +3,19 @@ Suburb Analysis Module for The Winning Formula Newsletter
 Calculates yield, market metrics, and investment insights from scraped data.
 """
 
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
-import statistics
+from typing import Iterator, Optional
+
+import pandas as pd
+
+from bootstrap import bootstrap_yield_cis
+from comparables import ComparableSalesIndex, comparables_frame
+from listing_loader import ListingStream
+from listing_stats import ListingStatsStore, SegmentAccumulator
+from region_rollups import RegionRollups
+from robust_stats import drop_outliers, outlier_mask_grouped, robust_stats
+from yield_matrix import LISTING_COLUMNS, listings_frame, segment_medians
 
 
 @dataclass
@@ -42,6 +50,18 @@ class SuburbMetrics:
     # Market signals
     price_to_rent_ratio: Optional[float]
 
+    # Listings dropped as price outliers before computing stats
+    rent_outliers: int = 0
+    price_outliers: int = 0
+
+    # Bootstrap confidence intervals as (low, high), see SuburbAnalyzer.CONFIDENCE
+    median_rent_ci: Optional[tuple] = None
+    median_price_ci: Optional[tuple] = None
+    gross_yield_ci: Optional[tuple] = None
+
+    # Yields per (bedrooms x property_type) cell, see SuburbAnalyzer.segment_yield_matrix
+    segment_yields: list = field(default_factory=list)
+
 
 class SuburbAnalyzer:
     """Analyzes property data to generate investment insights."""
@@ -53,29 +73,67 @@ class SuburbAnalyzer:
     INSURANCE_RATE = 0.002  # 0.2% of property value
     RATES_ESTIMATE = 0.005  # 0.5% of property value (varies by area)
 
+    # Minimum priced listings per side before a segment yield is reported
+    MIN_SEGMENT_SAMPLES = 3
+
+    # Price outlier filter applied per listing type: "mad" or "iqr"
+    OUTLIER_METHOD = "mad"
+
+    # Bootstrap settings for the confidence intervals on medians and yield
+    BOOTSTRAP_RESAMPLES = 2000
+    CONFIDENCE = 0.90
+
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
+        # Invalid rows dropped per file, for the caller to report
+        self.skipped_rows: dict[str, int] = {}
 
-    def load_listings(self, filename: str) -> list[dict]:
-        """Load listings from JSON file."""
+    def iter_listings(self, filename: str) -> Iterator[dict]:
+        """Stream validated listings from a JSON file with bounded memory."""
         filepath = self.data_dir / filename
         if not filepath.exists():
-            return []
-        with open(filepath) as f:
-            return json.load(f)
+            return
+        stream = ListingStream(filepath)
+        yield from stream
+        if stream.skipped:
+            self.skipped_rows[filename] = stream.skipped
+
+    def load_listings(self, filename: str) -> list[dict]:
+        """Load listings from JSON file (only the fields the analyzer uses)."""
+        return list(self.iter_listings(filename))
+
+    def available_suburbs(self) -> list[str]:
+        """Suburbs that have scraped rental or sales files in data_dir."""
+        suburbs = set()
+        for suffix in ("_rentals.json", "_sales.json"):
+            for path in self.data_dir.glob(f"*{suffix}"):
+                suburbs.add(path.name[:-len(suffix)])
+        return sorted(suburbs)
+
+    def iter_suburb_listings(self, suburbs: Optional[list[str]] = None) -> Iterator[dict]:
+        """Stream rentals and sales for several suburbs (default: all), tagged with their suburb."""
+        for suburb in suburbs or self.available_suburbs():
+            for filename in (f"{suburb}_rentals.json", f"{suburb}_sales.json"):
+                for listing in self.iter_listings(filename):
+                    listing["suburb"] = suburb
+                    yield listing
+
+    def load_suburb_listings(self, suburbs: Optional[list[str]] = None) -> list[dict]:
+        """Rentals and sales for several suburbs (default: all), tagged with their suburb."""
+        return list(self.iter_suburb_listings(suburbs))
+
+    def _segment_rows(self, suburb: str, filename: str) -> list[dict]:
+        """Stream a listing file down to the LISTING_COLUMNS analyze_suburb reads."""
+        rows = []
+        for listing in self.iter_listings(filename):
+            row = {name: listing.get(name) for name in LISTING_COLUMNS}
+            row["suburb"] = suburb
+            rows.append(row)
+        return rows
 
     def _calculate_stats(self, values: list[float]) -> dict:
-        """Calculate basic statistics for a list of values."""
-        if not values:
-            return {"avg": None, "median": None, "min": None, "max": None, "std": None}
-
-        return {
-            "avg": statistics.mean(values),
-            "median": statistics.median(values),
-            "min": min(values),
-            "max": max(values),
-            "std": statistics.stdev(values) if len(values) > 1 else 0
-        }
+        """Calculate basic statistics for a list of values, excluding price outliers."""
+        return robust_stats(values, self.OUTLIER_METHOD)
 
     def _count_property_types(self, listings: list[dict]) -> dict:
         """Count listings by property type."""
@@ -95,6 +153,91 @@ class SuburbAnalyzer:
                 counts[key] = counts.get(key, 0) + 1
         return counts
 
+    def _net_yield(self, annual_rent, price):
+        """Net yield % after typical expenses. Works on floats and NumPy/pandas arrays."""
+        effective_rent = annual_rent * (1 - self.VACANCY_RATE)
+        management_cost = effective_rent * self.MANAGEMENT_FEE
+        maintenance_cost = price * self.MAINTENANCE_RATE
+        insurance_cost = price * self.INSURANCE_RATE
+        rates_cost = price * self.RATES_ESTIMATE
+
+        net_income = effective_rent - management_cost - maintenance_cost - insurance_cost - rates_cost
+        return (net_income / price) * 100
+
+    def _segment_yields(self, listings: pd.DataFrame, min_samples: int) -> pd.DataFrame:
+        """Add gross/net yield columns to segment_medians output."""
+        priced = listings[listings["price"] > 0]
+        outliers = outlier_mask_grouped(priced["price"], [priced["suburb"], priced["listing_type"]],
+                                        self.OUTLIER_METHOD)
+        cells = segment_medians(priced[~outliers], min_samples)
+        annual_rent = cells["median_rent"] * 12
+        cells["gross_yield"] = annual_rent / cells["median_price"] * 100
+        cells["net_yield"] = self._net_yield(annual_rent, cells["median_price"])
+        return cells.reset_index()
+
+    def segment_yield_matrix(self, suburbs: Optional[list[str]] = None,
+                             min_samples: Optional[int] = None) -> pd.DataFrame:
+        """
+        Yields for every (suburb, bedrooms, property_type) cell in one grouped pass.
+
+        Args:
+            suburbs: Suburbs to include (defaults to every suburb in data_dir)
+            min_samples: Minimum priced rentals and sales per cell
+                (defaults to MIN_SEGMENT_SAMPLES)
+
+        Returns:
+            DataFrame with one row per cell: suburb, bedrooms, property_type,
+            rentals, sales, median_rent, median_price, gross_yield, net_yield
+        """
+        if min_samples is None:
+            min_samples = self.MIN_SEGMENT_SAMPLES
+
+        listings = self.iter_suburb_listings(suburbs)
+        return self._segment_yields(listings_frame(listings), min_samples)
+
+    def listing_yields(self, suburbs: Optional[list[str]] = None, k: int = 5) -> pd.DataFrame:
+        """
+        Per-listing yield estimates from comparable sales.
+
+        Each rental is matched to its k most similar sales (suburb, property
+        type, bedrooms, bathrooms, size) and priced at their median.
+
+        Args:
+            suburbs: Suburbs to include (defaults to every suburb in data_dir)
+            k: Comparable sales per rental
+
+        Returns:
+            DataFrame of rentals with est_price, comps, match_level,
+            gross_yield and net_yield, best gross yield first
+        """
+        listings = comparables_frame(self.iter_suburb_listings(suburbs))
+        index = ComparableSalesIndex(listings[listings["listing_type"] == "sale"])
+        matched = index.match(listings[listings["listing_type"] == "rent"], k)
+
+        annual_rent = matched["price"] * 12
+        matched["gross_yield"] = annual_rent / matched["est_price"] * 100
+        matched["net_yield"] = self._net_yield(annual_rent, matched["est_price"])
+        matched["bedrooms"] = matched["bedrooms"].where(matched["bedrooms"] >= 0)
+        return matched.sort_values("gross_yield", ascending=False, na_position="last")
+
+    def _calculate_yields(self, median_rent: Optional[float], median_price: Optional[float]) -> tuple:
+        """Return (gross_yield, net_yield, price_to_rent) for a monthly rent and a price."""
+        if not median_rent or not median_price:
+            return None, None, None
+
+        annual_rent = median_rent * 12
+
+        # Gross yield
+        gross_yield = (annual_rent / median_price) * 100
+
+        # Net yield (after typical expenses)
+        net_yield = self._net_yield(annual_rent, median_price)
+
+        # Price to rent ratio (years of rent to buy)
+        price_to_rent = median_price / annual_rent
+
+        return gross_yield, net_yield, price_to_rent
+
     def analyze_suburb(self, suburb: str) -> SuburbMetrics:
         """
         Analyze a suburb using scraped rental and sales data.
@@ -105,9 +248,9 @@ class SuburbAnalyzer:
         Returns:
             SuburbMetrics with comprehensive analysis
         """
-        # Load data
-        rentals = self.load_listings(f"{suburb}_rentals.json")
-        sales = self.load_listings(f"{suburb}_sales.json")
+        # Stream each file once, keeping only the columns used below
+        rentals = self._segment_rows(suburb, f"{suburb}_rentals.json")
+        sales = self._segment_rows(suburb, f"{suburb}_sales.json")
 
         # Extract prices
         rental_prices = [r["price"] for r in rentals if r.get("price")]
@@ -118,35 +261,33 @@ class SuburbAnalyzer:
         sale_stats = self._calculate_stats(sale_prices)
 
         # Calculate yields
-        gross_yield = None
-        net_yield = None
-        price_to_rent = None
-
-        if rental_stats["median"] and sale_stats["median"]:
-            annual_rent = rental_stats["median"] * 12
-            median_price = sale_stats["median"]
-
-            # Gross yield
-            gross_yield = (annual_rent / median_price) * 100
-
-            # Net yield (after typical expenses)
-            effective_rent = annual_rent * (1 - self.VACANCY_RATE)
-            management_cost = effective_rent * self.MANAGEMENT_FEE
-            maintenance_cost = median_price * self.MAINTENANCE_RATE
-            insurance_cost = median_price * self.INSURANCE_RATE
-            rates_cost = median_price * self.RATES_ESTIMATE
-
-            net_income = effective_rent - management_cost - maintenance_cost - insurance_cost - rates_cost
-            net_yield = (net_income / median_price) * 100
+        gross_yield, net_yield, price_to_rent = self._calculate_yields(
+            rental_stats["median"], sale_stats["median"]
+        )
 
-            # Price to rent ratio (years of rent to buy)
-            price_to_rent = median_price / annual_rent
+        # Confidence intervals on the (outlier-filtered) medians and yield
+        cis = bootstrap_yield_cis(
+            drop_outliers(rental_prices, self.OUTLIER_METHOD),
+            drop_outliers(sale_prices, self.OUTLIER_METHOD),
+            self.BOOTSTRAP_RESAMPLES,
+            self.CONFIDENCE,
+        )
 
         # Combine property type counts
         all_listings = rentals + sales
         property_types = self._count_property_types(all_listings)
         bedroom_dist = self._count_bedrooms(all_listings)
 
+        # Like-for-like yields per bedrooms x property type
+        segments = self._segment_yields(
+            listings_frame(all_listings),
+            self.MIN_SEGMENT_SAMPLES,
+        )
+        segment_yields = [
+            {key: (None if pd.isna(value) else value) for key, value in row.items() if key != "suburb"}
+            for row in segments.to_dict("records")
+        ]
+
         return SuburbMetrics(
             suburb=suburb,
             rental_count=len(rentals),
@@ -165,6 +306,96 @@ class SuburbAnalyzer:
             estimated_net_yield=net_yield,
             property_types=property_types,
             bedroom_distribution=bedroom_dist,
+            price_to_rent_ratio=price_to_rent,
+            rent_outliers=rental_stats["outliers"],
+            price_outliers=sale_stats["outliers"],
+            median_rent_ci=cis["median_rent_ci"],
+            median_price_ci=cis["median_price_ci"],
+            gross_yield_ci=cis["gross_yield_ci"],
+            segment_yields=segment_yields
+        )
+
+    def analyze_suburb_from_store(self, suburb: str, store: Optional[ListingStatsStore] = None) -> SuburbMetrics:
+        """
+        Analyze a suburb from the incremental stats store instead of raw files.
+
+        The store is updated at ingest time (see ``cli.py scrape``), so this
+        costs the same no matter how many listings have been collected. It
+        covers every listing ever ingested and applies no outlier filter, so
+        expect it to differ from analyze_suburb.
+
+        Args:
+            suburb: Suburb name
+            store: Preloaded store (defaults to the one in data_dir)
+
+        Returns:
+            SuburbMetrics built from the persisted accumulators
+        """
+        store = store or ListingStatsStore(self.data_dir)
+        return self._metrics_from_accumulators(
+            suburb,
+            store.combined(suburb, "rent"),
+            store.combined(suburb, "sale"),
+            store.bedroom_distribution(suburb),
+        )
+
+    def analyze_region(self, name: str, level: Optional[str] = None,
+                       rollups: Optional[RegionRollups] = None) -> Optional[SuburbMetrics]:
+        """
+        Metrics for a suburb, city or province from the precomputed rollups.
+
+        Args:
+            name: Region slug (e.g. "cape-town", "western-cape")
+            level: "suburb", "city" or "province" (found automatically if omitted)
+            rollups: Preloaded rollups (defaults to the ones in data_dir)
+
+        Returns:
+            SuburbMetrics with suburb set to the region name, or None if unknown
+        """
+        rollups = rollups or RegionRollups.load(self.data_dir)
+        level = level or rollups.find(name)
+        if level is None:
+            return None
+
+        return self._metrics_from_accumulators(
+            name,
+            rollups.get(level, name, "rent") or SegmentAccumulator(),
+            rollups.get(level, name, "sale") or SegmentAccumulator(),
+            rollups.bedroom_distribution(level, name),
+        )
+
+    def _metrics_from_accumulators(self, name: str, rentals: SegmentAccumulator,
+                                   sales: SegmentAccumulator, bedroom_dist: dict) -> SuburbMetrics:
+        """Build SuburbMetrics from incremental accumulators."""
+        rental_stats = rentals.prices.as_stats()
+        sale_stats = sales.prices.as_stats()
+
+        gross_yield, net_yield, price_to_rent = self._calculate_yields(
+            rental_stats["median"], sale_stats["median"]
+        )
+
+        property_types = dict(rentals.property_types)
+        for ptype, count in sales.property_types.items():
+            property_types[ptype] = property_types.get(ptype, 0) + count
+
+        return SuburbMetrics(
+            suburb=name,
+            rental_count=rentals.listings,
+            avg_rent=rental_stats["avg"],
+            median_rent=rental_stats["median"],
+            min_rent=rental_stats["min"],
+            max_rent=rental_stats["max"],
+            rent_std_dev=rental_stats["std"],
+            sales_count=sales.listings,
+            avg_price=sale_stats["avg"],
+            median_price=sale_stats["median"],
+            min_price=sale_stats["min"],
+            max_price=sale_stats["max"],
+            price_std_dev=sale_stats["std"],
+            gross_yield=gross_yield,
+            estimated_net_yield=net_yield,
+            property_types=property_types,
+            bedroom_distribution=bedroom_dist,
             price_to_rent_ratio=price_to_rent
         )
 
@@ -181,12 +412,18 @@ class SuburbAnalyzer:
             f"  Listings: {metrics.rental_count}",
         ]
 
+        ci_label = f"{self.CONFIDENCE*100:.0f}% CI"
+
         if metrics.median_rent:
             lines.extend([
                 f"  Median Rent: R {metrics.median_rent:,.0f} /month",
+                f"  {ci_label}: R {metrics.median_rent_ci[0]:,.0f} - R {metrics.median_rent_ci[1]:,.0f}"
+                if metrics.median_rent_ci else "",
                 f"  Range: R {metrics.min_rent:,.0f} - R {metrics.max_rent:,.0f}",
                 f"  Std Dev: R {metrics.rent_std_dev:,.0f}" if metrics.rent_std_dev else "",
             ])
+        if metrics.rent_outliers:
+            lines.append(f"  Outliers excluded: {metrics.rent_outliers}")
 
         lines.extend([
             "",
@@ -197,8 +434,12 @@ class SuburbAnalyzer:
         if metrics.median_price:
             lines.extend([
                 f"  Median Price: R {metrics.median_price:,.0f}",
+                f"  {ci_label}: R {metrics.median_price_ci[0]:,.0f} - R {metrics.median_price_ci[1]:,.0f}"
+                if metrics.median_price_ci else "",
                 f"  Range: R {metrics.min_price:,.0f} - R {metrics.max_price:,.0f}",
             ])
+        if metrics.price_outliers:
+            lines.append(f"  Outliers excluded: {metrics.price_outliers}")
 
         lines.extend([
             "",
@@ -207,7 +448,9 @@ class SuburbAnalyzer:
 
         if metrics.gross_yield:
             lines.extend([
-                f"  Gross Yield: {metrics.gross_yield:.2f}%",
+                f"  Gross Yield: {metrics.gross_yield:.2f}%"
+                + (f" ({ci_label} {metrics.gross_yield_ci[0]:.2f}% - {metrics.gross_yield_ci[1]:.2f}%)"
+                   if metrics.gross_yield_ci else ""),
                 f"  Est. Net Yield: {metrics.estimated_net_yield:.2f}%",
                 f"  Price-to-Rent Ratio: {metrics.price_to_rent_ratio:.1f} years",
             ])
@@ -268,7 +511,29 @@ INTERPRETATION:
 {"  < 3% net yield = Growth play, not cash flow" if metrics.estimated_net_yield and metrics.estimated_net_yield < 3 else ""}
 {"  Price-to-rent < 15 = Generally affordable" if metrics.price_to_rent_ratio and metrics.price_to_rent_ratio < 15 else ""}
 {"  Price-to-rent > 20 = Premium market" if metrics.price_to_rent_ratio and metrics.price_to_rent_ratio > 20 else ""}
-"""
+{self._segment_table(metrics)}"""
+
+    def _segment_table(self, metrics: SuburbMetrics) -> str:
+        """Like-for-like yields per bedrooms x property type for yield_breakdown."""
+        rows = [s for s in metrics.segment_yields if s["gross_yield"] is not None]
+        if not rows:
+            return (
+                f"SEGMENT YIELDS: not enough listings per bedrooms x type "
+                f"(need {self.MIN_SEGMENT_SAMPLES} rentals and sales per segment)\n"
+            )
+
+        lines = [
+            "SEGMENT YIELDS (like-for-like)",
+            f"  {'Beds':<8} {'Type':<12} {'Rent':<12} {'Price':<14} {'Gross %':<9} {'Net %':<9}",
+        ]
+        for s in rows:
+            lines.append(
+                f"  {s['bedrooms']:<8} {s['property_type']:<12} "
+                f"{'R ' + format(s['median_rent'], ',.0f'):<12} "
+                f"{'R ' + format(s['median_price'], ',.0f'):<14} "
+                f"{s['gross_yield']:<9.2f} {s['net_yield']:<9.2f}"
+            )
+        return "\n".join(lines) + "\n"
 
 
 async def main():
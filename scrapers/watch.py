@@ -0,0 +1,224 @@
+"""
+Watch Mode for The Winning Formula Newsletter
+Keeps one browser alive and re-scrapes suburb x listing type jobs on a
+persistent, jittered schedule. Suburbs whose listings barely change are
+checked less often so browser time goes where the market is moving.
+"""
+
+import asyncio
+import heapq
+import json
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from listing_stats import ListingStatsStore
+from listing_validator import ListingValidator
+from property24_scraper import Property24Scraper, save_listings
+from region_rollups import RegionRollups
+
+
+@dataclass
+class WatchJob:
+    """One suburb x listing type on the schedule."""
+    suburb: str
+    listing_type: str
+    city: str = "cape-town"
+    province: str = "western-cape"
+    interval_hours: float = 12.0
+    next_run: float = 0.0  # unix timestamp
+    churn: Optional[float] = None  # smoothed share of listings that changed per run
+    runs: int = 0
+    last_urls: list = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f"{self.suburb}:{self.listing_type}"
+
+    @property
+    def filename(self) -> str:
+        return f"{self.suburb}_{'rentals' if self.listing_type == 'rent' else 'sales'}.json"
+
+
+class WatchScheduler:
+    """
+    Persistent schedule of WatchJobs with churn-based intervals.
+
+    After each run the job's churn (Jaccard distance between this run's and
+    the previous run's listing URLs) is smoothed, and the interval is
+    stretched for quiet suburbs and shortened for busy ones.
+    """
+
+    STATE_FILE = "watch_state.json"
+
+    MIN_INTERVAL_HOURS = 2
+    MAX_INTERVAL_HOURS = 7 * 24
+    LOW_CHURN = 0.05  # fewer changes than this -> check less often
+    HIGH_CHURN = 0.20  # more changes than this -> check more often
+    INTERVAL_STEP = 1.5
+    CHURN_SMOOTHING = 0.5
+
+    def __init__(self, data_dir: str = "data", base_interval_hours: float = 12.0, jitter: float = 0.2):
+        self.data_dir = Path(data_dir)
+        self.path = self.data_dir / self.STATE_FILE
+        self.base_interval_hours = base_interval_hours
+        self.jitter = jitter
+        self.jobs: dict[str, WatchJob] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for row in json.load(f):
+                job = WatchJob(**row)
+                self.jobs[job.key] = job
+
+    def save(self):
+        self.data_dir.mkdir(exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump([asdict(job) for job in self.jobs.values()], f, indent=2)
+
+    def add(self, suburb: str, listing_type: str, city: str, province: str):
+        """Add a job (kept as-is if it is already scheduled)."""
+        job = WatchJob(suburb, listing_type, city, province, self.base_interval_hours)
+        if job.key not in self.jobs:
+            self.jobs[job.key] = job
+
+    def jittered_delay(self, hours: float) -> float:
+        """Seconds until the next run, +/- jitter so jobs don't bunch up."""
+        return hours * 3600 * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def retry(self, job: WatchJob, now: Optional[float] = None):
+        """Reschedule a failed or empty run on the job's current interval."""
+        job.next_run = (now or time.time()) + self.jittered_delay(job.interval_hours)
+
+    def record(self, job: WatchJob, urls: list[str], now: Optional[float] = None) -> Optional[float]:
+        """
+        Update a job after a run and schedule its next one.
+
+        The first run only sets the baseline URLs; churn is seeded from the
+        second run, so a quiet suburb can back off straight away. An empty
+        run is treated as a failure (see retry): churn and the baseline URLs
+        are left alone.
+
+        Returns:
+            Churn observed on this run (0-1), or None on the first or an empty run
+        """
+        if not urls:
+            self.retry(job, now)
+            return None
+        now = now or time.time()
+        previous, current = set(job.last_urls), set(urls)
+        union = previous | current
+        churn = None
+        if job.runs:
+            churn = len(previous ^ current) / len(union) if union else 0.0
+            if job.churn is None:
+                job.churn = churn
+            else:
+                job.churn = self.CHURN_SMOOTHING * churn + (1 - self.CHURN_SMOOTHING) * job.churn
+
+            if job.churn < self.LOW_CHURN:
+                job.interval_hours *= self.INTERVAL_STEP
+            elif job.churn > self.HIGH_CHURN:
+                job.interval_hours /= self.INTERVAL_STEP
+            job.interval_hours = min(max(job.interval_hours, self.MIN_INTERVAL_HOURS), self.MAX_INTERVAL_HOURS)
+
+        job.runs += 1
+        job.last_urls = sorted(current)
+        job.next_run = now + self.jittered_delay(job.interval_hours)
+        return churn
+
+    def queue(self) -> list[tuple[float, str]]:
+        """Heap of (next_run, job key)."""
+        heap = [(job.next_run, key) for key, job in self.jobs.items()]
+        heapq.heapify(heap)
+        return heap
+
+
+async def run_watch(
+    scheduler: WatchScheduler,
+    headless: bool = True,
+    max_pages: int = 3,
+    detailed: bool = False,
+    max_listings: int = 20,
+    once: bool = False,
+):
+    """
+    Run scheduled jobs with a single browser until interrupted.
+
+    Each finished job immediately validates and saves its listings, updates
+    the stats store and region rollups, and persists the schedule.
+
+    Args:
+        scheduler: Jobs to run
+        headless: Run the browser headless
+        max_pages: Search pages per job in fast mode
+        detailed: Visit every listing page (slower but gets prices)
+        max_listings: Listings per job in detailed mode
+        once: Run every job once and exit
+    """
+    heap = scheduler.queue()
+    if not heap:
+        print("No watch jobs scheduled.")
+        return
+
+    validator = ListingValidator(scheduler.data_dir)
+    async with Property24Scraper(headless=headless) as scraper:
+        while heap:
+            next_run, key = heapq.heappop(heap)
+            wait = next_run - time.time()
+            if wait > 0 and not once:
+                print(f"Next: {key} at {datetime.fromtimestamp(next_run):%Y-%m-%d %H:%M}")
+                await asyncio.sleep(wait)
+
+            job = scheduler.jobs[key]
+            print(f"\n[{datetime.now():%H:%M}] Scraping {job.suburb} ({job.listing_type})...")
+            try:
+                if detailed:
+                    listings = await scraper.scrape_suburb_detailed(
+                        suburb=job.suburb, city=job.city, province=job.province,
+                        listing_type=job.listing_type, max_listings=max_listings
+                    )
+                else:
+                    listings = await scraper.scrape_suburb(
+                        suburb=job.suburb, city=job.city, province=job.province,
+                        listing_type=job.listing_type, max_pages=max_pages
+                    )
+            except Exception as e:
+                print(f"Error scraping {key}: {e}")
+                listings = None
+
+            try:
+                valid = validator.screen(listings, job.filename[:-len(".json")]) if listings else []
+                if valid:
+                    save_listings(valid, job.filename, output_dir=scheduler.data_dir)
+                    store = ListingStatsStore(scheduler.data_dir)
+                    store.ingest(valid)
+                    store.save()
+                    RegionRollups.build(store).save()
+            except Exception as e:
+                # Keep the daemon alive; the listings are picked up again next run
+                print(f"Error saving {key}: {e}")
+                listings = None
+
+            if listings:
+                # Churn is measured on everything scraped, quarantined rows included
+                churn = scheduler.record(job, [listing.url for listing in listings])
+                churn_text = "first run" if churn is None else f"churn {churn:.0%}"
+                print(f"  {len(listings)} listings, {churn_text}, "
+                      f"next check in {job.interval_hours:.1f}h")
+            else:
+                # Failed and empty scrapes (often rate limiting or a block page)
+                # retry on the normal interval without touching churn or the baseline
+                if listings is not None:
+                    print(f"  No listings returned, retrying in {job.interval_hours:.1f}h")
+                scheduler.retry(job)
+            scheduler.save()
+
+            if not once:
+                heapq.heappush(heap, (job.next_run, key))
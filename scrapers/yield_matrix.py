@@ -0,0 +1,67 @@
+"""
+Segmented Yield Matrix for The Winning Formula Newsletter
+Groups listings by (suburb, bedrooms, property type) in a single vectorized
+pass so yields compare like with like instead of studios with 4-bed houses.
+"""
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from listing_stats import BEDROOM_BUCKETS
+
+
+LISTING_COLUMNS = ["suburb", "listing_type", "property_type", "bedrooms", "price"]
+SEGMENT_KEYS = ["suburb", "bedrooms", "property_type"]
+
+
+def listings_frame(listings: Iterable[dict]) -> pd.DataFrame:
+    """Build a DataFrame with just the columns segmenting needs."""
+    # Rows of just these columns, so a listing stream is never held as dicts
+    rows = (tuple(map(listing.get, LISTING_COLUMNS)) for listing in listings)
+    df = pd.DataFrame.from_records(rows, columns=LISTING_COLUMNS)
+    df["price"] = pd.to_numeric(df["price"], errors="coerce")
+    df["property_type"] = df["property_type"].fillna("Unknown")
+    df["bedrooms"] = bedroom_buckets(df["bedrooms"])
+    return df
+
+
+def bedroom_buckets(bedrooms: pd.Series) -> pd.Series:
+    """Vectorized version of listing_stats.bedroom_bucket."""
+    beds = pd.to_numeric(bedrooms, errors="coerce")
+    labels = np.select(
+        [beds.isna(), beds <= 0, beds >= 4],
+        ["unknown", "studio", "4+"],
+        default=beds.fillna(0).astype(int).astype(str),
+    )
+    return pd.Series(pd.Categorical(labels, categories=BEDROOM_BUCKETS), index=bedrooms.index)
+
+
+def segment_medians(df: pd.DataFrame, min_samples: int = 3) -> pd.DataFrame:
+    """
+    Median rent and price per (suburb, bedrooms, property_type) cell.
+
+    Args:
+        df: Frame from listings_frame (any number of suburbs)
+        min_samples: Cells with fewer priced listings get a NaN median
+
+    Returns:
+        DataFrame indexed by SEGMENT_KEYS with rentals, sales, median_rent
+        and median_price columns
+    """
+    priced = df[df["price"] > 0]
+    grouped = priced.groupby(SEGMENT_KEYS + ["listing_type"], sort=True, observed=True)["price"].agg(["median", "count"])
+    wide = grouped.unstack("listing_type").reindex(
+        columns=pd.MultiIndex.from_product([["median", "count"], ["rent", "sale"]])
+    )
+
+    cells = pd.DataFrame({
+        "rentals": wide[("count", "rent")].fillna(0).astype(int),
+        "sales": wide[("count", "sale")].fillna(0).astype(int),
+        "median_rent": wide[("median", "rent")],
+        "median_price": wide[("median", "sale")],
+    })
+    cells.loc[cells["rentals"] < min_samples, "median_rent"] = np.nan
+    cells.loc[cells["sales"] < min_samples, "median_price"] = np.nan
+    return cells
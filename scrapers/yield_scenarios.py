@@ -0,0 +1,150 @@
+"""
+Yield Scenario Engine for The Winning Formula Newsletter
+Monte Carlo version of the net yield calculation: samples expense rates,
+interest rates, rent and price, and reports the spread of outcomes for the
+"ROI scenario modeling" framework.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from suburb_analyzer import SuburbAnalyzer, SuburbMetrics
+
+
+PERCENTILES = [5, 25, 50, 75, 95]
+
+
+def monthly_bond_repayment(principal, annual_rate, years):
+    """Standard amortising bond instalment. Works on floats and NumPy arrays."""
+    r = np.asarray(annual_rate, dtype=float) / 12
+    n = np.asarray(years, dtype=float) * 12
+    safe_r = np.where(r > 0, r, 1)
+    payment = principal * safe_r / (1 - (1 + safe_r) ** -n)
+    return np.where(r > 0, payment, principal / n)
+
+
+def _spread(mode: float, low: float = 0.5, high: float = 2.0) -> tuple:
+    """(low, mode, high) triangle around a point estimate."""
+    return (mode * low, mode, mode * high)
+
+
+@dataclass
+class ScenarioAssumptions:
+    """
+    Triangular (low, mode, high) ranges for each uncertain input.
+
+    Rent and price are drawn lognormally around the suburb medians with
+    sigma rent_sigma / price_sigma.
+    """
+    vacancy_rate: tuple = _spread(SuburbAnalyzer.VACANCY_RATE, 0.4, 3.0)
+    management_fee: tuple = _spread(SuburbAnalyzer.MANAGEMENT_FEE, 0.75, 1.5)
+    maintenance_rate: tuple = _spread(SuburbAnalyzer.MAINTENANCE_RATE)
+    insurance_rate: tuple = _spread(SuburbAnalyzer.INSURANCE_RATE, 0.75, 1.5)
+    rates_estimate: tuple = _spread(SuburbAnalyzer.RATES_ESTIMATE, 0.6, 2.0)
+    interest_rate: tuple = (0.095, 0.11, 0.13)  # around SA prime
+    rent_sigma: float = 0.10
+    price_sigma: float = 0.08
+    deposit: float = 0.10
+    bond_years: int = 20
+
+
+@dataclass
+class ScenarioResult:
+    """Distribution summary for one suburb."""
+    suburb: str
+    scenarios: int
+    net_yield: dict = field(default_factory=dict)  # percentile -> %
+    gross_yield: dict = field(default_factory=dict)
+    cash_on_cash: dict = field(default_factory=dict)  # after bond repayments, on the deposit
+    prob_negative_cash_flow: float = 0.0
+    prob_net_yield_below_inflation: float = 0.0
+
+
+def simulate_yields(
+    metrics: SuburbMetrics,
+    scenarios: int = 1_000_000,
+    assumptions: Optional[ScenarioAssumptions] = None,
+    seed: Optional[int] = None,
+    inflation: float = 0.05,
+) -> Optional[ScenarioResult]:
+    """
+    Sample scenarios and summarise the yield distribution.
+
+    Args:
+        metrics: SuburbMetrics with median_rent and median_price
+        scenarios: Number of draws (1M runs well under a second)
+        assumptions: Input ranges (defaults to ScenarioAssumptions())
+        seed: RNG seed for reproducible output
+        inflation: Threshold for prob_net_yield_below_inflation
+
+    Returns:
+        ScenarioResult, or None if the suburb lacks rent or price data
+    """
+    if not metrics.median_rent or not metrics.median_price:
+        return None
+
+    a = assumptions or ScenarioAssumptions()
+    rng = np.random.default_rng(seed)
+    n = scenarios
+
+    monthly_rent = metrics.median_rent * rng.lognormal(0.0, a.rent_sigma, n)
+    price = metrics.median_price * rng.lognormal(0.0, a.price_sigma, n)
+    vacancy = rng.triangular(*a.vacancy_rate, n)
+    management = rng.triangular(*a.management_fee, n)
+    property_costs = (
+        rng.triangular(*a.maintenance_rate, n)
+        + rng.triangular(*a.insurance_rate, n)
+        + rng.triangular(*a.rates_estimate, n)
+    )
+    interest = rng.triangular(*a.interest_rate, n)
+
+    annual_rent = monthly_rent * 12
+    net_income = annual_rent * (1 - vacancy) * (1 - management) - price * property_costs
+    net_yield = net_income / price * 100
+    gross_yield = annual_rent / price * 100
+
+    bond = monthly_bond_repayment(price * (1 - a.deposit), interest, a.bond_years) * 12
+    cash_flow = net_income - bond
+    cash_on_cash = cash_flow / (price * a.deposit) * 100
+
+    def pct(values):
+        return dict(zip(PERCENTILES, np.percentile(values, PERCENTILES).tolist()))
+
+    return ScenarioResult(
+        suburb=metrics.suburb,
+        scenarios=n,
+        net_yield=pct(net_yield),
+        gross_yield=pct(gross_yield),
+        cash_on_cash=pct(cash_on_cash),
+        prob_negative_cash_flow=float((cash_flow < 0).mean()),
+        prob_net_yield_below_inflation=float((net_yield < inflation * 100).mean()),
+    )
+
+
+def format_scenarios(result: ScenarioResult, assumptions: Optional[ScenarioAssumptions] = None) -> str:
+    """Percentile table for the CLI / newsletter."""
+    a = assumptions or ScenarioAssumptions()
+    header = "  " + f"{'':<16}" + "".join(f"{'P' + str(p):>10}" for p in PERCENTILES)
+    rows = [
+        ("Gross yield %", result.gross_yield),
+        ("Net yield %", result.net_yield),
+        ("Cash-on-cash %", result.cash_on_cash),
+    ]
+
+    lines = [
+        f"SCENARIOS: {result.suburb.title()} ({result.scenarios:,} draws)",
+        "=" * 50,
+        header,
+    ]
+    for label, values in rows:
+        lines.append("  " + f"{label:<16}" + "".join(f"{values[p]:>10.2f}" for p in PERCENTILES))
+
+    lines.extend([
+        "",
+        f"  Chance of negative cash flow ({a.deposit*100:.0f}% deposit, {a.bond_years}yr bond): "
+        f"{result.prob_negative_cash_flow*100:.0f}%",
+        f"  Chance net yield is below inflation: {result.prob_net_yield_below_inflation*100:.0f}%",
+    ])
+    return "\n".join(lines)